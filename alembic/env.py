@@ -1,5 +1,4 @@
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
 import os
@@ -12,16 +11,9 @@ load_dotenv()
 # 프로젝트 루트 경로를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-# DB URL 구성
-def get_url():
-    user = os.getenv("DB_USERNAME")
-    password = os.getenv("DB_PASSWORD")
-    host = os.getenv("DB_HOST")
-    db_name = os.getenv("DB_DATABASE")
-    port = os.getenv("DB_PORT", "3306")  # 기본 포트
-    return f"mysql+pymysql://{user}:{password}@{host}:{port}/{db_name}"
-
+from app.core.config import settings
 from app.db.base import Base
+from app.db.engine import create_db_engine
 
 # 모든 모델 파일 임포트 (모델들을 메모리에 로드하고 Base.metadata를 기준으로 자동 생성)
 from app.models import privacy, user, verify, file, comment
@@ -32,12 +24,8 @@ target_metadata = Base.metadata
 # alembic.ini에 있는 설정 정보를 읽어옴
 config = context.config 
 
-# CLI 인자에서 db_url 받아오기
-cli_db_url = context.get_x_argument(as_dictionary=True).get("db_url")
-if cli_db_url:
-    config.set_main_option("sqlalchemy.url", cli_db_url)
-else:
-    config.set_main_option("sqlalchemy.url", get_url())
+# CLI 인자에서 db_url 받아오기 (없으면 앱과 같은 Settings의 DB 설정 사용)
+db_url = context.get_x_argument(as_dictionary=True).get("db_url") or settings.DATABASE_URL
 
 
 # 로그 설정을 초기화 (fileConfig는 Python의 기본 로깅 설정)
@@ -57,9 +45,8 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url,
+        url=db_url,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
@@ -76,11 +63,8 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    # 앱과 같은 엔진 팩토리 사용 (마이그레이션은 한 번만 연결하므로 풀 없이)
+    connectable = create_db_engine(db_url, name="alembic", poolclass=pool.NullPool)
 
     with connectable.connect() as connection:
         context.configure(
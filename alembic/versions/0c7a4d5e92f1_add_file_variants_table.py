@@ -0,0 +1,45 @@
+"""add file variants table
+
+Revision ID: 0c7a4d5e92f1
+Revises: b84e2f6d0c13
+Create Date: 2026-10-17 02:34:52.107448
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c7a4d5e92f1'
+down_revision: Union[str, None] = 'b84e2f6d0c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('file_variants',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('file_id', sa.Integer(), nullable=False),
+    sa.Column('s3_key', sa.String(length=255), nullable=False),
+    sa.Column('content_type', sa.String(length=100), nullable=False),
+    sa.Column('format', sa.String(length=10), nullable=False),
+    sa.Column('width', sa.Integer(), nullable=False),
+    sa.Column('height', sa.Integer(), nullable=False),
+    sa.Column('file_size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['file_id'], ['files.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('file_id', 'format', 'width', name='uq_file_variants_file_format_width')
+    )
+    op.create_index(op.f('ix_file_variants_id'), 'file_variants', ['id'], unique=False)
+    op.create_index(op.f('ix_file_variants_file_id'), 'file_variants', ['file_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_file_variants_file_id'), table_name='file_variants')
+    op.drop_index(op.f('ix_file_variants_id'), table_name='file_variants')
+    op.drop_table('file_variants')
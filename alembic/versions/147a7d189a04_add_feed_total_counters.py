@@ -0,0 +1,43 @@
+"""add feed total counters
+
+Revision ID: 147a7d189a04
+Revises: 81c92b4d2a1f
+Create Date: 2026-10-17 01:57:03.926084
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '147a7d189a04'
+down_revision: Union[str, None] = '81c92b4d2a1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('counters',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.add_column('users', sa.Column('feeds_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 데이터 기준으로 카운터 채우기
+    op.execute("INSERT INTO counters (name, value) SELECT 'feeds_total', COUNT(*) FROM feeds")
+    op.execute(
+        "UPDATE users SET feeds_count = "
+        "(SELECT COUNT(*) FROM feeds WHERE feeds.user_id = users.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'feeds_count')
+    op.drop_table('counters')
@@ -0,0 +1,28 @@
+"""add s3_key_hls to files
+
+Revision ID: 3a9d6b1f4c08
+Revises: e61f93a07b54
+Create Date: 2026-10-17 02:58:36.904127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9d6b1f4c08'
+down_revision: Union[str, None] = 'e61f93a07b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('files', sa.Column('s3_key_hls', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('files', 's3_key_hls')
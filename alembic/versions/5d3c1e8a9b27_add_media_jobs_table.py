@@ -0,0 +1,47 @@
+"""add media jobs table
+
+Revision ID: 5d3c1e8a9b27
+Revises: 147a7d189a04
+Create Date: 2026-10-17 02:10:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d3c1e8a9b27'
+down_revision: Union[str, None] = '147a7d189a04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('files', sa.Column('processing_status', sa.String(length=20), nullable=False, server_default='done'))
+    op.create_table('media_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('file_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+    sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['file_id'], ['files.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_media_jobs_id'), 'media_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_media_jobs_file_id'), 'media_jobs', ['file_id'], unique=False)
+    op.create_index('ix_media_jobs_status_id', 'media_jobs', ['status', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_media_jobs_status_id', table_name='media_jobs')
+    op.drop_index(op.f('ix_media_jobs_file_id'), table_name='media_jobs')
+    op.drop_index(op.f('ix_media_jobs_id'), table_name='media_jobs')
+    op.drop_table('media_jobs')
+    op.drop_column('files', 'processing_status')
@@ -0,0 +1,28 @@
+"""add files feed_id created_at index
+
+Revision ID: 6e1f3b7c2a94
+Revises: d47a2c9e8b15
+Create Date: 2026-10-17 04:21:37.912845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e1f3b7c2a94'
+down_revision: Union[str, None] = 'd47a2c9e8b15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_files_feed_id_created_at', 'files', ['feed_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_files_feed_id_created_at', table_name='files')
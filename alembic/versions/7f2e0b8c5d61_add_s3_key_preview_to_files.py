@@ -0,0 +1,28 @@
+"""add s3_key_preview to files
+
+Revision ID: 7f2e0b8c5d61
+Revises: 3a9d6b1f4c08
+Create Date: 2026-10-17 03:06:12.481539
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f2e0b8c5d61'
+down_revision: Union[str, None] = '3a9d6b1f4c08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('files', sa.Column('s3_key_preview', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('files', 's3_key_preview')
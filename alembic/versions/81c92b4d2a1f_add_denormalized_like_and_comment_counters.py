@@ -0,0 +1,46 @@
+"""add denormalized like and comment counters
+
+Revision ID: 81c92b4d2a1f
+Revises: f0911f83b9be
+Create Date: 2026-10-17 01:55:02.419219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '81c92b4d2a1f'
+down_revision: Union[str, None] = 'f0911f83b9be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('feeds', sa.Column('likes_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('feeds', sa.Column('comments_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('comments', sa.Column('likes_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 데이터 기준으로 카운터 채우기
+    op.execute(
+        "UPDATE feeds SET likes_count = "
+        "(SELECT COUNT(*) FROM feed_likes WHERE feed_likes.feed_id = feeds.id)"
+    )
+    op.execute(
+        "UPDATE feeds SET comments_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.feed_id = feeds.id)"
+    )
+    op.execute(
+        "UPDATE comments SET likes_count = "
+        "(SELECT COUNT(*) FROM comment_likes WHERE comment_likes.comment_id = comments.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('comments', 'likes_count')
+    op.drop_column('feeds', 'comments_count')
+    op.drop_column('feeds', 'likes_count')
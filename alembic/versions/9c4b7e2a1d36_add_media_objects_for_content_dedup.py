@@ -0,0 +1,45 @@
+"""add media objects for content dedup
+
+Revision ID: 9c4b7e2a1d36
+Revises: 7f2e0b8c5d61
+Create Date: 2026-10-17 03:18:44.027135
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4b7e2a1d36'
+down_revision: Union[str, None] = '7f2e0b8c5d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('media_objects',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('s3_key', sa.String(length=255), nullable=False),
+    sa.Column('ref_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('content_hash')
+    )
+    op.create_index(op.f('ix_media_objects_id'), 'media_objects', ['id'], unique=False)
+    op.add_column('files', sa.Column('media_object_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_files_media_object_id'), 'files', ['media_object_id'], unique=False)
+    op.create_foreign_key('files_media_object_id_fkey', 'files', 'media_objects', ['media_object_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('files_media_object_id_fkey', 'files', type_='foreignkey')
+    op.drop_index(op.f('ix_files_media_object_id'), table_name='files')
+    op.drop_column('files', 'media_object_id')
+    op.drop_index(op.f('ix_media_objects_id'), table_name='media_objects')
+    op.drop_table('media_objects')
@@ -0,0 +1,28 @@
+"""add files s3_key index
+
+Revision ID: b2d8e4f1a7c3
+Revises: 6e1f3b7c2a94
+Create Date: 2026-10-17 09:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d8e4f1a7c3'
+down_revision: Union[str, None] = '6e1f3b7c2a94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_files_s3_key'), 'files', ['s3_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_files_s3_key'), table_name='files')
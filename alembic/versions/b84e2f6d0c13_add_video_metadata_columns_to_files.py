@@ -0,0 +1,32 @@
+"""add video metadata columns to files
+
+Revision ID: b84e2f6d0c13
+Revises: 5d3c1e8a9b27
+Create Date: 2026-10-17 02:21:09.332871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b84e2f6d0c13'
+down_revision: Union[str, None] = '5d3c1e8a9b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('files', sa.Column('duration', sa.Float(), nullable=True))
+    op.add_column('files', sa.Column('video_codec', sa.String(length=50), nullable=True))
+    op.add_column('files', sa.Column('bitrate', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('files', 'bitrate')
+    op.drop_column('files', 'video_codec')
+    op.drop_column('files', 'duration')
@@ -0,0 +1,41 @@
+"""add storage deletions outbox
+
+Revision ID: d47a2c9e8b15
+Revises: 9c4b7e2a1d36
+Create Date: 2026-10-17 03:52:10.604319
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd47a2c9e8b15'
+down_revision: Union[str, None] = '9c4b7e2a1d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('storage_deletions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('s3_key', sa.String(length=255), nullable=False),
+    sa.Column('is_prefix', sa.Boolean(), nullable=False, server_default='0'),
+    sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_storage_deletions_id'), 'storage_deletions', ['id'], unique=False)
+    op.create_index('ix_storage_deletions_next_attempt_at_id', 'storage_deletions', ['next_attempt_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_storage_deletions_next_attempt_at_id', table_name='storage_deletions')
+    op.drop_index(op.f('ix_storage_deletions_id'), table_name='storage_deletions')
+    op.drop_table('storage_deletions')
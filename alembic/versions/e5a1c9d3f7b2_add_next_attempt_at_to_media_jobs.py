@@ -0,0 +1,28 @@
+"""add next_attempt_at to media jobs
+
+Revision ID: e5a1c9d3f7b2
+Revises: b2d8e4f1a7c3
+Create Date: 2026-10-17 09:48:05.662190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c9d3f7b2'
+down_revision: Union[str, None] = 'b2d8e4f1a7c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('media_jobs', sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('media_jobs', 'next_attempt_at')
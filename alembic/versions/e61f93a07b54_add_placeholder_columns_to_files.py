@@ -0,0 +1,30 @@
+"""add placeholder columns to files
+
+Revision ID: e61f93a07b54
+Revises: 0c7a4d5e92f1
+Create Date: 2026-10-17 02:45:17.660214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e61f93a07b54'
+down_revision: Union[str, None] = '0c7a4d5e92f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('files', sa.Column('blurhash', sa.String(length=64), nullable=True))
+    op.add_column('files', sa.Column('dominant_color', sa.String(length=7), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('files', 'dominant_color')
+    op.drop_column('files', 'blurhash')
@@ -0,0 +1,28 @@
+"""add feeds created_at id index
+
+Revision ID: f0911f83b9be
+Revises: 1f7e020ffd0a
+Create Date: 2026-10-17 01:51:46.836594
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0911f83b9be'
+down_revision: Union[str, None] = '1f7e020ffd0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_feeds_created_at_id', 'feeds', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_feeds_created_at_id', table_name='feeds')
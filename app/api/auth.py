@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session, joinedload
+from starlette.concurrency import run_in_threadpool
 from app.db.base import get_db
 from app.schemas.auth import (
     EmailVerificationRequest, EmailVerificationResponse,
@@ -15,8 +16,8 @@ from app.schemas.auth import (
 from app.services.auth import (
     generate_verification_code, send_verification_email, 
     create_user, verify_code, check_email_exists, 
-    check_username_exists, create_access_token, verify_password,
-    reset_password
+    check_username_exists, create_access_token, hash_password_async,
+    verify_password_async, check_password_reset, reset_password
 )
 from app.models.verify import Verify
 from app.models.user import User
@@ -40,7 +41,7 @@ async def check_email(request: EmailCheckRequest, db: Session = Depends(get_db))
     """
     try:
         logger.info(f"이메일 중복 체크 요청: {request.email}")
-        exists = check_email_exists(db, request.email)
+        exists = await run_in_threadpool(check_email_exists, db, request.email)
         
         return EmailCheckResponse(
             exists=exists,
@@ -57,7 +58,7 @@ async def check_username(request: UsernameCheckRequest, db: Session = Depends(ge
     """
     try:
         logger.info(f"사용자명 중복 체크 요청: {request.username}")
-        exists = check_username_exists(db, request.username)
+        exists = await run_in_threadpool(check_username_exists, db, request.username)
         
         return UsernameCheckResponse(
             exists=exists,
@@ -75,7 +76,8 @@ async def send_verification(request: EmailVerificationRequest, db: Session = Dep
     try:
         logger.info(f"이메일 인증 코드 전송 요청: {request.email}")
         verification_code = generate_verification_code()
-        success = send_verification_email(request.email, verification_code, db)
+        # 인증번호 DB 저장은 스레드 풀에서 실행 (메일은 전송 큐에 넣고 바로 반환)
+        success = await run_in_threadpool(send_verification_email, request.email, verification_code, db)
         
         if not success:
             raise HTTPException(status_code=500, detail="이메일 전송에 실패했습니다.")
@@ -87,42 +89,45 @@ async def send_verification(request: EmailVerificationRequest, db: Session = Dep
         logger.error(f"이메일 인증 코드 전송 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=f"이메일 인증 코드 전송 중 오류가 발생했습니다: {str(e)}")
 
+def _check_verification_code(db: Session, email: str, code: str) -> VerifyCodeResponse:
+    """최신 인증 코드와 비교하고 일치하면 인증 완료로 표시합니다. (블로킹 DB 작업, 스레드 풀에서 실행)"""
+    # 해당 이메일의 최신 인증 정보 조회
+    verify = db.query(Verify).filter(
+        Verify.email == email
+    ).order_by(desc(Verify.created_at)).first()
+    
+    logger.info(f"조회된 인증 정보: {verify}")
+    
+    if not verify:
+        logger.warning(f"인증 정보 없음: {email}")
+        return VerifyCodeResponse(
+            is_verified=False,
+            message="인증 정보를 찾을 수 없습니다."
+        )
+    
+    # 인증 코드 비교
+    if verify.code != code:
+        logger.warning(f"인증 코드 불일치: {email}, 입력: {code}, 저장: {verify.code}")
+        return VerifyCodeResponse(
+            is_verified=False,
+            message="인증번호가 일치하지 않습니다."
+        )
+    
+    # 인증 성공 시 상태 업데이트
+    verify.is_verified = True
+    db.commit()
+    
+    logger.info(f"인증 성공: {email}")
+    return VerifyCodeResponse(
+        is_verified=True,
+        message="인증이 완료되었습니다."
+    )
+
 @router.post("/verify-code", response_model=VerifyCodeResponse)
 async def verify_code(request: VerifyCodeRequest, db: Session = Depends(get_db)):
     try:
         logger.info(f"인증 코드 확인 요청: {request.email}, {request.code}")
-        
-        # 해당 이메일의 최신 인증 정보 조회
-        verify = db.query(Verify).filter(
-            Verify.email == request.email
-        ).order_by(desc(Verify.created_at)).first()
-        
-        logger.info(f"조회된 인증 정보: {verify}")
-        
-        if not verify:
-            logger.warning(f"인증 정보 없음: {request.email}")
-            return VerifyCodeResponse(
-                is_verified=False,
-                message="인증 정보를 찾을 수 없습니다."
-            )
-        
-        # 인증 코드 비교
-        if verify.code != request.code:
-            logger.warning(f"인증 코드 불일치: {request.email}, 입력: {request.code}, 저장: {verify.code}")
-            return VerifyCodeResponse(
-                is_verified=False,
-                message="인증번호가 일치하지 않습니다."
-            )
-        
-        # 인증 성공 시 상태 업데이트
-        verify.is_verified = True
-        db.commit()
-        
-        logger.info(f"인증 성공: {request.email}")
-        return VerifyCodeResponse(
-            is_verified=True,
-            message="인증이 완료되었습니다."
-        )
+        return await run_in_threadpool(_check_verification_code, db, request.email, request.code)
     except Exception as e:
         logger.error(f"인증 코드 확인 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=f"인증 코드 확인 중 오류가 발생했습니다: {str(e)}")
@@ -132,12 +137,14 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
     try:
         logger.info(f"회원가입 요청: {request.email}, {request.username}")
         
-        # 사용자 생성
-        user = create_user(
+        # 비밀번호 해시화 (bcrypt 전용 스레드 풀) 후 사용자 생성 (DB 작업은 스레드 풀)
+        hashed_password = await hash_password_async(request.password)
+        user = await run_in_threadpool(
+            create_user,
             db=db,
             email=request.email,
             username=request.username,
-            password=request.password,
+            hashed_password=hashed_password,
             terms_of_service=request.terms_of_service,
             privacy_policy=request.privacy_policy
         )
@@ -171,12 +178,15 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
         
         if is_email:
             logger.info(f"로그인 시도 (이메일): {identifier}")
-            user = db.query(User).options(joinedload(User.profile_file)).filter(User.email == identifier).first()
+            condition = User.email == identifier
         else:
             logger.info(f"로그인 시도 (사용자명): {identifier}")
-            user = db.query(User).options(joinedload(User.profile_file)).filter(User.username == identifier).first()
+            condition = User.username == identifier
+        user = await run_in_threadpool(
+            lambda: db.query(User).options(joinedload(User.profile_file)).filter(condition).first()
+        )
         
-        if not user or not verify_password(request.password, user.password):
+        if not user or not await verify_password_async(request.password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="로그인 정보가 올바르지 않습니다.",
@@ -225,11 +235,15 @@ async def reset_password_endpoint(
     print(request)
     try:
         logger.info(f"비밀번호 변경 요청: {request.email}")
-        success = reset_password(
+        # 잘못된 인증 코드로 bcrypt 스레드 풀을 점유하지 않도록 해시화 전에 확인
+        await run_in_threadpool(check_password_reset, db, request.email, request.code)
+        hashed_password = await hash_password_async(request.new_password)
+        success = await run_in_threadpool(
+            reset_password,
             db=db,
             email=request.email,
             code=request.code,
-            new_password=request.new_password
+            hashed_password=hashed_password
         )
         if success:
             return PasswordResetResponse(message="비밀번호가 성공적으로 변경되었습니다.")
@@ -12,6 +12,8 @@ from app.services.auth import get_current_user_id
 from app.schemas.user import User
 from app.models.comment import Comment
 from app.models.comment_like import CommentLike
+from app.services.counters import adjust_feed_comments_count, adjust_comment_likes_count
+from app.services.feed_cache import invalidate_feed
 router = APIRouter()
 
 @router.delete("/{comment_id}", status_code=200, summary="댓글 삭제")
@@ -43,9 +45,11 @@ def delete_comment(
             detail="댓글 삭제 권한이 없습니다."
         )
     
-    # 댓글 삭제
+    # 댓글 삭제 (피드 댓글 수 카운터도 같은 트랜잭션에서 감소)
     db.delete(db_comment)
+    adjust_feed_comments_count(db, db_comment.feed_id, -1)
     db.commit()
+    invalidate_feed(db_comment.feed_id)
     
     return {"message": "댓글이 삭제되었습니다."}
 
@@ -78,9 +82,11 @@ def like_comment(
     if existing_like:
         raise HTTPException(status_code=400, detail="이미 좋아요한 댓글입니다.")
 
-    # 좋아요 추가
+    # 좋아요 추가 (댓글 좋아요 수 카운터도 같은 트랜잭션에서 증가)
     new_like = CommentLike(comment_id=comment_id, user_id=current_user_id)
     db.add(new_like)
+    db.flush()
+    adjust_comment_likes_count(db, comment_id, 1)
     db.commit()
 
     return {"message": "댓글에 좋아요를 등록했습니다."}
@@ -97,15 +103,17 @@ def unlike_comment(
     댓글에 좋아요를 취소합니다.
     """
 
-    existing_like = db.query(CommentLike).filter(
+    # 실제로 삭제된 경우에만 댓글 좋아요 수 카운터 감소
+    deleted = db.query(CommentLike).filter(
         CommentLike.comment_id == comment_id,
         CommentLike.user_id == current_user_id
-    ).first()
+    ).delete(synchronize_session=False)
 
-    if not existing_like:
+    if not deleted:
+        db.rollback()
         raise HTTPException(status_code=404, detail="좋아요 기록이 없습니다.")
 
-    db.delete(existing_like)
+    adjust_comment_likes_count(db, comment_id, -1)
     db.commit()
 
     return {"message": "댓글 좋아요를 취소했습니다."}
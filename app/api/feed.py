@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload, aliased
 from sqlalchemy import exists, select, case, desc
 from sqlalchemy.sql import func
 from typing import List, Optional
 from datetime import datetime
+import json
 import logging
 
-from app.db.base import get_db
+from app.db.base import get_async_db, get_db
 from app.models.feed import Feed
 from app.models.file import File as FileModel
 from app.models.user import User
@@ -33,7 +36,24 @@ from app.schemas.comment import (
     CommentResponseWithLike,
     CommentListResponseWithLike
 )
-from app.services.s3 import delete_file_from_s3
+from app.services.media_objects import release_file_storage
+from app.services.storage_deletions import enqueue_storage_deletions, wake_storage_deletion_drainer
+from app.services.pagination import MAX_PAGE_LIMIT, apply_keyset_page, encode_cursor
+from app.services.counters import (
+    adjust_feed_likes_count,
+    adjust_feed_comments_count,
+    adjust_feeds_total,
+    adjust_user_feeds_count
+)
+from app.services.totals import CountMode, get_total_feeds_async, invalidate_feed_counts
+from app.services.cache import response_cache
+from app.services.feed_cache import (
+    feed_page_cache_key,
+    feed_page_tags,
+    invalidate_on_feed_created,
+    invalidate_on_feed_deleted,
+    invalidate_feed
+)
 from app.core.config import settings
 
 # 로깅 설정
@@ -49,130 +69,131 @@ def get_feeds_for_sitemap(db: Session = Depends(get_db)):
     feeds = db.query(Feed.id, Feed.user_id, Feed.updated_at).all()
     return [{"id": feed.id, "user_id": feed.user_id, "updated_at": feed.updated_at} for feed in feeds]
 
+async def _fetch_feed_page(db: AsyncSession, query, cursor: Optional[str], offset: int, limit: int):
+    """
+    피드 목록 쿼리(select)에 커서/offset 페이지 조건을 적용하여 limit + 1개의 행을 조회합니다.
+    잘못된 커서인 경우 400 오류를 반환합니다.
+    """
+    try:
+        page_query = apply_keyset_page(query, Feed.created_at, Feed.id, cursor, offset, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # 컬렉션을 joinedload하면 피드 행이 파일 수만큼 중복되므로 unique()로 합침
+    return (await db.execute(page_query)).unique().scalars().all()
+
+async def _build_feed_page(db: AsyncSession, cursor: Optional[str], offset: int, limit: int, count_mode: CountMode):
+    """
+    사용자와 무관한 피드 목록 페이지를 만들어 직렬화된 bytes와 캐시 태그를 반환합니다.
+    is_liked는 모두 False이며, 로그인 사용자의 좋아요 여부는 get_all_feeds에서 덧씌웁니다.
+    """
+    # 전체 피드 수 (캐시된 카운터 값 또는 정확한 COUNT)
+    total_feeds = await get_total_feeds_async(db, count_mode)
+
+    query = (
+        select(Feed)
+        .options(joinedload(Feed.user).joinedload(User.profile_file), joinedload(Feed.files))
+    )
+    page_feeds = await _fetch_feed_page(db, query, cursor, offset, limit)
+
+    response_feeds = []
+    for feed in page_feeds[:limit]:
+        files = [FileSchema.model_validate(f) for f in feed.files]
+        
+        # 프로필 이미지 URL 생성
+        profile_image_url = None
+        if feed.user.profile_file:
+            profile_image_url = settings.get_profile_image_url(feed.user.profile_file.s3_key)
+        
+        user = UserSchemaForFeed(
+            id=feed.user.id,
+            username=feed.user.username,
+            created_at=feed.user.created_at,
+            updated_at=feed.user.updated_at,
+            profile_image_url=profile_image_url
+        )
+        
+        response_feeds.append(FeedResponseWithLike(
+            id=feed.id,
+            description=feed.description,
+            frame_ratio=feed.frame_ratio,
+            created_at=feed.created_at,
+            updated_at=feed.updated_at,
+            files=files,
+            user=user,
+            likes_count=feed.likes_count,
+            comments_count=feed.comments_count,
+            is_liked=False
+        ))
+
+    # limit + 1개를 조회했으므로 초과분이 있으면 다음 페이지가 존재함
+    next_cursor = None
+    if len(page_feeds) > limit:
+        last_feed = page_feeds[limit - 1]
+        next_cursor = encode_cursor(last_feed.created_at, last_feed.id)
+
+    response = FeedListResponseWithLike(feeds=response_feeds, total=total_feeds, next_cursor=next_cursor)
+    tags = feed_page_tags(
+        cursor,
+        [feed.id for feed in page_feeds[:limit]],
+        [feed.user_id for feed in page_feeds[:limit]]
+    )
+    return response.model_dump_json().encode("utf-8"), tags
+
 @router.get("/", response_model=FeedListResponseWithLike)
-def get_all_feeds(
-    offset: int = 0,
-    limit: int = 20,
-    db: Session = Depends(get_db),
+async def get_all_feeds(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    count_mode: CountMode = "approximate",
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: Optional[int] = Depends(get_optional_current_user_id)
 ):
     """
     모든 피드를 파일 포함하여 가져오는 API.
     사용자 인증 시 좋아요 정보 포함, 각 피드별 전체 좋아요 수 포함.
+
+    - cursor가 주어지면 (created_at, id) 기준 keyset 페이지네이션으로 조회합니다 (offset 무시).
+    - cursor가 없으면 기존 offset/limit 방식으로 조회합니다.
+    - 다음 페이지가 있으면 응답의 next_cursor로 다음 요청에 사용할 커서를 반환합니다.
+    - total은 count_mode가 approximate(기본)면 유지 중인 카운터 값(TTL 캐시 적용), exact면 매번 계산한 COUNT(*) 값입니다.
+    - 페이지 본문은 사용자와 무관하게 한 번 만들어 캐시하고(exact 모드는 캐시하지 않음), 로그인 사용자에게는
+      해당 페이지 피드들의 좋아요 여부만 한 번의 IN 쿼리로 조회하여 덧씌웁니다.
     """
     print(f"current_user_id: {current_user_id}")
 
-    response_feeds = []
-
-    # 전체 피드 수 계산
-    total_feeds = db.query(Feed).count()
-
-    # 각 피드의 전체 좋아요 수를 계산하는 서브쿼리
-    # 이 서브쿼리는 외부 쿼리의 Feed.id를 참조하므로 상관 서브쿼리(correlated subquery)입니다.
-    likes_count_subquery = (
-        select(func.count(FeedLike.feed_id))
-        .where(FeedLike.feed_id == Feed.id)
-        .correlate(Feed) # Feed 모델과 명시적으로 연결
-        .as_scalar() # 스칼라 값으로 반환하도록 설정
-        .label("likes_count")
-    )
-
-    if current_user_id is not None:
-        print(f"current_user_id is not None: {current_user_id}")
-        Like = aliased(FeedLike)
-        query = (
-            db.query(Feed)
-            .outerjoin(
-                Like,
-                (Feed.id == Like.feed_id) & (Like.user_id == current_user_id)
-            )
-            .add_columns(
-                Like.feed_id.isnot(None).label("is_liked"),
-                likes_count_subquery # 전체 좋아요 수 서브쿼리 추가
+    # 사용자와 무관한 페이지 본문 (직렬화된 bytes) 캐시 확인
+    # exact 모드는 total이 요청 시점의 값이어야 하므로 캐시를 거치지 않음
+    if count_mode == "exact":
+        body, _ = await _build_feed_page(db, cursor, offset, limit, count_mode)
+    else:
+        cache_key = feed_page_cache_key(cursor, offset, limit, count_mode)
+        body = response_cache.get(cache_key)
+        if body is None:
+            body, tags = await _build_feed_page(db, cursor, offset, limit, count_mode)
+            response_cache.set(cache_key, body, tags=tags)
+
+    # 사용자가 로그인하지 않은 경우 캐시된 본문을 그대로 반환
+    if current_user_id is None:
+        return Response(content=body, media_type="application/json")
+
+    # 로그인 사용자: 페이지 피드 ID에 대한 좋아요 여부만 조회하여 덧씌움
+    page = json.loads(body)
+    feed_ids = [feed["id"] for feed in page["feeds"]]
+    liked_feed_ids = set()
+    if feed_ids:
+        liked_rows = await db.execute(
+            select(FeedLike.feed_id)
+            .where(
+                FeedLike.user_id == current_user_id,
+                FeedLike.feed_id.in_(feed_ids)
             )
-            .options(joinedload(Feed.user).joinedload(User.profile_file), joinedload(Feed.files))
-            .order_by(Feed.created_at.desc())
-            .offset(offset)
-            .limit(limit)
         )
+        liked_feed_ids = {row.feed_id for row in liked_rows}
 
-        # 결과 처리: feed, is_liked, likes_count 순서로 튜플 반환
-        for feed, is_liked_val, likes_count_val in query.all():
-            files = [FileSchema.model_validate(f) for f in feed.files]
-            
-            # 프로필 이미지 URL 생성
-            profile_image_url = None
-            if feed.user.profile_file:
-                profile_image_url = settings.get_profile_image_url(feed.user.profile_file.s3_key)
-            
-            user = UserSchemaForFeed(
-                id=feed.user.id,
-                username=feed.user.username,
-                email=feed.user.email,
-                bio=feed.user.bio,
-                created_at=feed.user.created_at,
-                updated_at=feed.user.updated_at,
-                terms_of_service=feed.user.terms_of_service,
-                privacy_policy=feed.user.privacy_policy,
-                profile_image_url=profile_image_url
-            )
-            
-            dump = FeedResponse(
-                id=feed.id,
-                description=feed.description,
-                frame_ratio=feed.frame_ratio,
-                created_at=feed.created_at,
-                updated_at=feed.updated_at,
-                files=files,
-                user=user,
-                likes_count=likes_count_val if likes_count_val is not None else 0 # likes_count_val 매핑
-            ).model_dump()
-            response_feeds.append(FeedResponseWithLike(**dump, is_liked=bool(is_liked_val)))
+    for feed in page["feeds"]:
+        feed["is_liked"] = feed["id"] in liked_feed_ids
 
-    else:
-        # 사용자가 로그인하지 않은 경우
-        query = (
-            db.query(Feed)
-            .add_columns(likes_count_subquery) # 전체 좋아요 수 서브쿼리 추가
-            .options(joinedload(Feed.user).joinedload(User.profile_file), joinedload(Feed.files))
-            .order_by(Feed.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        # 결과 처리: feed, likes_count 순서로 튜플 반환
-        for feed, likes_count_val in query.all():
-            files = [FileSchema.model_validate(f) for f in feed.files]
-            
-            # 프로필 이미지 URL 생성
-            profile_image_url = None
-            if feed.user.profile_file:
-                profile_image_url = settings.get_profile_image_url(feed.user.profile_file.s3_key)
-            
-            user = UserSchemaForFeed(
-                id=feed.user.id,
-                username=feed.user.username,
-                email=feed.user.email,
-                bio=feed.user.bio,
-                created_at=feed.user.created_at,
-                updated_at=feed.user.updated_at,
-                terms_of_service=feed.user.terms_of_service,
-                privacy_policy=feed.user.privacy_policy,
-                profile_image_url=profile_image_url
-            )
-            
-            dump = FeedResponse(
-                id=feed.id,
-                description=feed.description,
-                frame_ratio=feed.frame_ratio,
-                created_at=feed.created_at,
-                updated_at=feed.updated_at,
-                files=files,
-                user=user,
-                likes_count=likes_count_val if likes_count_val is not None else 0 # likes_count_val 매핑
-            ).model_dump()
-            response_feeds.append(FeedResponseWithLike(**dump, is_liked=False))
-
-    return FeedListResponseWithLike(feeds=response_feeds, total=total_feeds)
+    return JSONResponse(content=page)
 
 @router.post("/", response_model=FeedResponse, status_code=201)
 def create_feed_endpoint(
@@ -190,9 +211,14 @@ def create_feed_endpoint(
         frame_ratio=feed_data.frame_ratio
     )
 
+    # 피드 생성 (전체/사용자별 피드 수 카운터도 같은 트랜잭션에서 증가)
     db.add(new_feed)
+    db.flush()
+    adjust_feeds_total(db, 1)
+    adjust_user_feeds_count(db, current_user_id, 1)
     db.commit()
     db.refresh(new_feed)
+    invalidate_feed_counts()
 
     if feed_data.file_ids:
         files = db.query(FileModel).filter(FileModel.id.in_(feed_data.file_ids)).all()
@@ -200,13 +226,15 @@ def create_feed_endpoint(
             file.feed_id = new_feed.id
             
         db.commit()
+
+    invalidate_on_feed_created()
     
     return FeedResponse.from_orm(new_feed)
 
 @router.get("/{feed_id}", response_model=FeedResponseWithLike)
-def get_single_feed(
+async def get_single_feed(
     feed_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: Optional[int] = Depends(get_optional_current_user_id)
 ):
     """
@@ -214,14 +242,15 @@ def get_single_feed(
     """
     # 특정 피드 조회
     feed = (
-        db.query(Feed)
-        .filter(Feed.id == feed_id)
-        .options(
-            joinedload(Feed.files),  # 피드와 연결된 파일 정보를 한 번에 가져옴
-            joinedload(Feed.user).joinedload(User.profile_file)  # 사용자와 프로필 파일 정보 함께 가져옴
+        await db.execute(
+            select(Feed)
+            .where(Feed.id == feed_id)
+            .options(
+                joinedload(Feed.files),  # 피드와 연결된 파일 정보를 한 번에 가져옴
+                joinedload(Feed.user).joinedload(User.profile_file)  # 사용자와 프로필 파일 정보 함께 가져옴
+            )
         )
-        .first()
-    )
+    ).unique().scalars().first()
     
     if not feed:
         raise HTTPException(status_code=404, detail="피드를 찾을 수 없습니다")
@@ -229,16 +258,13 @@ def get_single_feed(
     # current_user_id가 있을 경우 좋아요 정보 확인
     is_liked = False
     if current_user_id:
-        like_exists = (
-            db.query(FeedLike)
-            .filter(FeedLike.user_id == current_user_id, FeedLike.feed_id == feed_id)
-            .first()
+        like_exists = await db.scalar(
+            select(FeedLike.feed_id)
+            .where(FeedLike.user_id == current_user_id, FeedLike.feed_id == feed_id)
+            .limit(1)
         )
         is_liked = like_exists is not None
     
-    # 피드 좋아요 수 계산
-    likes_count = db.query(FeedLike).filter(FeedLike.feed_id == feed_id).count()
-    
     # 프로필 이미지 URL 생성
     profile_image_url = None
     if feed.user.profile_file:
@@ -262,7 +288,8 @@ def get_single_feed(
         updated_at=feed.updated_at,
         files=feed.files,
         user=user_data,
-        likes_count=likes_count,
+        likes_count=feed.likes_count,
+        comments_count=feed.comments_count,
         is_liked=is_liked
     )
     
@@ -294,11 +321,14 @@ def like_feed(
     if existing_like:
         return {"message": "이미 좋아요를 누른 피드입니다."}
 
-    # 3. 좋아요 정보 생성 및 저장
+    # 3. 좋아요 정보 생성 및 저장 (좋아요 수 카운터도 같은 트랜잭션에서 증가)
     new_like = FeedLike(user_id=current_user_id, feed_id=feed_id)
     try:
         db.add(new_like)
+        db.flush()
+        adjust_feed_likes_count(db, feed_id, 1)
         db.commit()
+        invalidate_feed(feed_id)
         return {"message": "피드에 좋아요를 추가했습니다."}
     except Exception as e:
         db.rollback()
@@ -323,19 +353,20 @@ def unlike_feed(
     if not feed:
         raise HTTPException(status_code=404, detail="피드를 찾을 수 없습니다.")
 
-    # 2. 좋아요 기록 찾기
-    like_to_delete = db.query(FeedLike).filter(
-        FeedLike.user_id == current_user_id,
-        FeedLike.feed_id == feed_id
-    ).first()
+    # 2~3. 좋아요 기록 삭제 (실제로 삭제된 경우에만 좋아요 수 카운터 감소)
+    try:
+        deleted = db.query(FeedLike).filter(
+            FeedLike.user_id == current_user_id,
+            FeedLike.feed_id == feed_id
+        ).delete(synchronize_session=False)
 
-    if not like_to_delete:
-        return {"message": "좋아요를 누르지 않은 피드입니다."}
+        if not deleted:
+            db.rollback()
+            return {"message": "좋아요를 누르지 않은 피드입니다."}
 
-    # 3. 좋아요 기록 삭제
-    try:
-        db.delete(like_to_delete)
+        adjust_feed_likes_count(db, feed_id, -1)
         db.commit()
+        invalidate_feed(feed_id)
         return {"message": "피드 좋아요를 취소했습니다."}
     except Exception as e:
         db.rollback()
@@ -358,14 +389,17 @@ def create_comment(
     if not feed:
         raise HTTPException(status_code=404, detail="피드를 찾을 수 없습니다.")
     
-    # 댓글 생성
+    # 댓글 생성 (피드 댓글 수 카운터도 같은 트랜잭션에서 증가)
     db_comment = Comment(
         feed_id=feed_id, 
         content=comment.content, 
         user_id=current_user_id
     )
     db.add(db_comment)
+    db.flush()
+    adjust_feed_comments_count(db, feed_id, 1)
     db.commit()
+    invalidate_feed(feed_id)
     db.refresh(db_comment)
     
     # 댓글과 관련된 사용자 정보 및 프로필 파일 로드
@@ -376,7 +410,7 @@ def create_comment(
     # 프로필 이미지 URL 생성
     profile_image_url = None
     if db_comment.user.profile_file:
-        profile_image_url = f"{db_comment.user.profile_file.base_url}/{db_comment.user.profile_file.s3_key}"
+        profile_image_url = settings.get_profile_image_url(db_comment.user.profile_file.s3_key)
     
     # UserForFeed 스키마로 사용자 정보 생성
     user_data = UserForFeed(
@@ -404,11 +438,11 @@ def create_comment(
     response_model=CommentListResponseWithLike,
     summary="피드 댓글 목록 조회"
 )
-def get_feed_comments(
+async def get_feed_comments(
     feed_id: int,
-    skip: int = 0,
-    limit: int = 50,
-    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_LIMIT),
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: int = Depends(get_optional_current_user_id)
 ):
     """
@@ -422,43 +456,42 @@ def get_feed_comments(
 
     print(f"current_user_id: {current_user_id}")
     # 피드 존재 확인
-    feed = db.query(Feed).filter(Feed.id == feed_id).first()
-    if not feed:
+    feed_exists = await db.scalar(select(Feed.id).where(Feed.id == feed_id))
+    if not feed_exists:
         raise HTTPException(status_code=404, detail="피드를 찾을 수 없습니다.")
 
     # 댓글 + 작성자 + 프로필 파일 로드
     comments = (
-        db.query(Comment)
-        .filter(Comment.feed_id == feed_id)
-        .options(joinedload(Comment.user).joinedload(User.profile_file))
-        .order_by(Comment.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+        await db.execute(
+            select(Comment)
+            .where(Comment.feed_id == feed_id)
+            .options(joinedload(Comment.user).joinedload(User.profile_file))
+            .order_by(Comment.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+    ).scalars().all()
+
+    # 내가 좋아요 누른 댓글 ID 목록을 한 번의 IN 쿼리로 미리 로딩 (로그인한 경우만)
+    # 좋아요 수는 comments.likes_count 카운터를 사용하므로 댓글별 추가 쿼리가 없음
+    liked_comment_ids = set()
+    if current_user_id and comments:
+        liked_rows = await db.execute(
+            select(CommentLike.comment_id)
+            .where(
+                CommentLike.user_id == current_user_id,
+                CommentLike.comment_id.in_([comment.id for comment in comments])
+            )
+        )
+        liked_comment_ids = {row.comment_id for row in liked_rows}
 
     result = []
 
     for comment in comments:
-        # 좋아요 개수
-        likes_count = db.query(func.count()).filter(
-            CommentLike.comment_id == comment.id
-        ).scalar()
-
-        # 내가 좋아요 눌렀는지 여부 (로그인한 경우만)
-        is_liked = False
-        if current_user_id:
-            is_liked = db.query(
-                exists().where(
-                    (CommentLike.comment_id == comment.id) &
-                    (CommentLike.user_id == current_user_id)
-                )
-            ).scalar()
-
         # 프로필 이미지 URL 생성
         profile_image_url = None
         if comment.user.profile_file:
-            profile_image_url = f"{comment.user.profile_file.base_url}/{comment.user.profile_file.s3_key}"
+            profile_image_url = settings.get_profile_image_url(comment.user.profile_file.s3_key)
         
         # UserForFeed 스키마로 사용자 정보 생성
         user_data = UserForFeed(
@@ -477,8 +510,8 @@ def get_feed_comments(
             created_at=comment.created_at,
             updated_at=comment.updated_at,
             user=user_data,
-            likes_count=likes_count,
-            is_liked=is_liked
+            likes_count=comment.likes_count,
+            is_liked=comment.id in liked_comment_ids
         ))
 
     return CommentListResponseWithLike(comments=result)
@@ -495,7 +528,7 @@ def delete_feed(
     - 피드의 작성자만 삭제할 수 있습니다.
     - 피드가 존재하지 않으면 404 오류를 반환합니다.
     - 권한이 없으면 403 오류를 반환합니다.
-    - 피드와 연결된 파일들도 S3와 DB에서 함께 삭제됩니다.
+    - 피드와 연결된 파일들도 DB에서 함께 삭제되며, S3 객체는 커밋 후 백그라운드에서 일괄 삭제됩니다.
     """
     # 1. 피드 조회 (연결된 파일들도 함께 로드)
     feed_to_delete = db.query(Feed).options(joinedload(Feed.files)).filter(Feed.id == feed_id).first()
@@ -508,37 +541,21 @@ def delete_feed(
     if feed_to_delete.user_id != current_user_id:
         raise HTTPException(status_code=403, detail="피드를 삭제할 권한이 없습니다.")
 
-    # 4. 피드와 연결된 파일들 정보 저장 (나중에 삭제용)
-    feed_files = list(feed_to_delete.files)  # 리스트로 복사
-    
-    # 5. 피드 삭제 (cascade로 연결된 데이터들도 함께 삭제됨)
+    # 4. 피드 삭제 (cascade로 연결된 파일 등도 함께 삭제됨, 피드 수 카운터도 함께 감소)
+    #    S3 객체는 같은 트랜잭션에서 삭제 대기열에 넣고, 커밋 후 백그라운드에서 일괄 삭제
     try:
+        for file in feed_to_delete.files:
+            # 같은 원본을 다른 파일이 쓰고 있으면 참조 수만 줄이고 S3 객체는 남김
+            s3_keys, s3_prefixes = release_file_storage(db, file)
+            enqueue_storage_deletions(db, s3_keys, s3_prefixes)
         db.delete(feed_to_delete)
+        adjust_feeds_total(db, -1)
+        adjust_user_feeds_count(db, current_user_id, -1)
         db.commit()
-        logger.info(f"피드 DB 삭제 완료: ID {feed_id}")
-        
-        # 6. S3에서 관련 파일들 삭제
-        for file in feed_files:
-            try:
-                if file.s3_key:
-                    delete_success = delete_file_from_s3(file.s3_key)
-                    if delete_success:
-                        logger.info(f"피드 파일 S3 삭제 완료: {file.s3_key}")
-                    else:
-                        logger.warning(f"피드 파일 S3 삭제 실패: {file.s3_key}")
-                
-                # DB에서 파일 레코드 삭제 (이미 cascade로 삭제되었을 수 있음)
-                # 하지만 명시적으로 삭제 시도
-                db_file = db.query(FileModel).filter(FileModel.id == file.id).first()
-                if db_file:
-                    db.delete(db_file)
-                    db.commit()
-                    logger.info(f"피드 파일 DB 삭제 완료: ID {file.id}")
-                
-            except Exception as e:
-                logger.error(f"피드 파일 삭제 중 오류 발생 (File ID: {file.id}): {str(e)}")
-                # 개별 파일 삭제 실패해도 계속 진행
-                continue
+        wake_storage_deletion_drainer()
+        invalidate_feed_counts()
+        invalidate_on_feed_deleted(feed_id)
+        logger.info(f"피드 삭제 완료: ID {feed_id}")
         
         return {"message": f"피드(ID: {feed_id})와 관련 파일들이 성공적으로 삭제되었습니다."}
         
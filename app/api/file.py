@@ -1,15 +1,38 @@
-from fastapi import APIRouter, File as FastAPIFile, UploadFile, HTTPException
+from fastapi import APIRouter, File as FastAPIFile, UploadFile, HTTPException, status
 from typing import List
-from app.schemas.file import FileUploadResponse, File
-from app.services.s3 import upload_files_to_s3
-from app.services.media import get_image_dimensions, get_video_dimensions_with_rotation, extract_video_thumbnail
+from app.core.config import settings
+from app.schemas.file import (
+    FileUploadResponse,
+    File,
+    FinalizeUploadRequest,
+    PresignUploadRequest,
+    PresignUploadResponse
+)
+from app.services.auth import get_current_user_id
+from app.services.direct_upload import create_upload_token, decode_upload_token, plan_direct_upload
+from app.services.media_jobs import copy_processed_media, enqueue_media_job
+from app.services.media_objects import UploadedOriginal, claim_media_objects, save_with_originals, upload_originals
+from app.services.media_worker import wake_media_worker
+from app.services.storage_deletions import enqueue_storage_deletions, wake_storage_deletion_drainer
+from app.services.s3 import (
+    DEFAULT_CONTENT_TYPE,
+    MB,
+    S3UploadError,
+    build_s3_url,
+    complete_multipart_upload,
+    create_presigned_multipart_upload,
+    create_presigned_put_url,
+    delete_file_from_s3,
+    gather_bounded,
+    head_s3_object,
+    run_s3_call
+)
+from app.services.media import get_image_dimensions
 from app.models.file import File as FileModel
 from app.db.base import get_db
 from sqlalchemy.orm import Session
 from fastapi import Depends
 import logging
-import os
-from datetime import datetime
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -17,87 +40,55 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-def extract_s3_key_from_url(url: str) -> str:
-    """S3 URL에서 s3_key를 추출합니다."""
-    # URL 형식: https://bucket-name.s3.region.amazonaws.com/uploads/file.jpg
-    # s3_key 형식: uploads/file.jpg
-    if ".amazonaws.com/" in url:
-        return url.split(".amazonaws.com/", 1)[1]
-    return url
+async def _process_upload(file: UploadFile) -> dict:
+    """
+    파일 하나의 메타데이터(이미지 크기 등)를 확인해 DB에 저장할 정보를 반환합니다.
+    DB에는 접근하지 않으므로 여러 파일을 동시에 처리할 수 있습니다. (원본 업로드는 upload_originals에서 처리)
+    """
+    # 파일 메타데이터 출력
+    logger.info(f"파일 메타데이터: {file.filename}")
+    logger.info(f"- Content-Type: {file.content_type}")
+    logger.info(f"- 파일 크기: {file.size} bytes")
 
-@router.post("/upload", response_model=FileUploadResponse)
-async def upload_files(
-    files: List[UploadFile] = FastAPIFile(...),
-    db: Session = Depends(get_db)
-):
+    # 이미지 파일인 경우 크기 정보 확인
+    width, height = None, None
+    if file.content_type and file.content_type.startswith('image/'):
+        width, height = await get_image_dimensions(file)
+
+    # 비디오의 크기 확인과 썸네일 생성은 업로드 후 미디어 워커가 처리
+    if width and height:
+        logger.info(f"- 미디어 크기: {width}x{height} pixels")
+
+    return {
+        'filename': file.filename,
+        'content_type': file.content_type or DEFAULT_CONTENT_TYPE,
+        'size': file.size,
+        'width': width,
+        'height': height
+    }
+
+def _uploaded_keys(uploads: List[UploadedOriginal]) -> List[str]:
+    """이번 요청에서 올린 객체 키 목록 (업로드를 건너뛴 파일과 같은 내용의 파일이 공유하는 키는 한 번만)"""
+    return sorted({
+        upload.s3_key
+        for upload in uploads
+        if isinstance(upload, UploadedOriginal) and upload.s3_key is not None
+    })
+
+def _save_uploaded_files(db: Session, file_metadata_list: List[dict]) -> List[FileModel]:
     """
-    여러 파일을 S3에 업로드하고 파일 정보를 DB에 저장하는 API
+    업로드한 파일들의 원본 참조를 잡고 파일 정보를 DB에 저장한 뒤 커밋합니다.
+    동기 세션을 사용하므로 run_in_threadpool로 한 번에 호출합니다. (실패하면 롤백 후 예외를 다시 발생)
     """
     try:
-        logger.info(f"파일 업로드 요청: {len(files)}개 파일")
+        stored_list = claim_media_objects(db, [metadata['uploaded'] for metadata in file_metadata_list])
 
-        # 파일 메타데이터를 저장할 리스트
-        file_metadata_list = []
-
-        for file in files:
-            # 파일 메타데이터 출력
-            logger.info(f"파일 메타데이터: {file.filename}")
-            logger.info(f"- Content-Type: {file.content_type}")
-            logger.info(f"- 파일 크기: {file.size} bytes")
-            
-            # 이미지 또는 비디오 파일인 경우 크기 정보 확인
-            width, height = None, None
-            s3_key_thumbnail = None
-            
-            if file.content_type:
-                if file.content_type.startswith('image/'):
-                    width, height = await get_image_dimensions(file)
-                elif file.content_type.startswith('video/'):
-                    # 회전 정보를 고려한 최종 비디오 크기 가져오기
-                    width, height = await get_video_dimensions_with_rotation(file)
-                    if width is None or height is None:
-                        logger.warning(f"비디오 크기 정보를 가져올 수 없습니다: {file.filename}")
-
-                    # 비디오 썸네일 추출 및 업로드 (최종 width, height 전달)
-                    thumbnail = await extract_video_thumbnail(file, target_width=width, target_height=height)
-                    if thumbnail:
-                        try:
-                            # 썸네일 업로드 전 원본 파일 포인터 복구 (필요 시)
-                            await file.seek(0) # extract_video_thumbnail 내부에서 읽었으므로 필요
-                            
-                            thumbnail_urls = await upload_files_to_s3([thumbnail])
-                            if thumbnail_urls:
-                                s3_key_thumbnail = extract_s3_key_from_url(thumbnail_urls[0])
-                            await thumbnail.close()
-                        except Exception as e:
-                            logger.error(f"썸네일 업로드 중 오류 발생: {str(e)}")
-                
-                if width and height:
-                    logger.info(f"- 미디어 크기: {width}x{height} pixels")
-
-            # 메타데이터 저장
-            file_metadata_list.append({
-                'filename': file.filename,
-                'content_type': file.content_type,
-                'size': file.size,
-                'width': width,
-                'height': height,
-                's3_key_thumbnail': s3_key_thumbnail
-            })
-
-        # 원본 파일 업로드
-        file_urls = await upload_files_to_s3(files)
-        
-        # 파일 정보를 DB에 저장
         uploaded_files = []
-        for file_url, metadata in zip(file_urls, file_metadata_list):
-            # URL에서 s3_key만 추출
-            s3_key = extract_s3_key_from_url(file_url)
-
+        for metadata, stored in zip(file_metadata_list, stored_list):
             file_info = FileModel(
                 file_name=metadata['filename'],
-                s3_key=s3_key,
-                s3_key_thumbnail=metadata['s3_key_thumbnail'],
+                s3_key=stored.s3_key,
+                media_object_id=stored.media_object.id,
                 content_type=metadata['content_type'],
                 file_size=metadata['size'],
                 width=metadata['width'],
@@ -105,10 +96,63 @@ async def upload_files(
             )
             db.add(file_info)
             db.flush()  # ID를 즉시 생성하기 위해 flush
+            if file_info.content_type and file_info.content_type.startswith(('video/', 'image/')):
+                # 같은 원본이 이미 처리되었으면 결과를 복사하고, 아니면 미디어 워커에서 처리
+                if stored.uploaded or not copy_processed_media(db, file_info):
+                    enqueue_media_job(db, file_info)
             uploaded_files.append(file_info)
-        
+
         db.commit()
-        
+        for file_info in uploaded_files:
+            db.refresh(file_info)
+        return uploaded_files
+    except Exception:
+        db.rollback()
+        raise
+
+@router.post("/upload", response_model=FileUploadResponse)
+async def upload_files(
+    files: List[UploadFile] = FastAPIFile(...),
+    db: Session = Depends(get_db)
+):
+    """
+    여러 파일을 S3에 업로드하고 파일 정보를 DB에 저장하는 API
+    파일별 해시 계산과 업로드는 동시에 진행하고, 응답 순서는 요청한 파일 순서를 유지합니다.
+    같은 내용의 원본이 이미 있으면 S3 전송을 건너뛰고 그 원본을 재사용합니다.
+    원본이 저장되면 바로 응답하고, 비디오 크기 확인/썸네일과 이미지 변환본 생성은 미디어 작업 큐에서 처리합니다.
+    """
+    try:
+        logger.info(f"파일 업로드 요청: {len(files)}개 파일")
+
+        results = await gather_bounded([_process_upload(file) for file in files])
+        uploads = await upload_originals(db, files)
+
+        errors = [
+            (file.filename, result if isinstance(result, BaseException) else upload)
+            for file, result, upload in zip(files, results, uploads)
+            if isinstance(result, BaseException) or isinstance(upload, BaseException)
+        ]
+        if errors:
+            # 아직 원본으로 등록되지 않았으므로 이번 요청에서 올린 객체는 모두 정리
+            for s3_key in _uploaded_keys(uploads):
+                await run_s3_call(delete_file_from_s3, s3_key)
+            raise S3UploadError(errors)
+
+        for result, upload in zip(results, uploads):
+            result['uploaded'] = upload
+
+        # 원본 참조 수 증가/등록과 파일 정보 저장은 해시 순서로 한 번에 처리 (이벤트 루프를 막지 않도록 스레드에서 실행)
+        try:
+            uploaded_files = await save_with_originals(files, uploads, _save_uploaded_files, db, results)
+        except Exception:
+            for s3_key in _uploaded_keys(uploads):
+                await run_s3_call(delete_file_from_s3, s3_key)
+            raise
+        wake_media_worker()
+        # 같은 내용이 동시에 업로드되어 기존 원본을 재사용한 파일의 중복 업로드 객체 삭제
+        wake_storage_deletion_drainer()
+
+        file_urls = [build_s3_url(file_info.s3_key) for file_info in uploaded_files]
         logger.info(f"파일 업로드 완료: {len(file_urls)}개 파일")
         return FileUploadResponse(
             message=f"{len(file_urls)}개의 파일이 업로드되었습니다.",
@@ -117,4 +161,106 @@ async def upload_files(
         )
     except Exception as e:
         logger.error(f"파일 업로드 중 오류 발생: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/presign", response_model=PresignUploadResponse)
+def presign_upload(
+    request: PresignUploadRequest,
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """
+    클라이언트가 S3에 직접 업로드할 수 있는 presigned URL을 발급하는 API
+    (파일 크기가 multipart 기준 이상이면 파트별 URL을 발급)
+    업로드가 끝나면 발급받은 upload_token으로 /finalize를 호출해야 합니다.
+    """
+    plan = plan_direct_upload(request.filename, request.content_type, request.file_size)
+    s3_key = plan["s3_key"]
+
+    try:
+        if plan["multipart"]:
+            upload_id, part_urls = create_presigned_multipart_upload(
+                s3_key, request.content_type, plan["part_count"]
+            )
+            url = None
+        else:
+            upload_id, part_urls = None, []
+            url = create_presigned_put_url(s3_key, request.content_type, request.file_size)
+    except Exception as e:
+        logger.error(f"presigned URL 발급 중 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail="업로드 URL 발급에 실패했습니다.")
+
+    logger.info(f"presigned URL 발급: {s3_key} (multipart={plan['multipart']})")
+    return PresignUploadResponse(
+        upload_token=create_upload_token(
+            current_user_id, s3_key, request.filename, request.content_type, request.file_size, upload_id
+        ),
+        s3_key=s3_key,
+        method="multipart" if plan["multipart"] else "put",
+        url=url,
+        upload_id=upload_id,
+        part_size=plan["part_size"],
+        part_urls=part_urls,
+        expires_in=settings.S3_PRESIGN_EXPIRE_SECONDS
+    )
+
+@router.post("/finalize", response_model=File)
+def finalize_upload(
+    request: FinalizeUploadRequest,
+    db: Session = Depends(get_db),
+    current_user_id: int = Depends(get_current_user_id)
+):
+    """
+    S3 직접 업로드를 마무리하고 파일 정보를 DB에 저장하는 API
+    크기 확인과 썸네일 생성은 미디어 작업 큐에 추가되어 워커가 저장된 객체를 내려받아 처리합니다.
+    원본 등록(같은 내용의 원본이 있으면 그 객체를 공유하고 올린 객체는 삭제)도 워커가 해시를 계산한 뒤 처리합니다.
+    """
+    upload = decode_upload_token(request.upload_token, current_user_id)
+    s3_key = upload["s3_key"]
+
+    # 같은 토큰으로 다시 요청한 경우(재시도) 이미 저장된 파일 정보를 반환
+    existing_file = db.query(FileModel).filter(FileModel.s3_key == s3_key).first()
+    if existing_file:
+        return existing_file
+
+    if upload["upload_id"]:
+        if not request.parts:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="multipart 업로드의 파트 목록이 필요합니다.")
+        try:
+            complete_multipart_upload(
+                s3_key,
+                upload["upload_id"],
+                [{"PartNumber": part.part_number, "ETag": part.etag} for part in request.parts]
+            )
+        except Exception as e:
+            logger.error(f"multipart 업로드 완료 처리 실패 ({s3_key}): {str(e)}")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="multipart 업로드를 완료할 수 없습니다.")
+
+    # 실제로 업로드된 객체의 크기를 사용 (클라이언트가 보낸 값은 신뢰하지 않음)
+    s3_object = head_s3_object(s3_key)
+    if s3_object is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="업로드된 파일을 찾을 수 없습니다.")
+
+    # presign 이후 선언한 크기나 최대 크기보다 큰 객체로 바꿔 올린 경우 등록하지 않고 삭제
+    max_size = min(settings.S3_DIRECT_UPLOAD_MAX_SIZE_MB * MB, upload.get("file_size") or float("inf"))
+    if s3_object["ContentLength"] > max_size:
+        logger.warning(f"직접 업로드 크기 초과: {s3_key} ({s3_object['ContentLength']} > {max_size} bytes)")
+        enqueue_storage_deletions(db, [s3_key])
+        db.commit()
+        wake_storage_deletion_drainer()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="업로드된 파일이 허용된 크기보다 큽니다.")
+
+    file_info = FileModel(
+        file_name=upload["filename"],
+        s3_key=s3_key,
+        content_type=upload["content_type"],
+        file_size=s3_object["ContentLength"]
+    )
+    db.add(file_info)
+    db.flush()
+    enqueue_media_job(db, file_info)
+    db.commit()
+    db.refresh(file_info)
+    wake_media_worker()
+
+    logger.info(f"직접 업로드 완료: {s3_key} ({file_info.file_size} bytes)")
+    return file_info
@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
+from app.db.base import async_engine, engine
+from app.db.engine import get_pool_status
 from app.models.user import User
 
 router = APIRouter()
@@ -23,4 +25,11 @@ async def test_table(db: Session = Depends(get_db)):
         columns = [row[0] for row in result]
         return {"status": "success", "columns": columns}
     except Exception as e:
-        return {"status": "error", "message": str(e)} 
\ No newline at end of file
+        return {"status": "error", "message": str(e)} 
+@router.get("/db-pool")
+async def test_db_pool():
+    # 동기/비동기 엔진의 커넥션 풀 사용량 (풀 크기 조정 시 참고)
+    return {
+        "sync": get_pool_status(engine, "sync"),
+        "async": get_pool_status(async_engine.sync_engine, "async"),
+    }
@@ -1,12 +1,14 @@
 from datetime import datetime
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, File as FastAPIFile, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, File as FastAPIFile, Query, UploadFile
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload, aliased
 from sqlalchemy.sql import func
 from typing import List, Optional
 
-from app.db.base import get_db
+from app.db.base import get_async_db, get_db
 from app.models.feed import Feed
 from app.models.user import User
 from app.models.file import File
@@ -26,8 +28,19 @@ from app.schemas.user import (
 )
 
 from app.services.auth import get_current_user_id, get_optional_current_user_id
-from app.services.s3 import upload_files_to_s3, delete_file_from_s3
+from app.services.media_objects import (
+    UploadedOriginal,
+    claim_media_objects,
+    release_file_storage,
+    save_with_originals,
+    upload_originals
+)
+from app.services.pagination import MAX_PAGE_LIMIT
+from app.services.s3 import delete_file_from_s3, run_s3_call
+from app.services.storage_deletions import enqueue_storage_deletions, wake_storage_deletion_drainer
 from app.services.media import get_image_dimensions
+from app.services.totals import CountMode, get_user_feeds_count, get_user_feeds_count_async
+from app.services.feed_cache import invalidate_user
 from app.core.config import settings
 
 
@@ -47,62 +60,54 @@ def get_users_for_sitemap(db: Session = Depends(get_db)):
 
 
 @router.get("/{user_id}/feeds", response_model=FeedListResponseWithLike)
-def get_user_feeds(
+async def get_user_feeds(
     user_id: int,
-    offset: int = 0,
-    limit: int = 20,
-    db: Session = Depends(get_db),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_LIMIT),
+    count_mode: CountMode = "approximate",
+    db: AsyncSession = Depends(get_async_db),
     current_user_id: Optional[int] = Depends(get_optional_current_user_id)
 ):
     """
     특정 유저의 모든 피드를 파일 포함하여 가져오는 API
     """
     # 해당 유저가 존재하는지 확인
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     
-    # 해당 유저의 피드 총 개수 계산
-    total_feeds = db.query(Feed).filter(Feed.user_id == user_id).count()
+    # 해당 유저의 피드 총 개수 (users.feeds_count 카운터 또는 정확한 COUNT)
+    total_feeds = await get_user_feeds_count_async(db, user, count_mode)
     
     # 해당 유저의 피드 목록과 연결된 파일 정보, 사용자 프로필 정보 함께 가져오기 (생성 날짜 내림차순으로 정렬)
     feeds = (
-        db.query(Feed)
-        .filter(Feed.user_id == user_id)
-        .options(
-            joinedload(Feed.files),  # 피드와 연결된 파일 정보를 한 번에 가져옴
-            joinedload(Feed.user).joinedload(User.profile_file)  # 사용자와 프로필 파일 정보 함께 가져옴
+        await db.execute(
+            select(Feed)
+            .where(Feed.user_id == user_id)
+            .options(
+                joinedload(Feed.files),  # 피드와 연결된 파일 정보를 한 번에 가져옴
+                joinedload(Feed.user).joinedload(User.profile_file)  # 사용자와 프로필 파일 정보 함께 가져옴
+            )
+            .order_by(Feed.created_at.desc())
+            .offset(offset)
+            .limit(limit)
         )
-        .order_by(Feed.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    ).unique().scalars().all()
 
     # current_user_id가 있을 경우 좋아요 정보 미리 로딩해둠
     # 다음 쿼리에서 사용
     liked_feed_ids = set()
     if current_user_id:
-        liked_rows = (
-            db.query(FeedLike.feed_id)
-            .filter(
+        liked_rows = await db.execute(
+            select(FeedLike.feed_id)
+            .where(
                 FeedLike.user_id == current_user_id,
                 FeedLike.feed_id.in_([feed.id for feed in feeds])
             )
-            .all()
         )
         liked_feed_ids = {row.feed_id for row in liked_rows} 
 
     print(f"liked_feed_ids: {liked_feed_ids}")
-    
-    # 피드 전체 좋아요 수 계산
-    feed_ids = [feed.id for feed in feeds]
-    likes_count_by_feed = dict(
-        db.query(FeedLike.feed_id, func.count())
-        .filter(FeedLike.feed_id.in_(feed_ids))
-        .group_by(FeedLike.feed_id)
-        .all()
-    )
 
     # 피드 응답 생성 (프로필 이미지 URL 포함)
     feed_responses = []
@@ -131,7 +136,8 @@ def get_user_feeds(
             updated_at=feed.updated_at,
             files=feed.files,
             user=user_data,
-            likes_count=likes_count_by_feed.get(feed.id, 0),
+            likes_count=feed.likes_count,
+            comments_count=feed.comments_count,
             is_liked=feed.id in liked_feed_ids  # 추가된 필드
         )
         feed_responses.append(feed_response)
@@ -139,6 +145,53 @@ def get_user_feeds(
     # 응답 반환
     return FeedListResponseWithLike(feeds=feed_responses, total=total_feeds)
 
+def _save_profile_file(
+    db: Session,
+    user: User,
+    uploaded: UploadedOriginal,
+    file_name: str,
+    content_type: str,
+    file_size: int,
+    width: Optional[int],
+    height: Optional[int],
+    old_profile_file: Optional[FileModel]
+) -> FileModel:
+    """
+    업로드한 프로필 사진의 원본 참조를 잡고 파일 정보를 저장한 뒤 사용자 프로필을 바꾸고,
+    기존 프로필 파일의 원본 참조를 놓고 레코드를 삭제한 뒤 한 트랜잭션으로 커밋합니다.
+    동기 세션을 사용하므로 run_in_threadpool로 한 번에 호출합니다. (실패하면 롤백 후 예외를 다시 발생)
+    """
+    try:
+        stored = claim_media_objects(db, [uploaded])[0]
+        file_info = FileModel(
+            file_name=file_name,
+            s3_key=stored.s3_key,
+            media_object_id=stored.media_object.id,
+            content_type=content_type,
+            file_size=file_size,
+            width=width,
+            height=height
+        )
+        db.add(file_info)
+        db.flush()  # ID를 즉시 생성
+
+        # 사용자의 profile_file_id 업데이트
+        user.profile_file_id = file_info.id
+
+        # 기존 프로필 파일 정리
+        # (다른 파일이 같은 원본을 쓰지 않으면 S3 객체는 삭제 대기열에 넣어 백그라운드에서 삭제)
+        if old_profile_file:
+            old_keys, old_prefixes = release_file_storage(db, old_profile_file)
+            enqueue_storage_deletions(db, old_keys, old_prefixes)
+            db.delete(old_profile_file)
+        db.commit()
+        db.refresh(file_info)
+        return file_info
+    except Exception:
+        db.rollback()
+        raise
+
+
 @router.put("/profile-image", response_model=ProfileImageUpdateResponse, summary="프로필 사진 변경")
 async def update_profile_image(
     file: UploadFile = FastAPIFile(...),
@@ -171,55 +224,25 @@ async def update_profile_image(
         width, height = await get_image_dimensions(file)
         logger.info(f"이미지 크기: {width}x{height} pixels")
 
-        # S3에 파일 업로드
-        file_urls = await upload_files_to_s3([file])
-        if not file_urls:
-            raise HTTPException(status_code=500, detail="파일 업로드에 실패했습니다.")
-
-        # URL에서 s3_key 추출
-        def extract_s3_key_from_url(url: str) -> str:
-            """S3 URL에서 s3_key를 추출합니다."""
-            if ".amazonaws.com/" in url:
-                return url.split(".amazonaws.com/", 1)[1]
-            return url
-        
-        s3_key = extract_s3_key_from_url(file_urls[0])
-
-        # 파일 정보를 DB에 저장
-        file_info = FileModel(
-            file_name=file.filename,
-            s3_key=s3_key,
-            content_type=file.content_type,
-            file_size=file.size,
-            width=width,
-            height=height
-        )
-        db.add(file_info)
-        db.flush()  # ID를 즉시 생성
-
-        # 사용자의 profile_file_id 업데이트
-        user.profile_file_id = file_info.id
-        db.commit()
+        # S3에 파일 업로드 후 원본 등록과 기존 프로필 파일 정리 (같은 내용의 원본이 이미 있으면 업로드하지 않고 그 객체를 재사용)
+        uploaded = (await upload_originals(db, [file]))[0]
+        if isinstance(uploaded, BaseException):
+            raise uploaded
+        try:
+            file_info = await save_with_originals(
+                [file], [uploaded], _save_profile_file,
+                db, user, uploaded, file.filename, file.content_type, file.size, width, height, old_profile_file
+            )
+        except Exception:
+            if uploaded.s3_key is not None:
+                await run_s3_call(delete_file_from_s3, uploaded.s3_key)
+            raise
+        wake_storage_deletion_drainer()
+        invalidate_user(current_user_id)
+        s3_key = file_info.s3_key
 
-        # 기존 프로필 파일 정리
         if old_profile_file:
-            try:
-                # S3에서 기존 파일 삭제
-                if old_profile_file.s3_key:
-                    delete_success = delete_file_from_s3(old_profile_file.s3_key)
-                    if delete_success:
-                        logger.info(f"기존 프로필 이미지 S3 삭제 완료: {old_profile_file.s3_key}")
-                    else:
-                        logger.warning(f"기존 프로필 이미지 S3 삭제 실패: {old_profile_file.s3_key}")
-                
-                # DB에서 기존 파일 레코드 삭제
-                db.delete(old_profile_file)
-                db.commit()
-                logger.info(f"기존 프로필 파일 DB 삭제 완료: ID {old_profile_file_id}")
-                
-            except Exception as e:
-                logger.error(f"기존 프로필 파일 삭제 중 오류 발생: {str(e)}")
-                # 기존 파일 삭제 실패해도 새 파일 업로드는 성공했으므로 계속 진행
+            logger.info(f"기존 프로필 파일 DB 삭제 완료: ID {old_profile_file_id}")
         else:
             logger.info(f"사용자 ID {current_user_id}는 기존 프로필 이미지가 없어서 삭제할 파일이 없습니다.")
 
@@ -278,6 +301,7 @@ async def update_username(
         old_username = user.username
         user.username = request.username
         db.commit()
+        invalidate_user(current_user_id)
 
         logger.info(f"유저네임 변경 완료: 사용자 ID {current_user_id}, {old_username} → {request.username}")
         
@@ -316,6 +340,7 @@ async def update_bio(
         old_bio = user.bio
         user.bio = request.bio
         db.commit()
+        invalidate_user(current_user_id)
 
         logger.info(f"프로필 소개글 변경 완료: 사용자 ID {current_user_id}")
         
@@ -334,6 +359,7 @@ async def update_bio(
 @router.get("/{user_id}", response_model=UserProfileResponse, summary="특정 사용자 정보 조회")
 def get_user_profile(
     user_id: int,
+    count_mode: CountMode = "approximate",
     db: Session = Depends(get_db)
 ):
     """
@@ -346,7 +372,7 @@ def get_user_profile(
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    feeds_count = db.query(Feed).filter(Feed.user_id == user_id).count()
+    feeds_count = get_user_feeds_count(db, user, count_mode)
 
     profile_image_url = None
     if user.profile_file:
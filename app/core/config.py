@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 import os
 
@@ -15,16 +15,34 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_DATABASE: str
     DB_HOST: str
+    DB_PORT: int = 3306
+    
+    # DB connection pool settings (앱, Alembic, 스크립트가 같은 엔진 팩토리(app.db.engine)를 사용)
+    DB_POOL_SIZE: int = 10  # 항상 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 20  # 몰릴 때 추가로 여는 커넥션 수 (최대 pool_size + max_overflow)
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0  # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # 이 시간보다 오래된 커넥션은 다시 연결 (MySQL wait_timeout보다 짧게)
+    DB_POOL_PRE_PING: bool = True  # 커넥션 대여 시 살아 있는지 확인
     
     # Email settings
     EMAIL_USER: str = os.getenv("EMAIL_USER", "")
     EMAIL_PASSWORD: str = os.getenv("EMAIL_PASSWORD", "")
+    SMTP_HOST: str = "smtp.gmail.com"  # 로컬 테스트 시 localhost 등으로 변경
+    SMTP_PORT: int = 587
+    SMTP_USE_TLS: bool = True  # STARTTLS 사용 여부 (로컬 테스트 서버는 False)
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    MAIL_BATCH_SIZE: int = 20  # 한 번에 꺼내 같은 연결로 보내는 메일 수
+    MAIL_IDLE_TIMEOUT_SECONDS: float = 60.0  # 이 시간 동안 보낼 메일이 없으면 SMTP 연결을 닫음
+    MAIL_MAX_ATTEMPTS: int = 3  # 일시적 오류(연결 끊김, 4xx) 시 최대 시도 횟수
+    MAIL_RETRY_BASE_SECONDS: float = 2.0  # 재시도 간격 (실패할 때마다 2배)
+    MAIL_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0  # 서버 종료 시 남은 메일을 보내며 기다리는 최대 시간
     
     # JWT settings
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key")
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 60 * 24 * 7  # 7일
     # ACCESS_TOKEN_EXPIRE_MINUTES: int = 10  # test
+    PASSWORD_HASH_CONCURRENCY: int = 2  # 동시에 실행하는 bcrypt 해시/검증 수 (CPU를 많이 쓰므로 코어 수보다 작게)
     
     # AWS settings
     AWS_ACCESS_KEY_ID: str
@@ -36,13 +54,83 @@ class Settings(BaseSettings):
     IMAGE_BASE_URL: str  # CloudFront URL for images and thumbnails
     STORAGE_BASE_URL: str  # CloudFront URL for videos
     
+    # S3 transfer settings (multipart_threshold 이상인 파일은 multipart로 나눠서 병렬 업로드)
+    S3_MULTIPART_THRESHOLD_MB: int = 8
+    S3_MULTIPART_CHUNKSIZE_MB: int = 8  # 파트 크기 (파트당 메모리 버퍼 크기)
+    S3_MULTIPART_MAX_CONCURRENCY: int = 10  # 전송 매니저가 동시에 업로드하는 파트/파일 수
+    S3_UPLOAD_CONCURRENCY: int = 10  # 여러 파일 업로드 시 동시에 업로드하는 파일 수 (S3 전용 스레드 풀 크기)
+    
+    # Direct upload settings (클라이언트가 presigned URL로 S3에 직접 업로드)
+    S3_PRESIGN_EXPIRE_SECONDS: int = 60 * 60  # presigned URL 및 업로드 토큰 유효 시간
+    S3_DIRECT_UPLOAD_MAX_SIZE_MB: int = 1024  # 직접 업로드 허용 최대 파일 크기
+    
+    # Image variant settings (미디어 워커가 이미지 업로드 후 너비별/형식별 변환본 생성)
+    IMAGE_VARIANT_WIDTHS: List[int] = [320, 640, 1080]  # 원본보다 큰 너비는 건너뜀
+    IMAGE_VARIANT_FORMATS: List[str] = ["webp", "avif"]  # Pillow에서 지원하지 않는 형식은 건너뜀
+    IMAGE_VARIANT_QUALITY: int = 80
+    
+    # Video preview settings (그리드 자동 재생용 짧은 무음 미리보기)
+    VIDEO_PREVIEW_ENABLED: bool = True
+    VIDEO_PREVIEW_SECONDS: float = 3.0
+    VIDEO_PREVIEW_SHORT_SIDE: int = 240  # 짧은 변 기준 해상도 (원본보다 크게 만들지 않음)
+    VIDEO_PREVIEW_FPS: int = 15
+    
+    # HLS settings (미디어 워커에서 비디오를 여러 해상도/비트레이트의 HLS로 변환)
+    HLS_ENABLED: bool = False
+    HLS_LADDER: List[Tuple[int, int]] = [(360, 800), (720, 2500), (1080, 5000)]  # (짧은 변 해상도, 비디오 비트레이트 kbps), 원본보다 큰 해상도는 건너뜀
+    HLS_SEGMENT_SECONDS: int = 4
+    HLS_AUDIO_BITRATE_KBPS: int = 128
+    HLS_X264_PRESET: str = "veryfast"
+    
+    # Media storage settings (미디어 처리 파이프라인의 원본 다운로드, 썸네일/미리보기/변환본/HLS 저장, 삭제 대기열이 사용하는 저장소)
+    MEDIA_STORAGE_BACKEND: str = "s3"  # s3 또는 local (로컬 개발/테스트용)
+    LOCAL_STORAGE_ROOT: str = "./media"  # local 백엔드 사용 시 저장 디렉터리
+    
+    # Media worker settings (업로드 후 크기 확인/썸네일 생성을 백그라운드 프로세스에서 처리)
+    MEDIA_WORKER_ENABLED: bool = True  # API 서버 프로세스에 워커를 내장할지 여부 (False면 python -m app.services.media_worker로 따로 실행)
+    MEDIA_WORKER_PROCESSES: int = 0  # 프로세스 풀 크기 (0이면 CPU 코어 수)
+    MEDIA_WORKER_POLL_SECONDS: float = 2.0  # 대기 작업 폴링 주기
+    MEDIA_JOB_MAX_ATTEMPTS: int = 3
+    MEDIA_JOB_STALE_SECONDS: int = 600  # running 상태로 이 시간이 지나면 다시 처리
+    MEDIA_JOB_RETRY_BASE_SECONDS: int = 60  # 실패 시 재시도 간격 (실패할 때마다 2배)
+    MEDIA_JOB_RETRY_MAX_SECONDS: int = 30 * 60  # 재시도 간격 상한
+    
+    # Storage deletion settings (삭제할 S3 객체를 storage_deletions 테이블에 넣고 백그라운드에서 일괄 삭제)
+    STORAGE_DELETION_ENABLED: bool = True  # API 서버 프로세스에 삭제 스레드를 내장할지 여부 (False면 python -m app.services.storage_deletions로 따로 실행)
+    STORAGE_DELETION_POLL_SECONDS: float = 5.0  # 대기 항목 폴링 주기
+    STORAGE_DELETION_BATCH_SIZE: int = 1000  # 한 번에 가져와 삭제할 항목 수
+    STORAGE_DELETION_LEASE_SECONDS: int = 300  # 가져간 항목을 이 시간 동안 다른 프로세스가 가져가지 않음 (처리 중 죽으면 이후 다시 처리)
+    STORAGE_DELETION_RETRY_BASE_SECONDS: int = 30  # 실패 시 재시도 간격 (실패할 때마다 2배)
+    STORAGE_DELETION_RETRY_MAX_SECONDS: int = 60 * 60  # 재시도 간격 상한
+    
+    # Orphan file GC settings (업로드 후 피드에 첨부되지 않은 파일 정리)
+    ORPHAN_FILE_GC_ENABLED: bool = True  # API 서버 프로세스에서 주기적으로 실행할지 여부 (False면 python -m app.services.orphan_files로 따로 실행)
+    ORPHAN_FILE_TTL_HOURS: int = 24  # 업로드 후 이 시간이 지나도 첨부되지 않으면 삭제
+    ORPHAN_FILE_GC_INTERVAL_SECONDS: int = 60 * 60  # 실행 주기
+    ORPHAN_FILE_GC_CHUNK_SIZE: int = 500  # 한 트랜잭션에서 잠그고 삭제할 파일 수
+    
+    # Count settings
+    TOTAL_COUNT_CACHE_TTL_SECONDS: int = 30  # 전체 피드 수(approximate 모드) 캐시 유지 시간 (exact 모드는 캐시하지 않음)
+    
+    # Response cache settings
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_BACKEND: str = "memory"  # memory (프로세스 내 LRU) 또는 redis (여러 프로세스 공유)
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512  # memory 백엔드 최대 항목 수
+    REDIS_URL: Optional[str] = None  # redis 백엔드 사용 시 연결 URL
+    
     def get_profile_image_url(self, s3_key: str) -> str:
         """프로필 이미지 URL 생성 (항상 IMAGE_BASE_URL 사용)"""
         return f"{self.IMAGE_BASE_URL}/{s3_key}"
     
     @property
     def DATABASE_URL(self) -> str:
-        return f"mysql+pymysql://{self.DB_USERNAME}:{self.DB_PASSWORD}@{self.DB_HOST}/{self.DB_DATABASE}"
+        return f"mysql+pymysql://{self.DB_USERNAME}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_DATABASE}"
+    
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """AsyncSession(aiomysql 드라이버)용 접속 URL"""
+        return f"mysql+aiomysql://{self.DB_USERNAME}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_DATABASE}"
     
     class Config:
         case_sensitive = True
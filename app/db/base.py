@@ -1,13 +1,22 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.engine import create_async_db_engine, create_db_engine
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# 풀 크기/재연결 설정은 Settings의 DB_POOL_* 값을 사용 (app.db.engine)
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔드포인트용 엔진/세션 (스레드 풀을 거치지 않고 이벤트 루프에서 쿼리 실행)
+ASYNC_SQLALCHEMY_DATABASE_URL = settings.ASYNC_DATABASE_URL
+
+async_engine = create_async_db_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
+# 커밋 후 속성 접근 시 암묵적인 지연 로딩(비동기 세션에서는 오류)이 일어나지 않도록 만료하지 않음
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -15,4 +24,8 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,133 @@
+import logging
+import threading
+from typing import Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# poolclass를 직접 지정하면(NullPool 등) 적용하지 않는 풀 크기 관련 옵션
+POOL_SIZING_OPTIONS = ("pool_size", "max_overflow", "pool_timeout")
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 사용량을 이벤트로 집계합니다.
+    현재 대여 중인 커넥션 수와 최대치, 새로 맺은 커넥션 수, 끊겨서 폐기된 커넥션 수 등을 확인할 수 있습니다.
+    """
+
+    def __init__(self, name: str, capacity: Optional[int]):
+        self.name = name
+        self.capacity = capacity  # pool_size + max_overflow (제한 없는 풀이면 None)
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.saturations = 0  # 대여 중인 커넥션이 풀 최대치에 도달한 횟수
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine) -> None:
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            saturated = self.capacity is not None and self.checked_out >= self.capacity
+            if saturated:
+                self.saturations += 1
+        if saturated:
+            logger.warning(
+                f"DB 커넥션 풀({self.name})이 가득 찼습니다: {self.checked_out}/{self.capacity} "
+                f"(추가 요청은 최대 {settings.DB_POOL_TIMEOUT_SECONDS}초 대기)"
+            )
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "saturations": self.saturations,
+            }
+
+
+# 엔진 이름별 풀 사용량 (/api/test/db-pool에서 조회)
+pool_metrics: dict = {}
+
+
+def engine_options(**overrides) -> dict:
+    """Settings의 DB_POOL_* 값으로 create_engine 옵션을 만듭니다. (overrides가 우선)"""
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,  # MySQL wait_timeout보다 짧게 두어 서버가 끊은 커넥션을 쓰지 않음
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,  # 대여 시 커넥션이 살아 있는지 확인하고 끊겼으면 다시 연결
+    }
+    if "poolclass" in overrides:
+        for key in POOL_SIZING_OPTIONS:
+            options.pop(key)
+    options.update(overrides)
+    return options
+
+
+def _register_metrics(name: str, engine: Engine, options: dict) -> None:
+    capacity = None
+    if "poolclass" not in options:
+        capacity = options["pool_size"] + options["max_overflow"]
+    metrics = PoolMetrics(name, capacity)
+    metrics.attach(engine)
+    pool_metrics[name] = metrics
+
+
+def create_db_engine(url: Optional[str] = None, name: str = "sync", **overrides) -> Engine:
+    """
+    앱, Alembic, 스크립트가 함께 쓰는 동기 엔진을 만듭니다.
+    url을 생략하면 settings.DATABASE_URL을 사용합니다.
+    """
+    options = engine_options(**overrides)
+    engine = create_engine(url or settings.DATABASE_URL, **options)
+    _register_metrics(name, engine, options)
+    return engine
+
+
+def create_async_db_engine(url: Optional[str] = None, name: str = "async", **overrides) -> AsyncEngine:
+    """create_db_engine의 비동기 버전 (url을 생략하면 settings.ASYNC_DATABASE_URL 사용)"""
+    options = engine_options(**overrides)
+    engine = create_async_engine(url or settings.ASYNC_DATABASE_URL, **options)
+    _register_metrics(name, engine.sync_engine, options)
+    return engine
+
+
+def get_pool_status(engine: Engine, name: str) -> dict:
+    """풀의 현재 상태(pool.status())와 이벤트로 집계한 사용량을 함께 반환합니다."""
+    metrics = pool_metrics.get(name)
+    return {
+        "pool": engine.pool.status(),
+        **(metrics.snapshot() if metrics else {}),
+    }
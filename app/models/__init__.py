@@ -5,4 +5,9 @@ from app.models.file import File
 from app.models.feed import Feed
 from app.models.feed_like import FeedLike 
 from app.models.comment import Comment
-from app.models.comment_like import CommentLike
\ No newline at end of file
+from app.models.comment_like import CommentLike
+from app.models.counter import Counter
+from app.models.media_job import MediaJob
+from app.models.file_variant import FileVariant
+from app.models.media_object import MediaObject
+from app.models.storage_deletion import StorageDeletion
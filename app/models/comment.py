@@ -11,6 +11,7 @@ class Comment(Base):
     content = Column(String(1000), nullable=False)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     feed_id = Column(Integer, ForeignKey('feeds.id', ondelete='CASCADE'), nullable=False)
+    likes_count = Column(Integer, nullable=False, default=0, server_default='0')  # 좋아요 수 (비정규화)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
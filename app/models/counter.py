@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class Counter(Base):
+    __tablename__ = "counters"
+
+    name = Column(String(50), primary_key=True)  # 카운터 이름 (예: feeds_total)
+    value = Column(BigInteger, nullable=False, default=0, server_default='0')
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -11,9 +11,14 @@ class Feed(Base):
     description = Column(String(1000), nullable=True)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     frame_ratio = Column(Float, nullable=False, server_default='1.0')
+    likes_count = Column(Integer, nullable=False, default=0, server_default='0')  # 좋아요 수 (비정규화)
+    comments_count = Column(Integer, nullable=False, default=0, server_default='0')  # 댓글 수 (비정규화)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # 피드 목록 커서 페이지네이션 (created_at, id) 정렬용 인덱스
+    __table_args__ = (Index('ix_feeds_created_at_id', 'created_at', 'id'),)
+
     # 관계 설정
     user = relationship("User", back_populates="feeds")
     files = relationship("File", back_populates="feed", cascade="all, delete-orphan")
@@ -1,24 +1,58 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
 from datetime import datetime
+from typing import List
 
 class File(Base):
     __tablename__ = "files"
+    __table_args__ = (
+        # 피드에 첨부되지 않은 오래된 업로드를 찾기 위한 인덱스 (고아 파일 정리)
+        Index('ix_files_feed_id_created_at', 'feed_id', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     file_name = Column(String(255), nullable=False)
-    s3_key = Column(String(255), nullable=False)
+    s3_key = Column(String(255), nullable=False, index=True)  # finalize 재시도 확인 시 조회
     s3_key_thumbnail = Column(String(255), nullable=True)  # 썸네일 S3 키 추가
+    s3_key_preview = Column(String(255), nullable=True)  # 자동 재생용 짧은 무음 미리보기(MP4) 키
+    s3_key_hls = Column(String(255), nullable=True)  # HLS 마스터 플레이리스트 키 (세그먼트는 같은 프리픽스 아래 저장)
     content_type = Column(String(100), nullable=False)
     file_size = Column(Integer, nullable=False)
     width = Column(Integer, nullable=True)  # 이미지 너비
     height = Column(Integer, nullable=True)  # 이미지 높이
+    duration = Column(Float, nullable=True)  # 비디오 길이 (초)
+    video_codec = Column(String(50), nullable=True)  # 비디오 코덱 (예: h264, hevc)
+    bitrate = Column(Integer, nullable=True)  # 비디오 비트레이트 (bps)
+    blurhash = Column(String(64), nullable=True)  # 로딩 전 표시할 BlurHash (비디오는 썸네일 기준)
+    dominant_color = Column(String(7), nullable=True)  # 대표 색상 (#rrggbb)
+    processing_status = Column(String(20), nullable=False, default='done', server_default='done')  # pending, processing, done, failed (미디어 처리 상태)
     feed_id = Column(Integer, ForeignKey('feeds.id', ondelete='CASCADE'), nullable=True)
+    media_object_id = Column(Integer, ForeignKey('media_objects.id', ondelete='SET NULL'), nullable=True, index=True)  # 내용이 같은 파일끼리 공유하는 원본 (중복 제거)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # 관계 설정
     feed = relationship("Feed", back_populates="files")
-    profile_user = relationship("User", back_populates="profile_file", foreign_keys="User.profile_file_id")
\ No newline at end of file
+    profile_user = relationship("User", back_populates="profile_file", foreign_keys="User.profile_file_id")
+    # 목록 조회 시 파일마다 따로 조회하지 않도록 selectin으로 한 번에 로드
+    variants = relationship(
+        "FileVariant",
+        back_populates="file",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="FileVariant.width"
+    )
+
+    def storage_keys(self) -> List[str]:
+        """이 파일과 함께 S3에 저장된 모든 객체 키 (원본, 썸네일, 미리보기, 변환본)"""
+        keys = [self.s3_key, self.s3_key_thumbnail, self.s3_key_preview]
+        keys.extend(variant.s3_key for variant in self.variants)
+        return [key for key in keys if key]
+
+    def storage_prefixes(self) -> List[str]:
+        """여러 객체로 저장되어 프리픽스 단위로 삭제해야 하는 경로 (HLS 세그먼트)"""
+        if self.s3_key_hls:
+            return [self.s3_key_hls.rsplit("/", 1)[0] + "/"]
+        return []
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class FileVariant(Base):
+    __tablename__ = "file_variants"
+    __table_args__ = (
+        UniqueConstraint('file_id', 'format', 'width', name='uq_file_variants_file_format_width'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    file_id = Column(Integer, ForeignKey('files.id', ondelete='CASCADE'), nullable=False, index=True)
+    s3_key = Column(String(255), nullable=False)
+    content_type = Column(String(100), nullable=False)
+    format = Column(String(10), nullable=False)  # webp, avif
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    file_size = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 관계 설정
+    file = relationship("File", back_populates="variants")
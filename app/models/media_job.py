@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class MediaJob(Base):
+    __tablename__ = "media_jobs"
+    __table_args__ = (
+        # 대기 중인 작업을 오래된 순서로 가져오기 위한 인덱스
+        Index('ix_media_jobs_status_id', 'status', 'id'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    file_id = Column(Integer, ForeignKey('files.id', ondelete='CASCADE'), nullable=False, index=True)
+    status = Column(String(20), nullable=False, default='pending', server_default='pending')  # pending, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0, server_default='0')
+    last_error = Column(Text, nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)  # 작업을 가져간 시각 (오래되면 다시 가져감)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=True)  # 실패 후 이 시각 이후에 다시 가져감 (지수 백오프, NULL이면 바로)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # 관계 설정
+    file = relationship("File")
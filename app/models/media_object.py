@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class MediaObject(Base):
+    __tablename__ = "media_objects"
+
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), nullable=False, unique=True)  # 원본 내용의 SHA-256 (hex)
+    s3_key = Column(String(255), nullable=False)  # 같은 내용의 파일들이 함께 사용하는 원본 S3 키
+    ref_count = Column(Integer, nullable=False, default=0, server_default='0')  # 이 객체를 사용하는 files 행 수 (0이면 S3 객체 삭제됨)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -0,0 +1,18 @@
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+class StorageDeletion(Base):
+    __tablename__ = "storage_deletions"
+    __table_args__ = (
+        # 재시도 시각이 된 항목을 오래된 순서로 가져오기 위한 인덱스
+        Index('ix_storage_deletions_next_attempt_at_id', 'next_attempt_at', 'id'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    s3_key = Column(String(255), nullable=False)  # 삭제할 S3 키 (is_prefix면 프리픽스)
+    is_prefix = Column(Boolean, nullable=False, default=False, server_default='0')  # HLS처럼 프리픽스 아래 객체를 모두 삭제
+    attempts = Column(Integer, nullable=False, default=0, server_default='0')
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())  # 실패하면 지수 백오프로 뒤로 미룸
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
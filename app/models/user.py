@@ -15,6 +15,7 @@ class User(Base):
     profile_file_id = Column(Integer, ForeignKey('files.id'), nullable=True)
     terms_of_service = Column(Boolean, nullable=False, default=False)
     privacy_policy = Column(Boolean, nullable=False, default=False)
+    feeds_count = Column(Integer, nullable=False, default=0, server_default='0')  # 작성한 피드 수 (비정규화)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
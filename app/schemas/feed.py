@@ -18,6 +18,7 @@ class FeedResponse(FeedBase):
     updated_at: Optional[datetime] = None
     files: List[File] = []
     likes_count: int = 0
+    comments_count: int = 0
 
     # SQLAlchemy ORM 객체를 바로 Pydantic 모델로 변환할 수 있게 해주는 설정
     model_config = {"from_attributes": True}
@@ -34,6 +35,7 @@ class FeedResponseWithLike(FeedResponse):
 class FeedListResponseWithLike(BaseModel):
     feeds: List[FeedResponseWithLike]
     total: int
+    next_cursor: Optional[str] = None # 다음 페이지 조회용 커서 (마지막 페이지면 None)
 
 
 class FeedCreate(FeedBase):
@@ -1,16 +1,44 @@
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, Field, computed_field
 from typing import List, Optional
 from datetime import datetime
 from app.core.config import settings
 
+class FileVariant(BaseModel):
+    """이미지 변환본 (너비별/형식별)"""
+    s3_key: str
+    content_type: str
+    format: str
+    width: int
+    height: int
+    file_size: int
+
+    model_config = {
+        "from_attributes": True
+    }
+
+    @computed_field
+    @property
+    def url(self) -> str:
+        """변환본 URL 생성 (항상 IMAGE_BASE_URL 사용)"""
+        return f"{settings.IMAGE_BASE_URL}/{self.s3_key}"
+
 class FileBase(BaseModel):
     file_name: str
     s3_key: str
     s3_key_thumbnail: Optional[str] = None
+    s3_key_preview: Optional[str] = None
+    s3_key_hls: Optional[str] = None
     content_type: str
     file_size: int
     width: Optional[int] = None
     height: Optional[int] = None
+    duration: Optional[float] = None  # 비디오 길이 (초)
+    video_codec: Optional[str] = None
+    bitrate: Optional[int] = None  # bps
+    blurhash: Optional[str] = None  # 이미지 로딩 전 표시할 BlurHash
+    dominant_color: Optional[str] = None  # 대표 색상 (#rrggbb)
+    processing_status: str = "done"  # pending, processing, done, failed
+    variants: List[FileVariant] = []  # 이미지 변환본 (너비 오름차순)
 
     @computed_field
     @property
@@ -22,6 +50,22 @@ class FileBase(BaseModel):
             # 이미지 또는 기타 파일은 IMAGE_BASE_URL 사용
             return f"{settings.IMAGE_BASE_URL}/{self.s3_key}"
 
+    @computed_field
+    @property
+    def url_preview(self) -> Optional[str]:
+        """자동 재생용 미리보기 URL 생성 (비디오만, STORAGE_BASE_URL 사용)"""
+        if self.s3_key_preview:
+            return f"{settings.STORAGE_BASE_URL}/{self.s3_key_preview}"
+        return None
+
+    @computed_field
+    @property
+    def url_hls(self) -> Optional[str]:
+        """HLS 마스터 플레이리스트 URL 생성 (변환된 비디오만, STORAGE_BASE_URL 사용)"""
+        if self.s3_key_hls:
+            return f"{settings.STORAGE_BASE_URL}/{self.s3_key_hls}"
+        return None
+
     @computed_field
     @property
     def url_thumbnail(self) -> Optional[str]:
@@ -30,6 +74,16 @@ class FileBase(BaseModel):
             return f"{settings.IMAGE_BASE_URL}/{self.s3_key_thumbnail}"
         return None
 
+    @computed_field
+    @property
+    def srcset(self) -> Optional[str]:
+        """
+        WebP 변환본으로 만든 srcset 문자열 (예: "https://.../a_w320.webp 320w, https://.../a_w640.webp 640w")
+        변환본이 없으면 None (원본 url 사용)
+        """
+        candidates = [f"{variant.url} {variant.width}w" for variant in self.variants if variant.format == "webp"]
+        return ", ".join(candidates) if candidates else None
+
 class FileCreate(FileBase):
     pass
 
@@ -49,4 +103,27 @@ class File(FileInDB):
 class FileUploadResponse(BaseModel):
     message: str
     file_urls: List[str]
-    uploaded_files: List[File] 
\ No newline at end of file
+    uploaded_files: List[File] 
+
+class PresignUploadRequest(BaseModel):
+    filename: str
+    content_type: str
+    file_size: int = Field(..., gt=0)
+
+class PresignUploadResponse(BaseModel):
+    upload_token: str  # finalize 요청 시 그대로 전달
+    s3_key: str
+    method: str  # "put" (단일 업로드) 또는 "multipart"
+    url: Optional[str] = None  # 단일 PUT 업로드 URL (Content-Type 헤더 필수)
+    upload_id: Optional[str] = None
+    part_size: Optional[int] = None  # multipart 파트 크기 (마지막 파트 제외)
+    part_urls: List[str] = []  # multipart 파트별 PUT URL (파트 번호 1부터 순서대로)
+    expires_in: int
+
+class UploadedPart(BaseModel):
+    part_number: int
+    etag: str
+
+class FinalizeUploadRequest(BaseModel):
+    upload_token: str
+    parts: Optional[List[UploadedPart]] = None  # multipart 업로드인 경우 필수
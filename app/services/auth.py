@@ -1,13 +1,15 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+import asyncio
 import random
 import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from app.core.config import settings
 from app.models.verify import Verify
 from app.models.user import User
+from app.services.mailer import send_mail
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 import logging
@@ -26,6 +28,9 @@ oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token", aut
 # 비밀번호 암호화 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 전용 스레드 풀 (해시 한 번에 수백 ms가 걸리므로 이벤트 루프 밖에서, 동시 실행 수를 제한해서 실행)
+password_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_CONCURRENCY, thread_name_prefix="bcrypt")
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,8 +47,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
     return pwd_context.verify(plain_password, hashed_password)
 
+async def hash_password_async(password: str) -> str:
+    """비밀번호를 bcrypt 전용 스레드 풀에서 해시화 (이벤트 루프를 막지 않음)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호를 bcrypt 전용 스레드 풀에서 검증 (이벤트 루프를 막지 않음)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, verify_password, plain_password, hashed_password)
+
 def send_verification_email(email: str, verification_code: str, db: Session):
-    """이메일로 인증번호 전송 및 저장"""
+    """인증번호를 저장하고 인증 메일을 전송 큐에 넣습니다. (메일은 백그라운드에서 전송)"""
     try:
         # 기존 인증 코드 삭제
         db.query(Verify).filter(Verify.email == email).delete()
@@ -59,7 +74,6 @@ def send_verification_email(email: str, verification_code: str, db: Session):
 
         # 이메일 전송 로직...
         sender_email = settings.EMAIL_USER
-        sender_password = settings.EMAIL_PASSWORD
         
         message = MIMEMultipart("alternative")
         message["From"] = f"Poestagram <{sender_email}>"
@@ -156,11 +170,8 @@ def send_verification_email(email: str, verification_code: str, db: Session):
         message.attach(text_part)
         message.attach(html_part)
         
-        server = smtplib.SMTP("smtp.gmail.com", 587)
-        server.starttls()
-        server.login(sender_email, sender_password)
-        server.send_message(message)
-        server.quit()
+        # 전송 큐에 넣고 바로 반환 (SMTP 연결/전송/재시도는 발송 스레드에서 처리)
+        send_mail(message)
         
         return True
     except Exception as e:
@@ -168,8 +179,8 @@ def send_verification_email(email: str, verification_code: str, db: Session):
         db.rollback()
         return False
 
-def create_user(db: Session, email: str, username: str, password: str, terms_of_service: bool, privacy_policy: bool):
-    """새로운 사용자 생성"""
+def create_user(db: Session, email: str, username: str, hashed_password: str, terms_of_service: bool, privacy_policy: bool):
+    """새로운 사용자 생성 (비밀번호는 hash_password_async로 미리 해시화해서 전달)"""
     try:
         # 이메일 중복 확인
         if db.query(User).filter(User.email == email).first():
@@ -192,9 +203,6 @@ def create_user(db: Session, email: str, username: str, password: str, terms_of_
         if not verify:
             raise HTTPException(status_code=400, detail="이메일 인증이 필요합니다.")
         
-        # 비밀번호 해시화
-        hashed_password = hash_password(password)
-        
         # 사용자 생성
         user = User(
             email=email,
@@ -335,28 +343,38 @@ def get_optional_current_user_id(token: Optional[str] = Depends(oauth2_scheme_op
         logger.error(f"Unexpected error in get_optional_current_user_id: {e}")
         return None
 
-def reset_password(db: Session, email: str, code: str, new_password: str) -> bool:
-    """사용자 비밀번호를 변경합니다."""
-    try:
-        # 1. 이메일 인증 정보 확인
-        verify_record = db.query(Verify).filter(
-            Verify.email == email,
-            Verify.code == code,
-            Verify.is_verified == True
-        ).first()
+def check_password_reset(db: Session, email: str, code: str) -> User:
+    """
+    비밀번호 변경 요청의 인증 코드와 사용자를 확인하고 사용자를 반환합니다.
+    유효하지 않으면 HTTPException을 발생시키므로, 새 비밀번호를 해시화하기 전에 호출합니다.
+    """
+    # 1. 이메일 인증 정보 확인
+    verify_record = db.query(Verify).filter(
+        Verify.email == email,
+        Verify.code == code,
+        Verify.is_verified == True
+    ).first()
 
-        if not verify_record:
-            logger.warning(f"유효하지 않은 인증 정보 또는 미인증: {email}, code: {code}")
-            raise HTTPException(status_code=400, detail="유효하지 않은 인증 정보이거나 인증되지 않았습니다.")
+    if not verify_record:
+        logger.warning(f"유효하지 않은 인증 정보 또는 미인증: {email}, code: {code}")
+        raise HTTPException(status_code=400, detail="유효하지 않은 인증 정보이거나 인증되지 않았습니다.")
 
-        # 2. 사용자 조회
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            logger.warning(f"비밀번호 변경 요청 - 사용자 없음: {email}")
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    # 2. 사용자 조회
+    user = db.query(User).filter(User.email == email).first()
+    if not user:
+        logger.warning(f"비밀번호 변경 요청 - 사용자 없음: {email}")
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    return user
+
+def reset_password(db: Session, email: str, code: str, hashed_password: str) -> bool:
+    """
+    사용자 비밀번호를 변경합니다. (새 비밀번호는 check_password_reset 확인 후 hash_password_async로 해시화해서 전달)
+    해시화하는 동안 인증 정보가 바뀌었을 수 있으므로 저장 직전에 다시 확인합니다.
+    """
+    try:
+        user = check_password_reset(db, email, code)
 
-        # 3. 새 비밀번호 해시화 및 업데이트
-        hashed_password = hash_password(new_password)
+        # 3. 새 비밀번호로 업데이트
         user.password = hashed_password
         db.commit()
         
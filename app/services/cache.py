@@ -0,0 +1,184 @@
+import logging
+import threading
+from abc import ABC, abstractmethod
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheBackend(ABC):
+    """
+    직렬화된 응답(bytes)을 저장하는 캐시 백엔드 인터페이스.
+
+    각 항목은 태그(예: "feed:12", "user:3")를 가지며, 쓰기 작업 후 관련 태그만 무효화하여
+    영향을 받는 항목만 제거합니다.
+    구현하지 않은 메서드가 있으면 백엔드 생성 시점에 TypeError가 발생합니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, tags: Iterable[str] = (), ttl_seconds: Optional[int] = None) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class NullCacheBackend(ResponseCacheBackend):
+    """캐시를 사용하지 않을 때의 백엔드 (항상 miss)"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, tags: Iterable[str] = (), ttl_seconds: Optional[int] = None) -> None:
+        pass
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class LRUCacheBackend(ResponseCacheBackend):
+    """프로세스 내 LRU 캐시 백엔드 (최대 항목 수 초과 시 가장 오래 사용하지 않은 항목부터 제거)"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[str, Tuple[float, bytes, Set[str]]]" = OrderedDict()
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str) -> None:
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            if item[0] < time.monotonic():
+                self._remove(key)
+                return None
+            self._items.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: bytes, tags: Iterable[str] = (), ttl_seconds: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + (ttl_seconds or self.ttl_seconds)
+        tag_set = set(tags)
+        with self._lock:
+            self._remove(key)
+            self._items[key] = (expires_at, value, tag_set)
+            for tag in tag_set:
+                self._tag_index.setdefault(tag, set()).add(key)
+            while len(self._items) > self.max_entries:
+                oldest_key = next(iter(self._items))
+                self._remove(oldest_key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tag_index.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._tag_index.clear()
+
+
+class RedisCacheBackend(ResponseCacheBackend):
+    """
+    Redis 공유 캐시 백엔드 (여러 uvicorn 워커/서버가 같은 캐시를 사용).
+    태그별로 Redis SET에 캐시 키 목록을 저장하여 태그 단위로 무효화합니다.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int, prefix: str = "poestagram:cache:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis 를 사용하려면 redis 패키지가 필요합니다.") from e
+        self._redis = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._redis.get(self._key(key))
+        except Exception as e:
+            logger.warning(f"응답 캐시 조회 실패 ({key}): {str(e)}")
+            return None
+
+    def set(self, key: str, value: bytes, tags: Iterable[str] = (), ttl_seconds: Optional[int] = None) -> None:
+        ttl = ttl_seconds or self.ttl_seconds
+        try:
+            pipe = self._redis.pipeline()
+            pipe.set(self._key(key), value, ex=ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), self._key(key))
+                pipe.expire(self._tag_key(tag), ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 실패 ({key}): {str(e)}")
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        try:
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                keys = self._redis.smembers(tag_key)
+                pipe = self._redis.pipeline()
+                if keys:
+                    pipe.delete(*keys)
+                pipe.delete(tag_key)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"응답 캐시 무효화 실패 ({list(tags)}): {str(e)}")
+
+    def clear(self) -> None:
+        try:
+            keys = list(self._redis.scan_iter(match=f"{self.prefix}*"))
+            if keys:
+                self._redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"응답 캐시 초기화 실패: {str(e)}")
+
+
+def create_response_cache() -> ResponseCacheBackend:
+    """설정값(RESPONSE_CACHE_*)에 따라 응답 캐시 백엔드를 생성합니다."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return NullCacheBackend()
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        if not settings.REDIS_URL:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis 를 사용하려면 REDIS_URL 설정이 필요합니다.")
+        return RedisCacheBackend(settings.REDIS_URL, settings.RESPONSE_CACHE_TTL_SECONDS)
+    return LRUCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+response_cache = create_response_cache()
@@ -0,0 +1,172 @@
+import logging
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.comment import Comment
+from app.models.comment_like import CommentLike
+from app.models.counter import Counter
+from app.models.feed import Feed
+from app.models.feed_like import FeedLike
+from app.models.user import User
+
+# counters 테이블에서 전체 피드 수를 관리하는 행 이름
+FEEDS_TOTAL_COUNTER = "feeds_total"
+
+logger = logging.getLogger(__name__)
+
+
+def _bounded(column, delta: int):
+    """카운터가 음수로 내려가지 않도록 column + delta 값을 0 이상으로 제한하는 SQL 표현식"""
+    return case((column + delta < 0, 0), else_=column + delta)
+
+
+def adjust_feed_likes_count(db: Session, feed_id: int, delta: int) -> None:
+    """
+    피드의 좋아요 수를 delta만큼 증감합니다.
+    호출한 쪽의 트랜잭션 안에서 원자적인 UPDATE로 실행되므로, 좋아요 행 추가/삭제와 함께 커밋해야 합니다.
+    """
+    db.execute(
+        update(Feed)
+        .where(Feed.id == feed_id)
+        .values(likes_count=_bounded(Feed.likes_count, delta))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_feed_comments_count(db: Session, feed_id: int, delta: int) -> None:
+    """피드의 댓글 수를 delta만큼 증감합니다. (호출한 쪽 트랜잭션에서 커밋)"""
+    db.execute(
+        update(Feed)
+        .where(Feed.id == feed_id)
+        .values(comments_count=_bounded(Feed.comments_count, delta))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_comment_likes_count(db: Session, comment_id: int, delta: int) -> None:
+    """댓글의 좋아요 수를 delta만큼 증감합니다. (호출한 쪽 트랜잭션에서 커밋)"""
+    db.execute(
+        update(Comment)
+        .where(Comment.id == comment_id)
+        .values(likes_count=_bounded(Comment.likes_count, delta))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_feeds_total(db: Session, delta: int) -> None:
+    """전체 피드 수 카운터 행을 delta만큼 증감합니다. (호출한 쪽 트랜잭션에서 커밋)"""
+    db.execute(
+        update(Counter)
+        .where(Counter.name == FEEDS_TOTAL_COUNTER)
+        .values(value=_bounded(Counter.value, delta))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_user_feeds_count(db: Session, user_id: int, delta: int) -> None:
+    """사용자가 작성한 피드 수를 delta만큼 증감합니다. (호출한 쪽 트랜잭션에서 커밋)"""
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(feeds_count=_bounded(User.feeds_count, delta))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def reconcile_counters(db: Session) -> dict:
+    """
+    비정규화된 카운터를 실제 좋아요/댓글/피드 테이블과 비교하여 어긋난 값만 복구합니다.
+
+    사용자 삭제 등 CASCADE로 좋아요/댓글 행이 지워진 경우처럼
+    엔드포인트를 거치지 않은 변경으로 생긴 차이를 바로잡기 위한 용도입니다.
+
+    Returns:
+        dict: 카운터별로 복구된 행 수
+    """
+    feed_likes = (
+        select(func.count())
+        .select_from(FeedLike)
+        .where(FeedLike.feed_id == Feed.id)
+        .scalar_subquery()
+    )
+    feed_comments = (
+        select(func.count())
+        .select_from(Comment)
+        .where(Comment.feed_id == Feed.id)
+        .scalar_subquery()
+    )
+    comment_likes = (
+        select(func.count())
+        .select_from(CommentLike)
+        .where(CommentLike.comment_id == Comment.id)
+        .scalar_subquery()
+    )
+    user_feeds = (
+        select(func.count())
+        .select_from(Feed)
+        .where(Feed.user_id == User.id)
+        .scalar_subquery()
+    )
+
+    try:
+        repaired = {
+            "feeds.likes_count": db.execute(
+                update(Feed)
+                .where(Feed.likes_count != feed_likes)
+                .values(likes_count=feed_likes)
+                .execution_options(synchronize_session=False)
+            ).rowcount,
+            "feeds.comments_count": db.execute(
+                update(Feed)
+                .where(Feed.comments_count != feed_comments)
+                .values(comments_count=feed_comments)
+                .execution_options(synchronize_session=False)
+            ).rowcount,
+            "comments.likes_count": db.execute(
+                update(Comment)
+                .where(Comment.likes_count != comment_likes)
+                .values(likes_count=comment_likes)
+                .execution_options(synchronize_session=False)
+            ).rowcount,
+            "users.feeds_count": db.execute(
+                update(User)
+                .where(User.feeds_count != user_feeds)
+                .values(feeds_count=user_feeds)
+                .execution_options(synchronize_session=False)
+            ).rowcount,
+        }
+
+        # 전체 피드 수 카운터 행 (없으면 생성)
+        feeds_total = db.query(func.count(Feed.id)).scalar()
+        counter = db.query(Counter).filter(Counter.name == FEEDS_TOTAL_COUNTER).with_for_update().first()
+        if counter is None:
+            db.add(Counter(name=FEEDS_TOTAL_COUNTER, value=feeds_total))
+            repaired[f"counters.{FEEDS_TOTAL_COUNTER}"] = 1
+        elif counter.value != feeds_total:
+            counter.value = feeds_total
+            repaired[f"counters.{FEEDS_TOTAL_COUNTER}"] = 1
+        else:
+            repaired[f"counters.{FEEDS_TOTAL_COUNTER}"] = 0
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"카운터 재계산 중 오류 발생: {str(e)}")
+        raise
+
+    logger.info(f"카운터 재계산 완료: {repaired}")
+    return repaired
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.services.counters
+    from app.db.base import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        result = reconcile_counters(db)
+        for name, count in result.items():
+            print(f"{name}: {count}개 행 복구")
+    finally:
+        db.close()
@@ -0,0 +1,94 @@
+import math
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+import jwt
+from fastapi import HTTPException, status
+from jwt import ExpiredSignatureError, InvalidTokenError
+
+from app.core.config import settings
+from app.services.s3 import MB, build_s3_key
+
+logger = logging.getLogger(__name__)
+
+# 업로드 토큰을 로그인 토큰과 구분하기 위한 용도 값
+UPLOAD_TOKEN_PURPOSE = "direct_upload"
+
+# S3 multipart 제한: 마지막 파트를 제외한 최소 파트 크기, 최대 파트 수
+S3_MIN_PART_SIZE = 5 * MB
+S3_MAX_PART_COUNT = 10000
+
+
+def plan_direct_upload(filename: str, content_type: str, file_size: int) -> dict:
+    """
+    직접 업로드할 파일의 S3 키와 업로드 방식을 결정합니다.
+
+    - S3_MULTIPART_THRESHOLD_MB 미만이면 단일 PUT 업로드
+    - 그 이상이면 multipart 업로드 (파트 크기는 S3 제한에 맞게 조정)
+    """
+    if file_size > settings.S3_DIRECT_UPLOAD_MAX_SIZE_MB * MB:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"파일 크기는 {settings.S3_DIRECT_UPLOAD_MAX_SIZE_MB}MB를 넘을 수 없습니다."
+        )
+
+    plan = {
+        "s3_key": build_s3_key(filename, content_type),
+        "multipart": file_size >= settings.S3_MULTIPART_THRESHOLD_MB * MB,
+        "part_size": None,
+        "part_count": None,
+    }
+    if plan["multipart"]:
+        part_size = max(
+            settings.S3_MULTIPART_CHUNKSIZE_MB * MB,
+            S3_MIN_PART_SIZE,
+            math.ceil(file_size / S3_MAX_PART_COUNT)
+        )
+        plan["part_size"] = part_size
+        plan["part_count"] = math.ceil(file_size / part_size)
+    return plan
+
+
+def create_upload_token(
+    user_id: int,
+    s3_key: str,
+    filename: str,
+    content_type: str,
+    file_size: int,
+    upload_id: Optional[str] = None
+) -> str:
+    """
+    finalize 요청에서 업로드 대상 정보를 검증하기 위한 서명된 업로드 토큰을 생성합니다.
+    클라이언트가 s3_key 등을 임의로 바꿔 다른 객체를 등록하지 못하도록 서버가 발급한 값만 신뢰합니다.
+    """
+    payload = {
+        "purpose": UPLOAD_TOKEN_PURPOSE,
+        "user_id": user_id,
+        "s3_key": s3_key,
+        "filename": filename,
+        "content_type": content_type,
+        "file_size": file_size,  # presign 요청 시 선언한 크기 (finalize에서 실제 객체 크기와 비교)
+        "upload_id": upload_id,
+        "exp": datetime.utcnow() + timedelta(seconds=settings.S3_PRESIGN_EXPIRE_SECONDS),
+    }
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
+def decode_upload_token(token: str, user_id: int) -> dict:
+    """
+    업로드 토큰을 검증하고 payload를 반환합니다.
+
+    Raises:
+        HTTPException: 토큰이 만료되었거나, 올바르지 않거나, 다른 사용자가 발급받은 경우
+    """
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    except ExpiredSignatureError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="업로드 토큰이 만료되었습니다.")
+    except InvalidTokenError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 업로드 토큰입니다.")
+
+    if payload.get("purpose") != UPLOAD_TOKEN_PURPOSE or payload.get("user_id") != user_id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 업로드 토큰입니다.")
+    return payload
@@ -0,0 +1,54 @@
+from typing import Iterable, List, Optional
+
+from app.services.cache import response_cache
+
+# offset 방식 피드 목록 페이지 전체에 붙는 태그 (새 피드 생성/삭제 시 위치가 밀리므로 함께 무효화)
+FEED_LIST_OFFSET_TAG = "feeds:offset"
+
+
+def feed_tag(feed_id: int) -> str:
+    return f"feed:{feed_id}"
+
+
+def user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def feed_page_cache_key(cursor: Optional[str], offset: int, limit: int, count_mode: str) -> str:
+    """피드 목록 페이지 캐시 키 (커서 방식이면 cursor+limit, 아니면 offset+limit 기준)"""
+    if cursor:
+        return f"feeds:page:cursor:{cursor}:{limit}:{count_mode}"
+    return f"feeds:page:offset:{offset}:{limit}:{count_mode}"
+
+
+def feed_page_tags(cursor: Optional[str], feed_ids: Iterable[int], user_ids: Iterable[int]) -> List[str]:
+    """
+    피드 목록 페이지에 붙일 태그 목록.
+    페이지에 포함된 피드/작성자 태그와, offset 페이지인 경우 FEED_LIST_OFFSET_TAG를 붙입니다.
+    커서 페이지는 커서 이후(더 오래된) 피드만 담으므로 새 피드가 생겨도 영향을 받지 않습니다.
+    """
+    tags = [feed_tag(feed_id) for feed_id in feed_ids]
+    tags += [user_tag(user_id) for user_id in set(user_ids)]
+    if not cursor:
+        tags.append(FEED_LIST_OFFSET_TAG)
+    return tags
+
+
+def invalidate_on_feed_created() -> None:
+    """새 피드가 생기면 맨 앞부터 위치가 밀리는 offset 페이지만 무효화합니다."""
+    response_cache.invalidate_tags([FEED_LIST_OFFSET_TAG])
+
+
+def invalidate_on_feed_deleted(feed_id: int) -> None:
+    """삭제된 피드를 담은 페이지와 위치가 당겨지는 offset 페이지를 무효화합니다."""
+    response_cache.invalidate_tags([feed_tag(feed_id), FEED_LIST_OFFSET_TAG])
+
+
+def invalidate_feed(feed_id: int) -> None:
+    """좋아요/댓글 수 등 피드 내용이 바뀌었을 때 해당 피드를 담은 페이지만 무효화합니다."""
+    response_cache.invalidate_tags([feed_tag(feed_id)])
+
+
+def invalidate_user(user_id: int) -> None:
+    """프로필 이미지/유저네임 등 작성자 정보가 바뀌었을 때 해당 사용자의 피드를 담은 페이지만 무효화합니다."""
+    response_cache.invalidate_tags([user_tag(user_id)])
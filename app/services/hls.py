@@ -0,0 +1,154 @@
+import logging
+import os
+import subprocess
+import tempfile
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.s3 import get_s3_prefix
+from app.services.storage import MediaStorage, media_storage
+
+logger = logging.getLogger(__name__)
+
+# HLS 마스터 플레이리스트 파일명
+HLS_MASTER_PLAYLIST = "master.m3u8"
+
+HLS_CONTENT_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".ts": "video/mp2t",
+}
+
+
+def _even(value: float) -> int:
+    """H.264(yuv420p)는 가로/세로가 짝수여야 하므로 가장 가까운 짝수로 맞춥니다."""
+    return max(2, int(round(value / 2)) * 2)
+
+
+def plan_hls_ladder(width: int, height: int) -> List[Tuple[int, int, int]]:
+    """
+    HLS_LADDER 중 원본보다 크지 않은 단계만 골라 (가로, 세로, 비트레이트 kbps) 목록을 반환합니다.
+    단계의 해상도는 짧은 변 기준이므로 세로 영상도 같은 화질 단계를 가집니다.
+    원본이 가장 낮은 단계보다 작으면 원본 크기 그대로 가장 낮은 비트레이트로 한 단계만 만듭니다.
+    """
+    short_side = min(width, height)
+    ladder = sorted(settings.HLS_LADDER)
+    renditions = []
+    for target_short_side, bitrate_kbps in ladder:
+        if target_short_side > short_side:
+            continue
+        scale = target_short_side / short_side
+        renditions.append((_even(width * scale), _even(height * scale), bitrate_kbps))
+
+    if not renditions and ladder:
+        renditions.append((_even(width), _even(height), ladder[0][1]))
+    return renditions
+
+
+def transcode_to_hls(
+    video_path: str,
+    output_dir: str,
+    renditions: List[Tuple[int, int, int]],
+    has_audio: bool
+) -> str:
+    """
+    ffmpeg 한 번으로 원본을 한 번만 디코딩해 여러 해상도로 나누고(split) HLS로 인코딩합니다.
+
+    - 모든 단계의 키프레임을 HLS_SEGMENT_SECONDS 간격으로 맞춰 화질 전환 시 끊김이 없게 합니다.
+    - ffmpeg가 회전 메타데이터를 자동 적용하므로 renditions의 크기는 회전이 반영된 크기입니다.
+
+    Returns:
+        str: 생성된 마스터 플레이리스트 경로 (output_dir/master.m3u8)
+
+    Raises:
+        RuntimeError: ffmpeg가 실패한 경우
+    """
+    count = len(renditions)
+    segment_seconds = settings.HLS_SEGMENT_SECONDS
+
+    filter_graph = f"[0:v]split={count}" + "".join(f"[s{index}]" for index in range(count)) + ";"
+    filter_graph += ";".join(
+        f"[s{index}]scale={width}:{height}[v{index}]"
+        for index, (width, height, _) in enumerate(renditions)
+    )
+
+    cmd = ['ffmpeg', '-v', 'error', '-y', '-i', video_path, '-filter_complex', filter_graph]
+    for index in range(count):
+        cmd += ['-map', f'[v{index}]']
+        if has_audio:
+            cmd += ['-map', '0:a:0']
+
+    cmd += [
+        '-c:v', 'libx264',
+        '-preset', settings.HLS_X264_PRESET,
+        '-pix_fmt', 'yuv420p',
+        '-sc_threshold', '0',
+        '-force_key_frames', f"expr:gte(t,n_forced*{segment_seconds})",
+    ]
+    for index, (_, _, bitrate_kbps) in enumerate(renditions):
+        cmd += [
+            f'-b:v:{index}', f'{bitrate_kbps}k',
+            f'-maxrate:v:{index}', f'{int(bitrate_kbps * 1.1)}k',
+            f'-bufsize:v:{index}', f'{bitrate_kbps * 2}k',
+        ]
+    if has_audio:
+        cmd += ['-c:a', 'aac', '-b:a', f'{settings.HLS_AUDIO_BITRATE_KBPS}k', '-ac', '2']
+
+    stream_map = " ".join(
+        f"v:{index},a:{index}" if has_audio else f"v:{index}"
+        for index in range(count)
+    )
+    cmd += [
+        '-f', 'hls',
+        '-hls_time', str(segment_seconds),
+        '-hls_playlist_type', 'vod',
+        '-hls_flags', 'independent_segments',
+        '-hls_segment_filename', os.path.join(output_dir, 'v%v', 'segment_%03d.ts'),
+        '-master_pl_name', HLS_MASTER_PLAYLIST,
+        '-var_stream_map', stream_map,
+        os.path.join(output_dir, 'v%v', 'index.m3u8'),
+    ]
+
+    logger.info(f"HLS 변환 시작: {video_path} ({', '.join(f'{w}x{h}@{b}k' for w, h, b in renditions)})")
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg HLS 변환 실패: {result.stderr.decode(errors='ignore').strip()}")
+    return os.path.join(output_dir, HLS_MASTER_PLAYLIST)
+
+
+def build_hls_prefix(source_s3_key: str) -> str:
+    """원본 키를 기준으로 HLS 결과를 저장할 프리픽스를 만듭니다. (예: poestagram/videos/hls/20231201_120000_video/)"""
+    stem = os.path.splitext(os.path.basename(source_s3_key))[0]
+    return f"{get_s3_prefix('video/')}/hls/{stem}/"
+
+
+def create_hls_rendition(
+    video_path: str,
+    source_s3_key: str,
+    width: int,
+    height: int,
+    has_audio: bool,
+    storage: Optional[MediaStorage] = None
+) -> str:
+    """
+    비디오를 HLS로 변환하여 저장소에 올리고 마스터 플레이리스트 키를 반환합니다.
+    업로드 중 실패하면 이미 올라간 객체를 프리픽스 단위로 삭제하고 예외를 다시 발생시킵니다.
+    """
+    storage = storage or media_storage
+    prefix = build_hls_prefix(source_s3_key)
+    renditions = plan_hls_ladder(width, height)
+
+    with tempfile.TemporaryDirectory(prefix="hls-") as output_dir:
+        transcode_to_hls(video_path, output_dir, renditions, has_audio)
+        try:
+            for directory, _, filenames in os.walk(output_dir):
+                for filename in filenames:
+                    local_path = os.path.join(directory, filename)
+                    key = prefix + os.path.relpath(local_path, output_dir).replace(os.sep, "/")
+                    content_type = HLS_CONTENT_TYPES.get(os.path.splitext(filename)[1], "application/octet-stream")
+                    storage.put_file(local_path, key, content_type)
+        except Exception:
+            storage.delete_prefix(prefix)
+            raise
+
+    logger.info(f"HLS 변환 완료: {prefix}{HLS_MASTER_PLAYLIST}")
+    return prefix + HLS_MASTER_PLAYLIST
@@ -0,0 +1,228 @@
+import logging
+import struct
+from typing import BinaryIO, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (width, height, EXIF orientation) - 회전은 아직 반영하지 않은 원본 크기
+ImageHeader = Tuple[int, int, int]
+
+# JPEG에서 크기 정보를 담은 SOF 마커 (DHT, JPG, DAC 제외)
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+# EXIF Orientation 태그
+EXIF_ORIENTATION_TAG = 0x0112
+
+# HEIF 계열 ftyp 브랜드
+HEIF_BRANDS = {b"heic", b"heix", b"heim", b"heis", b"hevc", b"hevx", b"mif1", b"msf1", b"avif"}
+
+# 헤더를 찾기 위해 건너뛸 수 있는 최대 범위 (손상된 파일에서 끝없이 읽지 않도록 제한)
+MAX_HEADER_SCAN_BYTES = 4 * 1024 * 1024
+
+
+def probe_image_header(fp: BinaryIO) -> Optional[ImageHeader]:
+    """
+    이미지 파일의 헤더만 읽어 (width, height, orientation)을 반환합니다.
+
+    픽셀 데이터는 읽지 않고, 크기/회전 정보가 있는 구간만 seek으로 찾아 읽습니다.
+    JPEG, PNG, GIF, WebP, HEIC(HEIF)를 지원하며, 형식을 알 수 없거나 해석에 실패하면 None을 반환합니다.
+    호출 후 파일 위치는 처음으로 되돌립니다.
+    """
+    try:
+        fp.seek(0)
+        head = fp.read(32)
+        if head.startswith(b"\xff\xd8"):
+            return _probe_jpeg(fp)
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return width, height, 1
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            width, height = struct.unpack("<HH", head[6:10])
+            return width, height, 1
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return _probe_webp(head)
+        if head[4:8] == b"ftyp" and head[8:12] in HEIF_BRANDS:
+            return _probe_heif(fp)
+        return None
+    except (struct.error, ValueError, OSError) as e:
+        logger.warning(f"이미지 헤더 해석 실패: {str(e)}")
+        return None
+    finally:
+        fp.seek(0)
+
+
+def _read_exact(fp: BinaryIO, size: int) -> bytes:
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError("파일이 예상보다 짧습니다")
+    return data
+
+
+def _probe_jpeg(fp: BinaryIO) -> Optional[ImageHeader]:
+    """JPEG 마커를 따라가며 APP1(EXIF)의 Orientation과 SOF의 크기를 읽습니다."""
+    fp.seek(2)
+    orientation = 1
+    while fp.tell() < MAX_HEADER_SCAN_BYTES:
+        marker = _read_exact(fp, 2)
+        if marker[0] != 0xFF:
+            return None
+        marker_type = marker[1]
+        if marker_type == 0xFF:
+            # 채움 바이트
+            fp.seek(-1, 1)
+            continue
+        if marker_type in (0xD8, 0x01) or 0xD0 <= marker_type <= 0xD7:
+            # 길이 없는 마커
+            continue
+        if marker_type in (0xD9, 0xDA):
+            # EOI / SOS 이전에 SOF가 없으면 해석 불가
+            return None
+
+        length = struct.unpack(">H", _read_exact(fp, 2))[0]
+        if length < 2:
+            return None
+        if marker_type in JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", _read_exact(fp, 5)[1:5])
+            return width, height, orientation
+        if marker_type == 0xE1 and orientation == 1:
+            segment = _read_exact(fp, length - 2)
+            if segment.startswith(b"Exif\x00\x00"):
+                orientation = _parse_exif_orientation(segment[6:])
+            continue
+        fp.seek(length - 2, 1)
+    return None
+
+
+def _parse_exif_orientation(tiff: bytes) -> int:
+    """TIFF 형식 EXIF 블록의 IFD0에서 Orientation 값을 찾습니다. (없으면 1)"""
+    if tiff[:2] == b"II":
+        endian = "<"
+    elif tiff[:2] == b"MM":
+        endian = ">"
+    else:
+        return 1
+    ifd_offset = struct.unpack(endian + "I", tiff[4:8])[0]
+    entry_count = struct.unpack(endian + "H", tiff[ifd_offset:ifd_offset + 2])[0]
+    for index in range(entry_count):
+        entry = ifd_offset + 2 + index * 12
+        tag = struct.unpack(endian + "H", tiff[entry:entry + 2])[0]
+        if tag == EXIF_ORIENTATION_TAG:
+            return struct.unpack(endian + "H", tiff[entry + 8:entry + 10])[0]
+    return 1
+
+
+def _probe_webp(head: bytes) -> Optional[ImageHeader]:
+    """WebP의 첫 청크(VP8, VP8L, VP8X)에서 크기를 읽습니다."""
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF, 1
+    if chunk == b"VP8L":
+        bits = struct.unpack("<I", head[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, 1
+    if chunk == b"VP8X":
+        if head[20] & 0x08:
+            # EXIF가 포함된 경우 Orientation은 파일 끝 쪽 청크에 있으므로 PIL에 맡김
+            return None
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return width, height, 1
+    return None
+
+
+def _iter_boxes(fp: BinaryIO, end: int):
+    """ISO BMFF 박스를 (타입, 내용 시작 위치, 박스 끝 위치)로 순회합니다."""
+    while fp.tell() + 8 <= end:
+        start = fp.tell()
+        size, box_type = struct.unpack(">I4s", _read_exact(fp, 8))
+        if size == 1:
+            size = struct.unpack(">Q", _read_exact(fp, 8))[0]
+        elif size == 0:
+            size = end - start
+        if size < 8:
+            return
+        box_end = start + size
+        yield box_type, fp.tell(), box_end
+        fp.seek(box_end)
+
+
+def _probe_heif(fp: BinaryIO) -> Optional[ImageHeader]:
+    """
+    HEIF의 meta 박스에서 대표 이미지(pitm)에 연결된 ispe(크기)와 irot(회전) 속성을 읽습니다.
+    irot은 반시계 방향 회전이며, EXIF Orientation으로 바꿔서 반환합니다. (90 → 8, 180 → 3, 270 → 6)
+    """
+    fp.seek(0, 2)
+    file_end = fp.tell()
+    fp.seek(0)
+
+    for box_type, start, box_end in _iter_boxes(fp, min(file_end, MAX_HEADER_SCAN_BYTES)):
+        if box_type != b"meta":
+            continue
+        # meta는 FullBox (version/flags 4바이트)
+        fp.seek(start + 4)
+        primary_item_id = None
+        properties = []
+        associations = {}
+        for child_type, child_start, child_end in _iter_boxes(fp, box_end):
+            if child_type == b"pitm":
+                version = _read_exact(fp, 4)[0]
+                primary_item_id = struct.unpack(">H" if version == 0 else ">I", _read_exact(fp, 2 if version == 0 else 4))[0]
+            elif child_type == b"iprp":
+                properties, associations = _read_item_properties(fp, child_end)
+        return _resolve_heif_header(primary_item_id, properties, associations)
+    return None
+
+
+def _read_item_properties(fp: BinaryIO, end: int):
+    """iprp 박스에서 속성 목록(ipco)과 항목별 속성 연결(ipma)을 읽습니다."""
+    properties = []
+    associations = {}
+    for box_type, start, box_end in _iter_boxes(fp, end):
+        if box_type == b"ipco":
+            for prop_type, prop_start, prop_end in _iter_boxes(fp, box_end):
+                if prop_type == b"ispe":
+                    width, height = struct.unpack(">II", _read_exact(fp, 12)[4:12])
+                    properties.append(("ispe", (width, height)))
+                elif prop_type == b"irot":
+                    properties.append(("irot", _read_exact(fp, 1)[0] & 0x03))
+                else:
+                    properties.append((None, None))
+        elif box_type == b"ipma":
+            header = _read_exact(fp, 4)
+            version, flags = header[0], int.from_bytes(header[1:4], "big")
+            entry_count = struct.unpack(">I", _read_exact(fp, 4))[0]
+            for _ in range(entry_count):
+                item_id = struct.unpack(">H" if version < 1 else ">I", _read_exact(fp, 2 if version < 1 else 4))[0]
+                count = _read_exact(fp, 1)[0]
+                indexes = []
+                for _ in range(count):
+                    if flags & 1:
+                        indexes.append(struct.unpack(">H", _read_exact(fp, 2))[0] & 0x7FFF)
+                    else:
+                        indexes.append(_read_exact(fp, 1)[0] & 0x7F)
+                associations[item_id] = indexes
+    return properties, associations
+
+
+def _resolve_heif_header(primary_item_id, properties, associations) -> Optional[ImageHeader]:
+    # 속성 인덱스는 1부터 시작 (0은 연결 없음)
+    primary = [
+        properties[index - 1]
+        for index in associations.get(primary_item_id, [])
+        if 0 < index <= len(properties)
+    ]
+    sizes = [value for kind, value in primary if kind == "ispe"]
+    if not sizes:
+        # 대표 이미지 연결을 찾지 못하면 가장 큰 ispe를 사용 (썸네일보다 원본이 큼)
+        sizes = sorted(
+            (value for kind, value in properties if kind == "ispe"),
+            key=lambda size: size[0] * size[1],
+            reverse=True
+        )
+    if not sizes:
+        return None
+
+    rotation = next((value for kind, value in primary if kind == "irot"), 0)
+    orientation = {0: 1, 1: 8, 2: 3, 3: 6}[rotation]
+    width, height = sizes[0]
+    return width, height, orientation
@@ -0,0 +1,103 @@
+import io
+import logging
+import os
+from typing import List, Optional
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+from app.services.s3 import build_s3_key
+from app.services.storage import MediaStorage, media_storage
+
+logger = logging.getLogger(__name__)
+
+# 변환본 형식별 (PIL 저장 형식, 확장자, MIME 타입)
+VARIANT_FORMATS = {
+    "webp": ("WEBP", "webp", "image/webp"),
+    "avif": ("AVIF", "avif", "image/avif"),
+}
+
+
+def supported_variant_formats() -> List[str]:
+    """
+    설정된 변환본 형식 중 현재 Pillow로 저장할 수 있는 형식만 반환합니다.
+    AVIF는 Pillow 빌드(또는 pillow-avif-plugin 설치)에 따라 지원되지 않을 수 있습니다.
+    """
+    try:
+        # AVIF 플러그인이 설치되어 있으면 import 시 Pillow에 등록됨
+        import pillow_avif  # noqa: F401
+    except ImportError:
+        pass
+    Image.init()
+
+    formats = []
+    for name in settings.IMAGE_VARIANT_FORMATS:
+        if name not in VARIANT_FORMATS:
+            logger.warning(f"알 수 없는 이미지 변환 형식: {name}")
+            continue
+        if VARIANT_FORMATS[name][0] not in Image.SAVE:
+            continue
+        formats.append(name)
+    return formats
+
+
+def generate_image_variants(image_path: str, file_name: str, storage: Optional[MediaStorage] = None) -> List[dict]:
+    """
+    원본 이미지를 IMAGE_VARIANT_WIDTHS 너비별, 지원되는 형식별로 변환해 저장소에 올리고 변환본 정보를 반환합니다.
+
+    - 원본보다 큰 너비로는 확대하지 않습니다.
+    - EXIF 회전을 적용한 뒤 리사이즈하므로 변환본에는 회전 정보가 필요 없습니다.
+    - 중간에 실패하면 이미 업로드한 변환본을 삭제하고 예외를 다시 발생시킵니다.
+
+    Returns:
+        List[dict]: [{"s3_key", "content_type", "format", "width", "height", "file_size"}, ...]
+    """
+    formats = supported_variant_formats()
+    if not formats:
+        return []
+
+    storage = storage or media_storage
+    with Image.open(image_path) as image:
+        widths = sorted(
+            {width for width in settings.IMAGE_VARIANT_WIDTHS if width > 0},
+            reverse=True
+        )
+        # JPEG는 필요한 최대 크기에 가깝게 축소하면서 디코딩 (원본 해상도 전체를 디코딩하지 않음)
+        if widths:
+            image.draft("RGB", (widths[0], widths[0]))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+        original_width, original_height = image.size
+        stem = os.path.splitext(file_name)[0]
+        variants = []
+        try:
+            for width in widths:
+                if width >= original_width:
+                    continue
+                height = max(1, round(original_height * width / original_width))
+                resized = image.resize((width, height), Image.LANCZOS)
+                for name in formats:
+                    pil_format, extension, content_type = VARIANT_FORMATS[name]
+                    buffer = io.BytesIO()
+                    resized.save(buffer, pil_format, quality=settings.IMAGE_VARIANT_QUALITY)
+                    s3_key = build_s3_key(f"{stem}_w{width}.{extension}", content_type)
+                    file_size = buffer.tell()
+                    buffer.seek(0)
+                    storage.put_file(buffer, s3_key, content_type)
+                    variants.append({
+                        "s3_key": s3_key,
+                        "content_type": content_type,
+                        "format": name,
+                        "width": width,
+                        "height": height,
+                        "file_size": file_size,
+                    })
+        except Exception:
+            for variant in variants:
+                storage.delete_file(variant["s3_key"])
+            raise
+
+    logger.info(f"이미지 변환본 생성 완료: {file_name} ({len(variants)}개)")
+    return variants
@@ -0,0 +1,173 @@
+import logging
+import queue
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from email.message import Message
+from typing import List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 큐가 비었을 때 기다리는 시간 (재시도 시각 확인, 유휴 연결 정리 주기)
+MAIL_POLL_SECONDS = 0.5
+
+# 연결을 다시 맺고 재시도하면 성공할 수 있는 오류 (연결 끊김, 4xx 응답 등)
+TRANSIENT_SMTP_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    smtplib.SMTPHeloError,
+    OSError,
+)
+
+
+@dataclass
+class OutgoingMail:
+    message: Message
+    attempts: int = 0
+    not_before: float = 0.0  # 재시도 시 이 시각(time.monotonic) 이후에 전송
+
+
+def _is_transient(error: Exception) -> bool:
+    """재시도할 만한 오류인지 판단합니다. (SMTP 4xx 응답은 일시적 오류, 5xx는 영구 오류)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, TRANSIENT_SMTP_ERRORS)
+
+
+class MailSender:
+    """
+    메일을 메모리 큐에 넣고 백그라운드 스레드에서 전송하는 발송기
+
+    - 인증(STARTTLS, 로그인)을 마친 SMTP 연결을 유지하며 여러 메일을 같은 연결로 보냅니다.
+    - 큐에 쌓인 메일은 MAIL_BATCH_SIZE개씩 꺼내 한 번에 보내고, MAIL_IDLE_TIMEOUT_SECONDS 동안 보낼 메일이 없으면 연결을 닫습니다.
+    - 연결 끊김이나 4xx 응답 같은 일시적 오류는 다시 연결해서 MAIL_MAX_ATTEMPTS까지 재시도하고, 5xx 응답은 버립니다.
+    - SMTP_HOST/SMTP_PORT/SMTP_USE_TLS로 로컬 SMTP 서버(테스트용)에도 보낼 수 있습니다.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[OutgoingMail]" = queue.Queue()
+        self._retry: List[OutgoingMail] = []
+        self._connection: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="mail-sender", daemon=True)
+            self._thread.start()
+        logger.info(f"메일 발송 스레드 시작 ({settings.SMTP_HOST}:{settings.SMTP_PORT})")
+
+    def enqueue(self, message: Message) -> None:
+        """메일을 전송 큐에 넣고 바로 반환합니다. (발송 스레드가 없으면 시작)"""
+        self.start()
+        self._queue.put(OutgoingMail(message=message))
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """큐에 남은 메일을 보낸 뒤(재시도 대기 중인 메일은 제외) 발송 스레드를 종료합니다."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout or settings.MAIL_SHUTDOWN_TIMEOUT_SECONDS)
+        self._thread = None
+        if self._retry or not self._queue.empty():
+            logger.warning(f"보내지 못한 메일 {len(self._retry) + self._queue.qsize()}건이 남은 채로 종료합니다.")
+        logger.info("메일 발송 스레드 종료")
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._send_batch(batch)
+                continue
+            if self._stopping.is_set() and self._queue.empty():
+                break
+            if self._connection is not None and time.monotonic() - self._last_used > settings.MAIL_IDLE_TIMEOUT_SECONDS:
+                self._disconnect()
+        self._disconnect()
+
+    def _next_batch(self) -> List[OutgoingMail]:
+        """전송할 메일을 최대 MAIL_BATCH_SIZE개 꺼냅니다. 없으면 잠시 기다립니다."""
+        now = time.monotonic()
+        batch, waiting = [], []
+        for mail in self._retry:
+            if mail.not_before <= now and len(batch) < settings.MAIL_BATCH_SIZE:
+                batch.append(mail)
+            else:
+                waiting.append(mail)
+        self._retry = waiting
+
+        while len(batch) < settings.MAIL_BATCH_SIZE:
+            try:
+                if batch:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=MAIL_POLL_SECONDS))
+            except queue.Empty:
+                break
+        return batch
+
+    def _connect(self) -> smtplib.SMTP:
+        if self._connection is not None:
+            return self._connection
+        connection = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS)
+        try:
+            if settings.SMTP_USE_TLS:
+                connection.starttls()
+            if settings.EMAIL_USER:
+                connection.login(settings.EMAIL_USER, settings.EMAIL_PASSWORD)
+        except Exception:
+            connection.close()
+            raise
+        self._connection = connection
+        # 첫 메일이 거부되어도 유휴 연결로 판단해 바로 닫지 않도록 연결 시각부터 계산
+        self._last_used = time.monotonic()
+        return connection
+
+    def _disconnect(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.quit()
+        except Exception:
+            self._connection.close()
+        self._connection = None
+
+    def _send_batch(self, batch: List[OutgoingMail]) -> None:
+        """같은 연결로 메일을 차례로 보내고, 실패한 메일은 재시도 목록에 넣거나 버립니다."""
+        for mail in batch:
+            mail.attempts += 1
+            try:
+                self._connect().send_message(mail.message)
+                self._last_used = time.monotonic()
+                logger.info(f"메일 전송 완료: {mail.message['To']}")
+            except Exception as e:
+                if not isinstance(e, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)):
+                    # 서버가 정상적으로 응답한 거부가 아니면 연결 상태를 알 수 없으므로 다음 전송 때 새로 연결
+                    # (SMTPException은 OSError의 하위 클래스이므로 TRANSIENT_SMTP_ERRORS로 구분할 수 없음)
+                    self._disconnect()
+                if _is_transient(e) and mail.attempts < settings.MAIL_MAX_ATTEMPTS:
+                    delay = settings.MAIL_RETRY_BASE_SECONDS * (2 ** (mail.attempts - 1))
+                    mail.not_before = time.monotonic() + delay
+                    self._retry.append(mail)
+                    logger.warning(f"메일 전송 실패, {delay}초 후 재시도 ({mail.attempts}회): {mail.message['To']}, {str(e)}")
+                else:
+                    logger.error(f"메일 전송 실패 ({mail.attempts}회 시도): {mail.message['To']}, {str(e)}")
+
+
+# API 서버 프로세스의 메일 발송기 (첫 메일이 들어오면 발송 스레드를 시작하고 lifespan 종료 시 정리)
+mail_sender = MailSender()
+
+
+def send_mail(message: Message) -> None:
+    """메일을 전송 큐에 넣습니다. 전송은 백그라운드에서 진행되므로 요청을 기다리게 하지 않습니다."""
+    mail_sender.enqueue(message)
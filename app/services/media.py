@@ -1,19 +1,38 @@
+import hashlib
+import io
 import logging
 import re
 from PIL import Image
-import io
-from moviepy.editor import VideoFileClip
 import tempfile
 import os
 from fastapi import UploadFile
-import cv2
-import numpy as np
-from tempfile import SpooledTemporaryFile
 import subprocess
 import json
+from dataclasses import dataclass
+from typing import BinaryIO
+from app.services.image_probe import probe_image_header
+from app.services.placeholder import compute_placeholder_from_file
 
 logger = logging.getLogger(__name__)
 
+# 업로드 파일을 청크 단위로 읽을 때 한 번에 읽는 크기 (1MB, 해시 계산 등)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# ffmpeg mjpeg 품질 (2~31, 낮을수록 고품질)
+THUMBNAIL_JPEG_QUALITY = 3
+
+def compute_sha256(fp: BinaryIO) -> str:
+    """파일 객체를 청크 단위로 읽어 SHA-256(hex)을 계산합니다. (전체를 메모리에 올리지 않음)"""
+    digest = hashlib.sha256()
+    fp.seek(0)
+    while True:
+        chunk = fp.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+    fp.seek(0)
+    return digest.hexdigest()
+
 def split_file_url(file_url: str) -> tuple:
     """
     파일 URL을 base_url과 s3_key로 분리합니다.
@@ -26,34 +45,58 @@ def split_file_url(file_url: str) -> tuple:
         return base_url, s3_key
     return file_url, ""  # 분리 실패 시 기본값
 
+def _apply_orientation(width: int, height: int, orientation: int) -> tuple:
+    """
+    EXIF Orientation 값에 따라 width, height를 교환합니다.
+    5, 6, 7, 8 (90도 또는 270도 회전)인 경우 교환
+    """
+    if orientation in [5, 6, 7, 8]:
+        logger.info(f"이미지 EXIF Orientation: {orientation}, width/height 교환")
+        return height, width
+    logger.info(f"이미지 EXIF Orientation: {orientation}, width/height 교환 안 함")
+    return width, height
+
+def _get_oriented_image_size(image: Image.Image) -> tuple:
+    """
+    열린 이미지의 width, height를 반환합니다. (EXIF rotation 정보 고려)
+    """
+    width, height = image.size
+    
+    # EXIF 데이터에서 rotation 정보 확인
+    try:
+        exif = image.getexif()
+        orientation = exif.get(274, 1)  # 274는 Orientation 태그
+        return _apply_orientation(width, height, orientation)
+    except Exception as exif_e:
+        logger.warning(f"EXIF 데이터 읽기 오류: {str(exif_e)}")
+        # EXIF 오류가 있어도 기본 크기는 반환
+    
+    return width, height
+
+def _get_image_fileobj_dimensions(fp: BinaryIO) -> tuple:
+    """
+    파일 객체에서 헤더만 읽어 이미지 크기를 반환합니다. (EXIF rotation 정보 고려)
+    직접 해석하지 못하는 형식은 PIL의 지연 로딩(Image.open은 헤더만 읽음)으로 확인합니다.
+    """
+    header = probe_image_header(fp)
+    if header is not None:
+        width, height, orientation = header
+        return _apply_orientation(width, height, orientation)
+
+    fp.seek(0)
+    try:
+        with Image.open(fp) as image:
+            return _get_oriented_image_size(image)
+    finally:
+        fp.seek(0)
+
 async def get_image_dimensions(file: UploadFile) -> tuple:
     """
     이미지 파일의 크기 정보를 반환합니다. (EXIF rotation 정보 고려)
+    파일 전체를 읽지 않고 업로드 파일 객체에서 헤더 부분만 읽습니다.
     """
     try:
-        # 파일 내용을 메모리에 로드
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents))
-        width, height = image.size
-        
-        # EXIF 데이터에서 rotation 정보 확인
-        try:
-            exif = image.getexif()
-            orientation = exif.get(274, 1)  # 274는 Orientation 태그
-            
-            # Orientation 값에 따라 width, height 교환
-            # 5, 6, 7, 8 (90도 또는 270도 회전)인 경우 교환
-            if orientation in [5, 6, 7, 8]:
-                logger.info(f"이미지 EXIF Orientation: {orientation}, width/height 교환")
-                width, height = height, width
-            else:
-                logger.info(f"이미지 EXIF Orientation: {orientation}, width/height 교환 안 함")
-                
-        except Exception as exif_e:
-            logger.warning(f"EXIF 데이터 읽기 오류: {str(exif_e)}")
-            # EXIF 오류가 있어도 기본 크기는 반환
-        
-        return width, height
+        return _get_image_fileobj_dimensions(file.file)
     except Exception as e:
         logger.warning(f"이미지 크기 확인 중 오류 발생: {str(e)}")
         return None, None
@@ -61,27 +104,83 @@ async def get_image_dimensions(file: UploadFile) -> tuple:
         # 파일 포인터를 처음 위치로 되돌림
         await file.seek(0)
 
-async def get_video_dimensions_with_rotation(file: UploadFile) -> tuple:
+def get_image_file_dimensions(image_path: str) -> tuple:
     """
-    비디오 파일의 width, height를 반환합니다. (회전 정보 고려하여 최종 크기 반환)
+    디스크에 있는 이미지 파일의 크기 정보를 반환합니다. (EXIF rotation 정보 고려)
+    헤더만 읽으므로 픽셀 데이터는 디코딩하지 않습니다.
+    """
+    try:
+        with open(image_path, 'rb') as fp:
+            return _get_image_fileobj_dimensions(fp)
+    except Exception as e:
+        logger.warning(f"이미지 크기 확인 중 오류 발생: {str(e)}")
+        return None, None
+
+@dataclass
+class MediaAnalysis:
+    """analyze_media 결과 (확인하지 못한 값은 None)"""
+    width: int | None = None  # 회전이 반영된 최종 너비
+    height: int | None = None  # 회전이 반영된 최종 높이
+    rotation: int = 0  # 0, 90, 180, 270
+    duration: float | None = None  # 초
+    video_codec: str | None = None  # 예: h264, hevc
+    bitrate: int | None = None  # bps
+    has_audio: bool = False
+    thumbnail: bytes | None = None  # JPEG 썸네일 (비디오만)
+    blurhash: str | None = None  # 이미지(비디오는 썸네일) 로딩 전 표시할 BlurHash
+    dominant_color: str | None = None  # 대표 색상 (#rrggbb)
+
+
+def _parse_rotation(stream: dict) -> int:
+    """ffprobe 스트림 정보에서 회전 각도(0~359)를 찾습니다."""
+    rotation = 0
+    
+    # 1. side_data에서 rotation 확인
+    if 'side_data_list' in stream:
+        for side_data in stream['side_data_list']:
+            if side_data.get('side_data_type') == 'Display Matrix' and 'rotation' in side_data:
+                try:
+                    rotation = int(float(side_data['rotation']))
+                    logger.info(f"Rotation found in side_data: {rotation}")
+                    break
+                except (ValueError, TypeError):
+                    pass
+    
+    # 2. tags에서 rotate 확인 (side_data에 없는 경우)
+    if rotation == 0 and 'tags' in stream and 'rotate' in stream['tags']:
+        try:
+            rotation = int(stream['tags']['rotate'])
+            logger.info(f"Rotation found in tags: {rotation}")
+        except (ValueError, TypeError):
+            pass
+    
+    # 음수 회전 값 처리
+    if rotation < 0:
+        rotation += 360
+    return rotation
+
+
+def _to_number(value, cast):
+    """ffprobe의 문자열 숫자 값을 변환합니다. (없거나 'N/A'이면 None)"""
+    try:
+        return cast(float(value)) if value not in (None, 'N/A') else None
+    except (ValueError, TypeError):
+        return None
+
+
+def probe_video(video_path: str) -> MediaAnalysis | None:
+    """
+    ffprobe 한 번으로 스트림과 컨테이너 정보를 읽어 크기, 회전, 길이, 코덱, 비트레이트, 오디오 유무를 반환합니다.
+    크기 정보를 확인할 수 없으면 None을 반환합니다.
     """
-    temp_filename = None
     try:
-        # 임시 파일 생성 및 내용 쓰기
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            contents = await file.read()
-            temp_file.write(contents)
-            temp_file.flush()
-            temp_filename = temp_file.name
-        
-        # ffprobe로 비디오 정보 한 번에 가져오기 (크기 + 회전)
         cmd = [
             'ffprobe',
             '-v', 'quiet',
             '-print_format', 'json',
             '-show_streams',
-            '-select_streams', 'v:0',
-            temp_filename
+            '-show_format',
+            video_path
         ]
         
         logger.info(f"Executing ffprobe command: {' '.join(cmd)}")
@@ -89,16 +188,19 @@ async def get_video_dimensions_with_rotation(file: UploadFile) -> tuple:
         
         if result.returncode != 0:
             logger.warning(f"ffprobe 실행 오류: {result.stderr}")
-            return None, None
+            return None
 
         # JSON 파싱
         try:
             data = json.loads(result.stdout)
-            if not data.get('streams'):
+            streams = data.get('streams') or []
+            video_streams = [item for item in streams if item.get('codec_type', 'video') == 'video']
+            if not video_streams:
                 logger.warning("스트림 정보를 찾을 수 없습니다")
-                return None, None
+                return None
                 
-            stream = data['streams'][0]
+            stream = video_streams[0]
+            container = data.get('format', {})
             
             # 기본 크기 정보
             width = stream.get('width')
@@ -106,177 +208,193 @@ async def get_video_dimensions_with_rotation(file: UploadFile) -> tuple:
             
             if width is None or height is None:
                 logger.warning("비디오 크기 정보를 찾을 수 없습니다")
-                return None, None
-            
-            # 회전 정보 확인
-            rotation = 0
-            
-            # 1. side_data에서 rotation 확인
-            if 'side_data_list' in stream:
-                for side_data in stream['side_data_list']:
-                    if side_data.get('side_data_type') == 'Display Matrix' and 'rotation' in side_data:
-                        try:
-                            rotation = int(float(side_data['rotation']))
-                            logger.info(f"Rotation found in side_data: {rotation}")
-                            break
-                        except (ValueError, TypeError):
-                            pass
-            
-            # 2. tags에서 rotate 확인 (side_data에 없는 경우)
-            if rotation == 0 and 'tags' in stream and 'rotate' in stream['tags']:
-                try:
-                    rotation = int(stream['tags']['rotate'])
-                    logger.info(f"Rotation found in tags: {rotation}")
-                except (ValueError, TypeError):
-                    pass
-            
-            # 음수 회전 값 처리
-            if rotation < 0:
-                rotation += 360
+                return None
             
             # 회전에 따라 width, height 교환
+            rotation = _parse_rotation(stream)
             logger.info(f"원본 비디오 크기: {width}x{height}, 회전: {rotation}도")
             if rotation in (90, 270):
                 logger.info("90° 또는 270° 회전 감지 - width/height 교환")
                 width, height = height, width
             
-            return width, height
+            return MediaAnalysis(
+                width=width,
+                height=height,
+                rotation=rotation,
+                duration=_to_number(container.get('duration') or stream.get('duration'), float),
+                video_codec=stream.get('codec_name'),
+                bitrate=_to_number(container.get('bit_rate') or stream.get('bit_rate'), int),
+                has_audio=any(item.get('codec_type') == 'audio' for item in streams)
+            )
             
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(f"ffprobe 출력 파싱 오류: {str(e)}")
-            return None, None
+            return None
         
     except Exception as e:
         logger.warning(f"비디오 정보 확인 중 오류 발생: {str(e)}")
-        return None, None
-    finally:
-        # 임시 파일 삭제 및 파일 포인터 복구
-        if temp_filename and os.path.exists(temp_filename):
-            try:
-                os.unlink(temp_filename)
-            except Exception as e:
-                logger.error(f"임시 파일 삭제 중 오류 발생: {str(e)}")
-        await file.seek(0)
+        return None
 
 
-async def extract_video_thumbnail(
-    file: UploadFile, 
-    target_width: int | None = None, 
-    target_height: int | None = None
-) -> UploadFile | None:
+def analyze_media(local_path: str, content_type: str) -> MediaAnalysis:
     """
-    비디오 파일에서 썸네일을 추출합니다.
-    target_width와 target_height가 제공되면 해당 크기로 리사이즈합니다.
+    로컬에 저장된 미디어 파일 하나로 필요한 정보를 한 번에 분석합니다.
+
+    - 비디오: ffprobe 한 번(크기, 회전, 길이, 코덱, 비트레이트) + ffmpeg 한 번(썸네일)
+      probe 결과의 크기와 길이를 썸네일 추출에 그대로 사용하므로 다시 probe하지 않습니다.
+    - 이미지: 헤더만 읽어 크기 확인 (EXIF rotation 고려)
+    - 플레이스홀더(BlurHash, 대표 색상)는 이미지 또는 비디오 썸네일을 크게 축소해 계산합니다.
     """
-    temp_filename = None
-    video = None
-    thumbnail_path = None
+    if content_type and content_type.startswith('video/'):
+        analysis = probe_video(local_path) or MediaAnalysis()
+        analysis.thumbnail = extract_video_thumbnail(
+            local_path, analysis.width, analysis.height, duration=analysis.duration
+        )
+        if analysis.thumbnail:
+            analysis.blurhash, analysis.dominant_color = compute_placeholder_from_file(io.BytesIO(analysis.thumbnail))
+        return analysis
+
+    if content_type and content_type.startswith('image/'):
+        width, height = get_image_file_dimensions(local_path)
+        blurhash, dominant_color = compute_placeholder_from_file(local_path)
+        return MediaAnalysis(width=width, height=height, blurhash=blurhash, dominant_color=dominant_color)
+
+    return MediaAnalysis()
+
+
+def get_video_duration(video_path: str) -> float | None:
+    """ffprobe로 비디오 길이(초)를 반환합니다. (컨테이너 헤더만 읽음)"""
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        video_path
+    ]
     try:
-        # 임시 파일 생성 및 내용 쓰기
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            # 주의: file.read()는 파일 포인터를 끝으로 이동시킵니다.
-            # S3 업로드 전에 file.seek(0)이 필요합니다.
-            contents = await file.read()
-            if not contents:
-                 logger.warning("썸네일 추출을 위한 파일 읽기 실패 (내용 없음)")
-                 return None
-            temp_file.write(contents)
-            temp_file.flush()
-            temp_filename = temp_file.name
-            
-        # 비디오 파일 로드
-        logger.info(f"썸네일 추출 위해 비디오 로드: {temp_filename}")
-        video = VideoFileClip(temp_filename)
-        
-        # 비디오 중간 지점의 프레임 추출
-        logger.info(f"비디오 중간 프레임 추출 (duration: {video.duration})")
-        thumbnail_frame = video.get_frame(video.duration / 2)
-        
-        # RGB to BGR 변환 (OpenCV 형식)
-        thumbnail_frame_bgr = cv2.cvtColor(thumbnail_frame, cv2.COLOR_RGB2BGR)
-        
-        # 목표 크기가 주어졌다면 리사이즈
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        return float(result.stdout.strip())
+    except (ValueError, OSError) as e:
+        logger.warning(f"비디오 길이 확인 중 오류 발생: {str(e)}")
+        return None
+
+
+def _run_ffmpeg_thumbnail(video_path: str, seek_seconds: float, scale_filter: str | None) -> bytes:
+    """
+    seek_seconds 위치의 프레임 하나를 디코딩해 JPEG 바이트로 반환합니다.
+    -ss를 -i 앞에 두면 가장 가까운 키프레임으로 바로 이동하므로 비디오 길이와 관계없이 거의 일정한 시간이 걸립니다.
+    ffmpeg는 회전 메타데이터를 자동으로 적용(autorotate)하므로 회전된 최종 크기 기준으로 스케일합니다.
+    """
+    cmd = [
+        'ffmpeg',
+        '-v', 'error',
+        '-ss', f"{seek_seconds:.3f}",
+        '-i', video_path,
+        '-frames:v', '1',
+        '-an',
+    ]
+    if scale_filter:
+        cmd += ['-vf', scale_filter]
+    cmd += [
+        '-q:v', str(THUMBNAIL_JPEG_QUALITY),
+        '-f', 'image2pipe',
+        '-vcodec', 'mjpeg',
+        'pipe:1'
+    ]
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    if result.returncode != 0:
+        logger.warning(f"ffmpeg 썸네일 추출 오류: {result.stderr.decode(errors='ignore').strip()}")
+        return b""
+    return result.stdout
+
+
+def extract_video_thumbnail(
+    video_path: str,
+    target_width: int | None = None,
+    target_height: int | None = None,
+    duration: float | None = None
+) -> bytes | None:
+    """
+    비디오 중간 지점의 프레임을 JPEG 썸네일로 추출하여 바이트로 반환합니다.
+    video_path는 로컬에 저장된 비디오 파일 경로이며, 이 함수에서 삭제하지 않습니다.
+    target_width와 target_height가 제공되면 해당 크기로 리사이즈합니다. (회전이 반영된 최종 크기)
+    duration을 모르면 ffprobe로 확인합니다.
+    """
+    try:
+        if duration is None:
+            duration = get_video_duration(video_path)
+
+        scale_filter = None
         if target_width and target_height:
-            original_height, original_width, _ = thumbnail_frame_bgr.shape
-            logger.info(f"썸네일 리사이즈 전 크기: {original_width}x{original_height}")
-            logger.info(f"썸네일 목표 크기: {target_width}x{target_height}")
-            thumbnail_frame_bgr = cv2.resize(thumbnail_frame_bgr, (target_width, target_height))
-            resized_height, resized_width, _ = thumbnail_frame_bgr.shape
-            logger.info(f"썸네일 리사이즈 후 크기: {resized_width}x{resized_height}")
-        else:
-            h, w, _ = thumbnail_frame_bgr.shape
-            logger.info(f"썸네일 리사이즈 안 함. 최종 크기: {w}x{h}")
-            
-        # 임시 썸네일 저장 경로
-        thumbnail_path = f"{temp_filename}_thumbnail.jpg"
-        logger.info(f"썸네일 임시 저장: {thumbnail_path}")
-        success = cv2.imwrite(thumbnail_path, thumbnail_frame_bgr)
-        if not success:
-             logger.error("썸네일 파일 저장 실패 (cv2.imwrite)")
-             return None
-            
-        # 비디오 파일 닫기 (리소스 해제)
-        logger.info("moviepy 비디오 객체 닫기")
-        video.close()
-        video = None # 닫힌 후 참조 제거
-        
-        # 원본 비디오 임시 파일 삭제
-        logger.info(f"원본 비디오 임시 파일 삭제: {temp_filename}")
-        if os.path.exists(temp_filename):
-             os.unlink(temp_filename)
-             temp_filename = None # 삭제 후 참조 제거
-        
-        # 썸네일 파일을 SpooledTemporaryFile로 읽기
-        logger.info(f"임시 썸네일 파일 읽기: {thumbnail_path}")
-        spooled_file = SpooledTemporaryFile()
-        with open(thumbnail_path, 'rb') as f:
-            spooled_file.write(f.read())
-        spooled_file.seek(0)
-        
-        # 썸네일 파일을 UploadFile로 변환
-        thumbnail_filename = f"{os.path.splitext(file.filename)[0]}_thumbnail.jpg"
-        logger.info(f"썸네일을 UploadFile 객체로 변환: {thumbnail_filename}")
-        thumbnail_upload_file = UploadFile(
-            filename=thumbnail_filename,
-            file=spooled_file,
-            headers={"content-type": "image/jpeg"}
-        )
-        
-        # 임시 썸네일 파일 삭제
-        logger.info(f"임시 썸네일 파일 삭제: {thumbnail_path}")
-        if os.path.exists(thumbnail_path):
-            os.unlink(thumbnail_path)
-            thumbnail_path = None # 삭제 후 참조 제거
-        
-        # 원본 파일 포인터 위치 복구 (S3 업로드 위함)
-        # logger.info("원본 파일 포인터 위치 복구 (seek 0)")
-        # await file.seek(0) # 이 함수 내에서는 원본 파일 포인터 복구 불필요
-            
-        return thumbnail_upload_file
-            
+            scale_filter = f"scale={target_width}:{target_height}"
+
+        # 비디오 중간 지점의 프레임 추출
+        logger.info(f"썸네일 추출: {video_path} (duration: {duration}, size: {target_width}x{target_height})")
+        thumbnail = _run_ffmpeg_thumbnail(video_path, (duration or 0) / 2, scale_filter)
+        if not thumbnail and duration:
+            # 길이 정보가 부정확해 중간 지점 이동에 실패한 경우 첫 프레임으로 대체
+            logger.info("중간 지점 프레임 추출 실패 - 첫 프레임으로 재시도")
+            thumbnail = _run_ffmpeg_thumbnail(video_path, 0, scale_filter)
+
+        return thumbnail or None
+    except Exception as e:
+        logger.exception(f"비디오 썸네일 추출 중 예외 발생: {str(e)}")
+        return None
+
+
+def extract_video_preview(
+    video_path: str,
+    duration: float | None = None,
+    seconds: float = 3.0,
+    short_side: int = 240,
+    fps: int = 15
+) -> bytes | None:
+    """
+    그리드 화면 자동 재생용 짧은 무음 미리보기(MP4, H.264)를 만들어 바이트로 반환합니다.
+
+    - 비디오 중간 지점을 중심으로 seconds초 구간을 잘라냅니다. (-ss를 -i 앞에 두어 바로 이동)
+    - 짧은 변을 short_side로 줄이고(확대하지 않음) 프레임 수를 fps로 낮춰 원본보다 훨씬 작게 만듭니다.
+    - 회전은 ffmpeg가 자동 적용하므로 결과에는 회전 메타데이터가 없습니다.
+    """
+    if duration is None:
+        duration = get_video_duration(video_path)
+    start = max(0.0, (duration or 0) / 2 - seconds / 2)
+
+    # 가로 영상은 세로를, 세로 영상은 가로를 short_side로 맞춤
+    scale_filter = (
+        f"scale=w='if(gt(iw,ih),-2,min({short_side},iw))':h='if(gt(iw,ih),min({short_side},ih),-2)',"
+        f"setsar=1,fps={fps}"
+    )
+
+    preview_path = None
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as temp_file:
+            preview_path = temp_file.name
+        cmd = [
+            'ffmpeg',
+            '-v', 'error',
+            '-y',
+            '-ss', f"{start:.3f}",
+            '-t', f"{seconds:.3f}",
+            '-i', video_path,
+            '-an',
+            '-vf', scale_filter,
+            '-c:v', 'libx264',
+            '-preset', 'veryfast',
+            '-crf', '30',
+            '-pix_fmt', 'yuv420p',
+            '-movflags', '+faststart',
+            preview_path
+        ]
+        result = subprocess.run(cmd, capture_output=True, check=False)
+        if result.returncode != 0:
+            logger.warning(f"ffmpeg 미리보기 생성 오류: {result.stderr.decode(errors='ignore').strip()}")
+            return None
+        with open(preview_path, 'rb') as preview_file:
+            return preview_file.read() or None
     except Exception as e:
-        logger.exception(f"비디오 썸네일 추출 중 예외 발생: {str(e)}") # logger.exception 사용
+        logger.exception(f"비디오 미리보기 생성 중 예외 발생: {str(e)}")
         return None
     finally:
-        # Ensure resources are released even if errors occur
-        if video:
-            try:
-                logger.info("Finally 블록에서 moviepy 비디오 객체 닫기 시도")
-                video.close()
-            except Exception as ce:
-                 logger.error(f"Finally 블록에서 video.close() 오류: {str(ce)}")
-        if temp_filename and os.path.exists(temp_filename):
-             try:
-                 logger.info(f"Finally 블록에서 원본 임시 파일 삭제 시도: {temp_filename}")
-                 os.unlink(temp_filename)
-             except Exception as ue:
-                 logger.error(f"Finally 블록에서 원본 임시 파일 삭제 오류: {str(ue)}")
-        if thumbnail_path and os.path.exists(thumbnail_path):
-            try:
-                 logger.info(f"Finally 블록에서 썸네일 임시 파일 삭제 시도: {thumbnail_path}")
-                 os.unlink(thumbnail_path)
-            except Exception as te:
-                 logger.error(f"Finally 블록에서 썸네일 임시 파일 삭제 오류: {str(te)}")
-        # 원본 파일 포인터는 이 함수를 호출한 곳에서 관리해야 함
-        # await file.seek(0) 
-        pass # finally 블록에서는 seek(0) 안함 
\ No newline at end of file
+        if preview_path and os.path.exists(preview_path):
+            os.unlink(preview_path)
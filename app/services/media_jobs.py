@@ -0,0 +1,281 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.file import File
+from app.models.file_variant import FileVariant
+from app.models.media_job import MediaJob
+from app.services.feed_cache import invalidate_feed
+from app.services.media_objects import acquire_media_object, register_media_object
+from app.services.storage_deletions import enqueue_storage_deletions, wake_storage_deletion_drainer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClaimedMediaJob:
+    """워커가 가져간 작업 정보 (세션이 닫힌 뒤에도 프로세스 풀에 넘길 수 있도록 값만 보관)"""
+    job_id: int
+    file_id: int
+    s3_key: str
+    content_type: str
+    file_name: str
+    compute_hash: bool  # 원본 등록 없이 저장된 파일(S3 직접 업로드)이면 처리하면서 해시를 계산
+
+
+def enqueue_media_job(db: Session, file: File) -> MediaJob:
+    """
+    파일의 미디어 처리 작업을 큐에 추가합니다. (호출한 쪽 트랜잭션에서 커밋)
+    """
+    file.processing_status = 'pending'
+    job = MediaJob(file_id=file.id)
+    db.add(job)
+    return job
+
+
+def claim_media_jobs(db: Session, limit: int) -> List[ClaimedMediaJob]:
+    """
+    대기 중인 작업을 최대 limit개 가져와 running 상태로 바꿉니다.
+
+    - 다른 워커가 잠근 행은 건너뛰므로(SKIP LOCKED) 여러 워커가 동시에 실행되어도 같은 작업을 중복 처리하지 않습니다.
+    - 실패 후 재시도 대기 중인 작업은 next_attempt_at이 지난 뒤에 가져옵니다.
+    - running 상태로 MEDIA_JOB_STALE_SECONDS 이상 지난 작업은 워커가 죽은 것으로 보고 다시 가져옵니다.
+    """
+    now = datetime.now()
+    stale_before = now - timedelta(seconds=settings.MEDIA_JOB_STALE_SECONDS)
+
+    jobs = (
+        db.query(MediaJob)
+        .filter(
+            or_(
+                and_(
+                    MediaJob.status == 'pending',
+                    or_(MediaJob.next_attempt_at.is_(None), MediaJob.next_attempt_at <= now)
+                ),
+                and_(MediaJob.status == 'running', MediaJob.locked_at < stale_before)
+            )
+        )
+        .order_by(MediaJob.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    claimed = []
+    failed_files = []
+    for job in jobs:
+        if job.attempts >= settings.MEDIA_JOB_MAX_ATTEMPTS:
+            # 처리 중 워커가 반복해서 죽은 작업은 더 이상 시도하지 않음
+            job.status = 'failed'
+            job.last_error = job.last_error or "작업 시간이 초과되었습니다."
+            job.file.processing_status = 'failed'
+            failed_files.append(job.file)
+            continue
+
+        job.status = 'running'
+        job.attempts += 1
+        job.locked_at = now
+        job.file.processing_status = 'processing'
+        claimed.append(ClaimedMediaJob(
+            job_id=job.id,
+            file_id=job.file_id,
+            s3_key=job.file.s3_key,
+            content_type=job.file.content_type,
+            file_name=job.file.file_name,
+            compute_hash=job.file.media_object_id is None
+        ))
+    db.commit()
+    _invalidate_attached_feeds(failed_files)
+    return claimed
+
+
+def release_media_jobs(db: Session, job_ids: List[int]) -> None:
+    """
+    가져간 작업을 실행하지 못했을 때 시도 횟수를 되돌리고 바로 다시 가져갈 수 있게 대기 상태로 돌립니다.
+    (프로세스 풀에 제출하지 못했거나, 다른 작업 때문에 풀이 깨져 함께 중단된 경우)
+    """
+    if not job_ids:
+        return
+    jobs = db.query(MediaJob).filter(MediaJob.id.in_(job_ids), MediaJob.status == 'running').all()
+    for job in jobs:
+        job.status = 'pending'
+        job.attempts = max(job.attempts - 1, 0)
+        job.locked_at = None
+        job.next_attempt_at = None
+        job.file.processing_status = 'pending'
+    db.commit()
+
+
+# 미디어 처리 결과로 채워지는 File 컬럼 (내용이 같은 파일끼리 그대로 복사 가능)
+PROCESSED_FIELDS = (
+    "width",
+    "height",
+    "duration",
+    "video_codec",
+    "bitrate",
+    "blurhash",
+    "dominant_color",
+    "s3_key_thumbnail",
+    "s3_key_preview",
+    "s3_key_hls",
+)
+
+
+def _sibling_files(db: Session, file: File) -> List[File]:
+    """같은 원본(media_object)을 공유하는 파일들 (자기 자신 포함)"""
+    if file.media_object_id is None:
+        return [file]
+    return db.query(File).filter(File.media_object_id == file.media_object_id).all()
+
+
+def apply_media_result(file: File, result: dict) -> None:
+    """처리 결과를 File 행에 반영합니다."""
+    for field in PROCESSED_FIELDS:
+        value = result.get(field)
+        if value is not None or not field.startswith("s3_key"):
+            setattr(file, field, value)
+    if result.get("variants"):
+        # 재처리된 경우 이전 변환본 행을 교체
+        file.variants = [FileVariant(**variant) for variant in result["variants"]]
+    file.processing_status = 'done'
+
+
+def copy_processed_media(db: Session, file: File) -> bool:
+    """
+    같은 원본을 공유하는 파일이 이미 처리되었으면 그 결과(썸네일, 변환본 등)를 복사합니다.
+    처리 중인 파일이 있으면 그 작업이 끝날 때 함께 반영되므로 대기 상태로 둡니다.
+
+    Returns:
+        bool: 새 처리 작업이 필요 없으면 True
+    """
+    siblings = [sibling for sibling in _sibling_files(db, file) if sibling.id != file.id]
+    done = next((sibling for sibling in siblings if sibling.processing_status == 'done'), None)
+    if done is not None:
+        result = {field: getattr(done, field) for field in PROCESSED_FIELDS}
+        result["variants"] = [
+            {
+                "s3_key": variant.s3_key,
+                "content_type": variant.content_type,
+                "format": variant.format,
+                "width": variant.width,
+                "height": variant.height,
+                "file_size": variant.file_size,
+            }
+            for variant in done.variants
+        ]
+        apply_media_result(file, result)
+        return True
+
+    if any(sibling.processing_status in ('pending', 'processing') for sibling in siblings):
+        file.processing_status = 'pending'
+        return True
+    return False
+
+
+def _invalidate_attached_feeds(files: List[File]) -> None:
+    """처리가 끝나기 전에 이미 피드에 첨부된 파일이 있으면 캐시된 페이지에 처리 상태를 반영합니다. (커밋 후 호출)"""
+    for file in files:
+        if file.feed_id:
+            invalidate_feed(file.feed_id)
+
+
+def _result_storage(result: dict) -> Tuple[List[str], List[str]]:
+    """처리 결과로 새로 저장된 객체 키와 프리픽스 (File.storage_keys/storage_prefixes와 같은 기준)"""
+    keys = [result.get("s3_key_thumbnail"), result.get("s3_key_preview")]
+    keys.extend(variant["s3_key"] for variant in result.get("variants") or [])
+    prefixes = [result["s3_key_hls"].rsplit("/", 1)[0] + "/"] if result.get("s3_key_hls") else []
+    return [key for key in keys if key], prefixes
+
+
+def _attach_media_object(db: Session, file: File, result: dict) -> Tuple[bool, List[str], List[str]]:
+    """
+    원본 등록 없이 저장된 파일(S3 직접 업로드)을 처리 결과의 해시로 원본에 연결합니다. (호출한 쪽 트랜잭션에서 커밋)
+    같은 내용의 원본이 이미 있으면 그 객체를 공유하고, 이 파일이 올린 객체는 삭제할 키로 반환합니다.
+    그 원본이 이미 처리되었으면 그 결과를 복사하고 이번 처리 결과도 삭제 대상에 넣습니다.
+
+    Returns:
+        Tuple[bool, List[str], List[str]]: (처리 결과를 복사했는지, 삭제할 S3 키 목록, 삭제할 S3 프리픽스 목록)
+    """
+    content_hash = result["content_hash"]
+    media_object = acquire_media_object(db, content_hash)
+    created = False
+    if media_object is None:
+        media_object, created = register_media_object(db, content_hash, file.s3_key)
+    file.media_object_id = media_object.id
+    if created:
+        db.flush()
+        return False, [], []
+
+    logger.info(f"직접 업로드 파일을 같은 내용의 원본에 연결: {file.s3_key} -> {media_object.s3_key}")
+    redundant_keys = [file.s3_key]
+    file.s3_key = media_object.s3_key
+    db.flush()
+    if copy_processed_media(db, file) and file.processing_status == 'done':
+        keys, prefixes = _result_storage(result)
+        return True, redundant_keys + keys, prefixes
+    return False, redundant_keys, []
+
+
+def complete_media_job(db: Session, job_id: int, result: dict) -> None:
+    """
+    처리 결과를 파일에 반영하고 작업을 완료 상태로 바꿉니다.
+    같은 원본을 공유하는 파일이 있으면 함께 반영합니다.
+    원본 등록 없이 저장된 파일은 결과의 해시로 원본을 등록하거나 같은 내용의 원본에 연결합니다.
+    """
+    job = db.get(MediaJob, job_id)
+    if job is None:
+        # 처리 중 파일이 삭제된 경우 (CASCADE)
+        return
+
+    copied, redundant_keys, redundant_prefixes = False, [], []
+    if job.file.media_object_id is None and result.get("content_hash"):
+        copied, redundant_keys, redundant_prefixes = _attach_media_object(db, job.file, result)
+
+    files = [job.file] if copied else _sibling_files(db, job.file)
+    if not copied:
+        for file in files:
+            apply_media_result(file, result)
+    enqueue_storage_deletions(db, redundant_keys, redundant_prefixes)
+    job.status = 'done'
+    job.last_error = None
+    db.commit()
+    if redundant_keys or redundant_prefixes:
+        wake_storage_deletion_drainer()
+    _invalidate_attached_feeds(files)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """attempts번 실패한 작업의 다음 재시도까지 대기 시간 (지수 백오프, 상한 있음)"""
+    seconds = settings.MEDIA_JOB_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, settings.MEDIA_JOB_RETRY_MAX_SECONDS))
+
+
+def fail_media_job(db: Session, job_id: int, error: str) -> None:
+    """
+    작업 실패를 기록합니다.
+    MEDIA_JOB_MAX_ATTEMPTS보다 적게 시도했으면 지수 백오프 후 다시 가져가도록 대기 상태로 되돌리고,
+    아니면 실패로 처리합니다. (처리할 때마다 워커를 죽이는 파일이 곧바로 반복 실행되지 않도록)
+    """
+    job = db.get(MediaJob, job_id)
+    if job is None:
+        return
+
+    job.last_error = error
+    failed_files = []
+    if job.attempts < settings.MEDIA_JOB_MAX_ATTEMPTS:
+        job.status = 'pending'
+        job.next_attempt_at = datetime.now() + _retry_delay(job.attempts)
+        job.file.processing_status = 'pending'
+    else:
+        job.status = 'failed'
+        failed_files = _sibling_files(db, job.file)
+        for file in failed_files:
+            file.processing_status = 'failed'
+        logger.error(f"미디어 처리 실패 (file_id={job.file_id}): {error}")
+    db.commit()
+    _invalidate_attached_feeds(failed_files)
@@ -0,0 +1,258 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from fastapi import UploadFile
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.models.file import File
+from app.models.media_job import MediaJob
+from app.models.media_object import MediaObject
+from app.services.media import compute_sha256
+from app.services.s3 import extract_s3_key_from_url, gather_bounded, upload_file_to_s3
+from app.services.storage_deletions import enqueue_storage_deletions
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class UploadedOriginal:
+    """upload_originals 결과 (아직 원본으로 등록되지 않은 업로드)"""
+    s3_key: Optional[str]  # 이번 요청에서 올린 객체 키 (None이면 같은 내용의 원본이 있어 업로드를 건너뜀)
+    content_hash: str
+
+
+class MediaObjectReleasedError(Exception):
+    """업로드를 건너뛰고 재사용하려던 원본이 그 사이 해제된 경우 (해당 내용을 업로드한 뒤 다시 등록)"""
+
+    def __init__(self, content_hashes: List[str]):
+        self.content_hashes = content_hashes
+        super().__init__(f"재사용하려던 원본이 해제되었습니다: {', '.join(content_hashes)}")
+
+
+@dataclass
+class StoredUpload:
+    """claim_media_objects 결과"""
+    s3_key: str
+    media_object: MediaObject
+    uploaded: bool  # 이번 요청에서 올린 객체가 원본으로 등록되었는지 (False면 기존 객체 재사용)
+
+
+def acquire_media_object(db: Session, content_hash: str) -> Optional[MediaObject]:
+    """
+    같은 내용의 원본이 있으면 참조 수를 1 늘리고 반환합니다. (호출한 쪽 트랜잭션에서 커밋)
+    참조 수가 0인 객체(S3 객체가 삭제된 상태)는 재사용하지 않습니다.
+    """
+    updated = db.execute(
+        update(MediaObject)
+        .where(MediaObject.content_hash == content_hash, MediaObject.ref_count > 0)
+        .values(ref_count=MediaObject.ref_count + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not updated:
+        return None
+    return (
+        db.query(MediaObject)
+        .filter(MediaObject.content_hash == content_hash)
+        .populate_existing()
+        .one()
+    )
+
+
+def register_media_object(db: Session, content_hash: str, s3_key: str) -> Tuple[MediaObject, bool]:
+    """
+    새로 업로드한 원본을 등록합니다. (호출한 쪽 트랜잭션에서 커밋)
+
+    - 참조 수가 0인 같은 해시 행이 남아 있으면 새 S3 키로 되살립니다.
+    - 그 사이 다른 요청이 같은 내용을 먼저 등록했으면 그 객체를 재사용합니다.
+
+    Returns:
+        Tuple[MediaObject, bool]: (원본 객체, 새로 등록했는지 여부)
+    """
+    revived = db.execute(
+        update(MediaObject)
+        .where(MediaObject.content_hash == content_hash, MediaObject.ref_count == 0)
+        .values(s3_key=s3_key, ref_count=1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if revived:
+        return db.query(MediaObject).filter(MediaObject.content_hash == content_hash).populate_existing().one(), True
+
+    try:
+        with db.begin_nested():
+            media_object = MediaObject(content_hash=content_hash, s3_key=s3_key, ref_count=1)
+            db.add(media_object)
+        return media_object, True
+    except IntegrityError:
+        # 같은 내용이 동시에 업로드되어 먼저 등록된 경우
+        media_object = acquire_media_object(db, content_hash)
+        if media_object is None:
+            raise
+        return media_object, False
+
+
+def find_media_object_keys(db: Session, content_hashes: Iterable[str]) -> Dict[str, str]:
+    """
+    해시가 같은 원본이 있으면 {해시: S3 키}로 반환합니다. (읽기 전용 조회, 행을 잠그지 않음)
+    참조 수 증가는 claim_media_objects에서 하므로, 그 사이 해제될 수 있습니다.
+    """
+    content_hashes = set(content_hashes)
+    if not content_hashes:
+        return {}
+    rows = db.query(MediaObject.content_hash, MediaObject.s3_key).filter(
+        MediaObject.content_hash.in_(content_hashes),
+        MediaObject.ref_count > 0
+    ).all()
+    return {content_hash: s3_key for content_hash, s3_key in rows}
+
+
+async def upload_originals(db: Session, files: List[UploadFile]) -> List[Union[UploadedOriginal, BaseException]]:
+    """
+    업로드 파일들의 SHA-256을 계산하고, 같은 내용의 원본이 아직 없는 파일만 S3에 업로드합니다. (입력 순서대로 반환)
+
+    - 해시는 업로드 전에 알아야 전송을 건너뛸 수 있으므로 로컬 임시 파일을 청크 단위로 한 번 읽어 계산합니다.
+    - 기존 원본은 읽기 전용으로 조회하고, 참조 수 증가와 동시 업로드 경합은 claim_media_objects에서 처리합니다.
+    - 한 요청 안에서 내용이 같은 파일은 한 번만 업로드합니다.
+    - 파일별 실패는 예외 객체로 반환합니다.
+    """
+    hashes = await gather_bounded([run_in_threadpool(compute_sha256, file.file) for file in files])
+    existing = await run_in_threadpool(
+        find_media_object_keys, db, [content_hash for content_hash in hashes if isinstance(content_hash, str)]
+    )
+
+    pending: Dict[str, UploadFile] = {}
+    for file, content_hash in zip(files, hashes):
+        if isinstance(content_hash, str) and content_hash not in existing:
+            pending.setdefault(content_hash, file)
+    urls = dict(zip(pending, await gather_bounded([upload_file_to_s3(file) for file in pending.values()])))
+
+    results: List[Union[UploadedOriginal, BaseException]] = []
+    for content_hash in hashes:
+        if isinstance(content_hash, BaseException):
+            results.append(content_hash)
+        elif content_hash in existing:
+            results.append(UploadedOriginal(s3_key=None, content_hash=content_hash))
+        elif isinstance(urls[content_hash], BaseException):
+            results.append(urls[content_hash])
+        else:
+            results.append(UploadedOriginal(s3_key=extract_s3_key_from_url(urls[content_hash]), content_hash=content_hash))
+    return results
+
+
+async def save_with_originals(
+    files: List[UploadFile],
+    uploads: List[UploadedOriginal],
+    func: Callable[..., T],
+    *args
+) -> T:
+    """
+    claim_media_objects를 호출하는 저장 함수를 스레드 풀에서 실행합니다.
+    업로드를 건너뛴 원본이 그 사이 해제되었으면 그 내용을 업로드하고(uploads의 s3_key를 채움) 한 번 더 실행합니다.
+    """
+    try:
+        return await run_in_threadpool(func, *args)
+    except MediaObjectReleasedError as e:
+        for content_hash in e.content_hashes:
+            index = next(i for i, upload in enumerate(uploads) if upload.content_hash == content_hash)
+            s3_key = extract_s3_key_from_url(await upload_file_to_s3(files[index]))
+            for upload in uploads:
+                if upload.content_hash == content_hash:
+                    upload.s3_key = s3_key
+        return await run_in_threadpool(func, *args)
+
+
+def claim_media_objects(db: Session, uploads: List[UploadedOriginal]) -> List[StoredUpload]:
+    """
+    업로드한 파일들을 원본으로 등록하거나, 같은 내용의 원본이 있으면 그 참조 수를 늘립니다. (입력 순서대로 반환)
+    호출한 쪽 트랜잭션에서 커밋하며, 이벤트 루프를 막지 않도록 run_in_threadpool로 한 번에 호출합니다.
+
+    - 다른 요청과 행 잠금 순서가 엇갈려 교착 상태가 되지 않도록 해시 순서로 처리합니다.
+    - 같은 내용이 동시에 업로드되어 기존 원본을 재사용한 파일의 업로드 객체는 삭제 대기열에 추가합니다.
+      (커밋 후 wake_storage_deletion_drainer 호출)
+    - 업로드를 건너뛴 파일의 원본이 그 사이 해제되었으면 MediaObjectReleasedError를 발생시킵니다.
+      (save_with_originals가 업로드 후 다시 호출)
+    """
+    stored: List[Optional[StoredUpload]] = [None] * len(uploads)
+    redundant_keys = []
+    released = []
+    for index in sorted(range(len(uploads)), key=lambda i: uploads[i].content_hash):
+        upload = uploads[index]
+        media_object = acquire_media_object(db, upload.content_hash)
+        created = False
+        if media_object is None:
+            if upload.s3_key is None:
+                released.append(upload.content_hash)
+                continue
+            media_object, created = register_media_object(db, upload.content_hash, upload.s3_key)
+        if not created and upload.s3_key not in (None, media_object.s3_key):
+            logger.info(f"같은 내용의 원본 재사용: {upload.s3_key} -> {media_object.s3_key}")
+            redundant_keys.append(upload.s3_key)
+        stored[index] = StoredUpload(s3_key=media_object.s3_key, media_object=media_object, uploaded=created)
+
+    if released:
+        raise MediaObjectReleasedError(sorted(set(released)))
+    enqueue_storage_deletions(db, redundant_keys)
+    return stored
+
+
+def release_file_storage(db: Session, file: File) -> Tuple[List[str], List[str]]:
+    """
+    파일 삭제 전에 호출하여 원본 참조 수를 1 줄이고, S3에서 지워야 할 키와 프리픽스를 반환합니다.
+    (호출한 쪽 트랜잭션에서 커밋, S3 삭제는 커밋 후에 수행)
+
+    - 같은 원본을 쓰는 다른 파일이 남아 있으면 그 파일들이 쓰지 않는 객체만 지웁니다.
+    - 중복 제거 이전에 올라온 파일(media_object 없음)은 자신의 객체를 모두 지웁니다.
+
+    Returns:
+        Tuple[List[str], List[str]]: (삭제할 S3 키 목록, 삭제할 S3 프리픽스 목록)
+    """
+    keys, prefixes = file.storage_keys(), file.storage_prefixes()
+    if file.media_object_id is None:
+        return keys, prefixes
+
+    db.execute(
+        update(MediaObject)
+        .where(MediaObject.id == file.media_object_id, MediaObject.ref_count > 0)
+        .values(ref_count=MediaObject.ref_count - 1)
+        .execution_options(synchronize_session=False)
+    )
+    media_object = db.query(MediaObject).filter(MediaObject.id == file.media_object_id).populate_existing().one()
+    if media_object.ref_count == 0:
+        return keys, prefixes
+
+    # 원본은 남기고, 남은 파일 중 어디에서도 쓰지 않는 파생 객체(썸네일 등)만 삭제
+    _handover_pending_job(db, file)
+    remaining = db.query(File).filter(File.media_object_id == file.media_object_id, File.id != file.id).all()
+    used_keys = {key for sibling in remaining for key in sibling.storage_keys()}
+    used_prefixes = {prefix for sibling in remaining for prefix in sibling.storage_prefixes()}
+    return (
+        [key for key in keys if key not in used_keys],
+        [prefix for prefix in prefixes if prefix not in used_prefixes],
+    )
+
+
+def _handover_pending_job(db: Session, file: File) -> None:
+    """
+    삭제되는 파일에 걸린 처리 작업은 CASCADE로 함께 지워지므로,
+    결과를 기다리던 같은 원본의 다른 파일이 있으면 그 파일로 작업을 다시 등록합니다.
+    """
+    if file.processing_status not in ('pending', 'processing'):
+        return
+    has_job = db.query(MediaJob.id).filter(
+        MediaJob.file_id == file.id,
+        MediaJob.status.in_(('pending', 'running'))
+    ).first()
+    if has_job is None:
+        return
+    waiting = db.query(File).filter(
+        File.media_object_id == file.media_object_id,
+        File.id != file.id,
+        File.processing_status.in_(('pending', 'processing'))
+    ).first()
+    if waiting is not None:
+        db.add(MediaJob(file_id=waiting.id))
@@ -0,0 +1,108 @@
+import io
+import logging
+import os
+from typing import Optional
+
+from app.core.config import settings
+from app.services.hls import create_hls_rendition
+from app.services.image_variants import generate_image_variants
+from app.services.media import analyze_media, compute_sha256, extract_video_preview
+from app.services.s3 import build_s3_key
+from app.services.storage import MediaStorage, media_storage
+
+logger = logging.getLogger(__name__)
+
+
+def process_media_file(
+    s3_key: str,
+    content_type: str,
+    file_name: str,
+    storage: Optional[MediaStorage] = None,
+    compute_hash: bool = False
+) -> dict:
+    """
+    저장소(기본값: MEDIA_STORAGE_BACKEND에 따른 media_storage)의 원본을 내려받아 analyze_media로 한 번에 분석하고,
+    썸네일/미리보기/HLS(비디오) 또는 변환본(이미지)을 같은 저장소에 올린 뒤 결과를 반환합니다.
+    compute_hash이면 내려받은 원본의 SHA-256도 계산합니다. (원본 등록 없이 저장된 S3 직접 업로드 파일)
+
+    미디어 작업 워커의 프로세스 풀에서 실행되므로 DB에 접근하지 않고,
+    결과 반영은 워커의 디스패처가 담당합니다.
+
+    Returns:
+        dict: {"width", "height", "duration", "video_codec", "bitrate", "s3_key_thumbnail",
+               "s3_key_hls", "s3_key_preview", "blurhash", "dominant_color", "variants", "content_hash"}
+    """
+    result = {
+        "width": None,
+        "height": None,
+        "duration": None,
+        "video_codec": None,
+        "bitrate": None,
+        "s3_key_thumbnail": None,
+        "s3_key_hls": None,
+        "s3_key_preview": None,
+        "blurhash": None,
+        "dominant_color": None,
+        "variants": [],
+        "content_hash": None
+    }
+
+    is_media = content_type.startswith(('video/', 'image/'))
+    if not is_media and not compute_hash:
+        return result
+
+    storage = storage or media_storage
+    with storage.download_to_temp_file(s3_key) as local_path:
+        if compute_hash:
+            with open(local_path, "rb") as fp:
+                result["content_hash"] = compute_sha256(fp)
+        if not is_media:
+            return result
+
+        analysis = analyze_media(local_path, content_type)
+        if content_type.startswith('image/'):
+            result["variants"] = generate_image_variants(local_path, file_name, storage)
+        else:
+            if settings.VIDEO_PREVIEW_ENABLED:
+                preview = extract_video_preview(
+                    local_path,
+                    duration=analysis.duration,
+                    seconds=settings.VIDEO_PREVIEW_SECONDS,
+                    short_side=settings.VIDEO_PREVIEW_SHORT_SIDE,
+                    fps=settings.VIDEO_PREVIEW_FPS
+                )
+                if preview:
+                    preview_filename = f"{os.path.splitext(file_name)[0]}_preview.mp4"
+                    s3_key_preview = build_s3_key(preview_filename, "video/mp4")
+                    storage.put_file(io.BytesIO(preview), s3_key_preview, "video/mp4")
+                    result["s3_key_preview"] = s3_key_preview
+
+            if settings.HLS_ENABLED and analysis.width and analysis.height:
+                try:
+                    result["s3_key_hls"] = create_hls_rendition(
+                        local_path, s3_key, analysis.width, analysis.height, analysis.has_audio, storage
+                    )
+                except Exception as e:
+                    # HLS가 없어도 원본 재생은 가능하므로 나머지 처리 결과는 반영
+                    logger.error(f"HLS 변환 실패 ({s3_key}): {str(e)}")
+
+    if content_type.startswith('video/') and analysis.width is None:
+        logger.warning(f"비디오 크기 정보를 가져올 수 없습니다: {file_name}")
+
+    if analysis.thumbnail:
+        thumbnail_filename = f"{os.path.splitext(file_name)[0]}_thumbnail.jpg"
+        s3_key_thumbnail = build_s3_key(thumbnail_filename, "image/jpeg")
+        storage.put_file(io.BytesIO(analysis.thumbnail), s3_key_thumbnail, "image/jpeg")
+        result["s3_key_thumbnail"] = s3_key_thumbnail
+
+    result.update(
+        width=analysis.width,
+        height=analysis.height,
+        duration=analysis.duration,
+        video_codec=analysis.video_codec,
+        bitrate=analysis.bitrate,
+        blurhash=analysis.blurhash,
+        dominant_color=analysis.dominant_color
+    )
+    logger.info(f"미디어 처리 완료: {s3_key} ({analysis.width}x{analysis.height}, {analysis.duration}s, {analysis.video_codec})")
+    return result
@@ -0,0 +1,230 @@
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.services.media_jobs import (
+    ClaimedMediaJob,
+    claim_media_jobs,
+    complete_media_job,
+    fail_media_job,
+    release_media_jobs
+)
+from app.services.media_processing import process_media_file
+
+logger = logging.getLogger(__name__)
+
+
+class MediaWorker:
+    """
+    media_jobs 테이블을 폴링하여 미디어 처리 작업을 프로세스 풀에서 실행하는 워커
+
+    - 디스패처 스레드 하나가 작업을 가져오고(claim), 완료된 결과를 DB에 반영합니다.
+    - ffprobe/썸네일 추출은 CPU를 많이 쓰므로 코어 수만큼의 프로세스에서 실행합니다.
+    - 프로세스 풀이 비어 있을 때만 새 작업을 가져오므로 대기 중인 작업은 DB에 남아 다른 워커가 가져갈 수 있습니다.
+    - 자식 프로세스가 죽어(OOM 등) 풀이 깨지면 새 풀을 만들고 계속 처리합니다. 함께 실행 중이던 작업 중
+      어느 것이 원인인지 알 수 없으므로 시도 횟수를 되돌려 다시 대기시키고, 그 작업들은 하나씩 따로 실행해
+      원인 작업만 실패로 기록되게 합니다.
+    """
+
+    def __init__(self, processes: Optional[int] = None, poll_interval: Optional[float] = None):
+        self.processes = processes or settings.MEDIA_WORKER_PROCESSES or os.cpu_count() or 1
+        self.poll_interval = poll_interval or settings.MEDIA_WORKER_POLL_SECONDS
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._generation = 0  # 프로세스 풀을 새로 만들 때마다 증가
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._results: "queue.Queue[tuple[ClaimedMediaJob, int, Future]]" = queue.Queue()
+        self._in_flight = 0
+        self._in_flight_by_generation: Dict[int, int] = {}
+        self._crashed: Dict[int, int] = {}  # 깨진 풀 세대별로 함께 실행 중이던 작업 수
+        self._isolated = 0  # 풀이 깨진 뒤 하나씩 따로 실행할 작업 수
+
+    def start(self) -> None:
+        """프로세스 풀과 디스패처 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._create_pool()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="media-worker", daemon=True)
+        self._thread.start()
+        logger.info(f"미디어 워커 시작 (프로세스 {self.processes}개)")
+
+    def wake(self) -> None:
+        """새 작업이 추가되었음을 알려 폴링 주기를 기다리지 않고 바로 가져가게 합니다."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """
+        새 작업 가져오기를 멈추고, 실행 중인 작업이 끝나 결과가 반영될 때까지 기다립니다.
+        """
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join()
+        self._pool.shutdown(wait=True)
+        self._thread = None
+        self._pool = None
+        logger.info("미디어 워커 종료")
+
+    def _create_pool(self) -> None:
+        # 부모 프로세스의 스레드/커넥션 상태를 복제하지 않도록 spawn 방식으로 자식 프로세스 생성
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        self._generation += 1
+
+    def _restart_pool(self, generation: int) -> None:
+        """깨진 프로세스 풀을 새로 만듭니다. (이미 새로 만든 세대면 무시)"""
+        if generation != self._generation:
+            return
+        logger.warning(f"미디어 워커 프로세스 풀이 중단되어 다시 시작합니다. (세대 {generation})")
+        try:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        except Exception as e:
+            logger.error(f"중단된 프로세스 풀 정리 실패: {str(e)}")
+        self._create_pool()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._apply_results()
+
+                if self._stopping.is_set():
+                    if self._in_flight == 0:
+                        return
+                else:
+                    claimed = self._claim()
+                    if claimed:
+                        continue
+            except Exception as e:
+                # 한 번의 오류로 디스패처 스레드가 종료되어 작업 처리가 멈추지 않도록 다음 주기에 다시 시도
+                logger.exception(f"미디어 워커 디스패처 오류: {str(e)}")
+
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _claim(self) -> int:
+        """비어 있는 프로세스 수만큼 작업을 가져와 프로세스 풀에 제출합니다."""
+        free = self.processes - self._in_flight
+        if self._isolated:
+            # 풀을 깨뜨린 작업을 찾기 위해 다른 작업 없이 하나씩 실행
+            free = 1 if self._in_flight == 0 else 0
+        if free <= 0:
+            return 0
+
+        db = SessionLocal()
+        try:
+            jobs = claim_media_jobs(db, free)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"미디어 작업 가져오기 실패: {str(e)}")
+            return 0
+        finally:
+            db.close()
+
+        for index, job in enumerate(jobs):
+            generation = self._generation
+            try:
+                future = self._pool.submit(
+                    process_media_file, job.s3_key, job.content_type, job.file_name, compute_hash=job.compute_hash
+                )
+            except Exception as e:
+                # BrokenProcessPool 등: 제출하지 못한 작업은 되돌리고 풀을 새로 만듦
+                logger.error(f"미디어 작업 제출 실패 (file_id={job.file_id}): {str(e)}")
+                self._release([pending.job_id for pending in jobs[index:]])
+                self._restart_pool(generation)
+                return index
+            self._in_flight += 1
+            self._in_flight_by_generation[generation] = self._in_flight_by_generation.get(generation, 0) + 1
+            if self._isolated:
+                self._isolated -= 1
+            future.add_done_callback(lambda f, job=job, generation=generation: self._on_done(job, generation, f))
+        return len(jobs)
+
+    def _release(self, job_ids: List[int]) -> None:
+        db = SessionLocal()
+        try:
+            release_media_jobs(db, job_ids)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"미디어 작업 되돌리기 실패 (job_ids={job_ids}): {str(e)}")
+        finally:
+            db.close()
+
+    def _on_done(self, job: ClaimedMediaJob, generation: int, future: Future) -> None:
+        # 프로세스 풀 관리 스레드에서 호출되므로 DB 반영은 디스패처 스레드에 넘김
+        self._results.put((job, generation, future))
+        self._wake.set()
+
+    def _apply_results(self) -> None:
+        """완료된 작업의 결과를 DB에 반영합니다."""
+        while True:
+            try:
+                job, generation, future = self._results.get_nowait()
+            except queue.Empty:
+                return
+
+            error = future.exception()
+            crashed = 0
+            if isinstance(error, BrokenProcessPool):
+                # 같은 세대의 실행 중 작업은 모두 같은 이유로 실패하므로 처음 받았을 때 함께 실행 중이던 수를 기록
+                crashed = self._crashed.setdefault(generation, self._in_flight_by_generation.get(generation, 0))
+                self._restart_pool(generation)
+            self._in_flight -= 1
+            self._in_flight_by_generation[generation] -= 1
+            if not self._in_flight_by_generation[generation]:
+                del self._in_flight_by_generation[generation]
+                self._crashed.pop(generation, None)
+
+            if isinstance(error, BrokenProcessPool) and crashed > 1:
+                # 어느 작업이 원인인지 알 수 없으므로 시도 횟수를 되돌리고 하나씩 다시 실행
+                logger.warning(f"프로세스 풀 중단으로 미디어 작업을 다시 대기시킵니다. (file_id={job.file_id})")
+                self._release([job.job_id])
+                self._isolated += 1
+                continue
+
+            db = SessionLocal()
+            try:
+                if error is None:
+                    complete_media_job(db, job.job_id, future.result())
+                else:
+                    logger.warning(f"미디어 처리 오류 (file_id={job.file_id}): {str(error) or type(error).__name__}")
+                    fail_media_job(db, job.job_id, str(error) or type(error).__name__)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"미디어 작업 결과 반영 실패 (job_id={job.job_id}): {str(e)}")
+            finally:
+                db.close()
+
+
+# API 서버 프로세스에 내장되는 워커 (MEDIA_WORKER_ENABLED=True인 경우 lifespan에서 시작)
+media_worker = MediaWorker()
+
+
+def wake_media_worker() -> None:
+    """작업을 큐에 넣고 커밋한 뒤 호출합니다. (내장 워커가 없으면 아무 일도 하지 않음)"""
+    media_worker.wake()
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.services.media_worker
+    # API 서버와 분리된 프로세스에서 워커만 실행할 때 사용합니다. (MEDIA_WORKER_ENABLED=False로 두고 실행)
+    logging.basicConfig(level=logging.INFO)
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    media_worker.start()
+    stop_event.wait()
+    media_worker.stop()
@@ -0,0 +1,184 @@
+import argparse
+import logging
+import signal
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import exists, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.file import File
+from app.models.user import User
+from app.services.media_objects import release_file_storage
+from app.services.s3 import abort_stale_multipart_uploads
+from app.services.storage_deletions import enqueue_storage_deletions, wake_storage_deletion_drainer
+
+logger = logging.getLogger(__name__)
+
+
+def _orphan_file_filter(cutoff: datetime):
+    """피드에 첨부되지 않았고 프로필 사진도 아닌, cutoff 이전에 업로드된 파일 조건"""
+    return (
+        File.feed_id.is_(None),
+        File.created_at < cutoff,
+        ~exists().where(User.profile_file_id == File.id),
+    )
+
+
+def collect_orphan_files(
+    db: Session,
+    ttl_hours: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    dry_run: bool = False
+) -> dict:
+    """
+    업로드 후 피드에 첨부되지 않은 채 ttl_hours가 지난 파일을 삭제합니다.
+
+    - chunk_size개씩 나눠 잠그고(SKIP LOCKED) 청크마다 커밋하므로 행 잠금이 오래 유지되지 않습니다.
+    - S3 객체는 같은 트랜잭션에서 삭제 대기열에 넣어 백그라운드에서 일괄 삭제합니다.
+    - 같은 원본을 다른 파일이 쓰고 있으면 참조 수만 줄이고 S3 객체는 남깁니다.
+    - presign 후 finalize되지 않아 업로드 토큰이 만료된 multipart 업로드도 중단합니다.
+    - dry_run이면 아무것도 삭제하지 않고 대상 파일 수와 용량만 집계합니다.
+
+    Returns:
+        dict: 대상/삭제 파일 수, 파일 용량 합계, 삭제 대기열에 넣은 S3 항목 수, 중단한 multipart 업로드 수
+    """
+    ttl_hours = ttl_hours or settings.ORPHAN_FILE_TTL_HOURS
+    chunk_size = chunk_size or settings.ORPHAN_FILE_GC_CHUNK_SIZE
+    cutoff = datetime.now() - timedelta(hours=ttl_hours)
+
+    if dry_run:
+        count, total_size = (
+            db.query(func.count(File.id), func.coalesce(func.sum(File.file_size), 0))
+            .filter(*_orphan_file_filter(cutoff))
+            .one()
+        )
+        report = {
+            "dry_run": True,
+            "files": count,
+            "bytes": int(total_size),
+            "storage_deletions": 0,
+            "aborted_uploads": _abort_stale_uploads(dry_run=True),
+        }
+        logger.info(f"고아 파일 점검 (dry run, {ttl_hours}시간 경과): {report}")
+        return report
+
+    report = {"dry_run": False, "files": 0, "bytes": 0, "storage_deletions": 0, "aborted_uploads": 0}
+    last_id = 0
+    while True:
+        try:
+            files = (
+                db.query(File)
+                .filter(File.id > last_id, *_orphan_file_filter(cutoff))
+                .order_by(File.id)
+                .limit(chunk_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not files:
+                db.rollback()
+                break
+            last_id = files[-1].id
+
+            for file in files:
+                s3_keys, s3_prefixes = release_file_storage(db, file)
+                report["storage_deletions"] += enqueue_storage_deletions(db, s3_keys, s3_prefixes)
+                report["bytes"] += file.file_size or 0
+                db.delete(file)
+            db.commit()
+            report["files"] += len(files)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"고아 파일 삭제 중 오류 발생: {str(e)}")
+            raise
+        wake_storage_deletion_drainer()
+
+    report["aborted_uploads"] = _abort_stale_uploads()
+    logger.info(f"고아 파일 삭제 완료 ({ttl_hours}시간 경과): {report}")
+    return report
+
+
+def _abort_stale_uploads(dry_run: bool = False) -> int:
+    """
+    업로드 토큰이 만료되어 더 이상 finalize할 수 없는 multipart 업로드를 중단합니다.
+    S3 오류가 나도 파일 정리는 계속되도록 로그만 남깁니다.
+    """
+    older_than = datetime.now(timezone.utc) - timedelta(seconds=settings.S3_PRESIGN_EXPIRE_SECONDS)
+    try:
+        return abort_stale_multipart_uploads(older_than, dry_run=dry_run)
+    except Exception as e:
+        logger.error(f"미완료 multipart 업로드 정리 실패: {str(e)}")
+        return 0
+
+
+class OrphanFileCollector:
+    """ORPHAN_FILE_GC_INTERVAL_SECONDS마다 고아 파일을 정리하는 백그라운드 스레드"""
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval or settings.ORPHAN_FILE_GC_INTERVAL_SECONDS
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="orphan-file-gc", daemon=True)
+        self._thread.start()
+        logger.info(f"고아 파일 정리 시작 ({self.interval}초 주기)")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("고아 파일 정리 종료")
+
+    def _run(self) -> None:
+        # 서버 시작 직후 부하를 피하도록 한 주기 기다린 뒤 실행
+        while not self._stopping.wait(self.interval):
+            db = SessionLocal()
+            try:
+                collect_orphan_files(db)
+            except Exception:
+                pass  # collect_orphan_files에서 로그를 남김, 다음 주기에 다시 시도
+            finally:
+                db.close()
+
+
+# API 서버 프로세스에 내장되는 정리 스레드 (ORPHAN_FILE_GC_ENABLED=True인 경우 lifespan에서 시작)
+orphan_file_collector = OrphanFileCollector()
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.services.orphan_files [--dry-run] [--ttl-hours 24] [--chunk-size 500] [--loop]
+    # cron 등 외부 스케줄러에서 한 번씩 실행하거나, --loop로 주기 실행합니다.
+    parser = argparse.ArgumentParser(description="피드에 첨부되지 않은 오래된 업로드 파일 정리")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상 파일 수와 용량만 출력")
+    parser.add_argument("--ttl-hours", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--loop", action="store_true", help="ORPHAN_FILE_GC_INTERVAL_SECONDS마다 반복 실행")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.loop:
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+        orphan_file_collector.start()
+        stop_event.wait()
+        orphan_file_collector.stop()
+    else:
+        db = SessionLocal()
+        try:
+            result = collect_orphan_files(db, args.ttl_hours, args.chunk_size, args.dry_run)
+            print(f"{'삭제 대상' if result['dry_run'] else '삭제'}: {result['files']}개 파일, {result['bytes']} bytes")
+            if not result["dry_run"]:
+                print(f"S3 삭제 대기열 추가: {result['storage_deletions']}건")
+            print(f"{'중단 대상' if result['dry_run'] else '중단한'} multipart 업로드: {result['aborted_uploads']}건")
+        finally:
+            db.close()
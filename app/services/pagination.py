@@ -0,0 +1,57 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import and_, or_
+
+# 목록 API 한 페이지의 최대 크기 (limit 쿼리 파라미터 상한)
+MAX_PAGE_LIMIT = 100
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """
+    (created_at, id) 키를 클라이언트에 전달할 불투명한 커서 문자열로 인코딩합니다.
+    """
+    payload = json.dumps({"c": created_at.isoformat(), "i": item_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id) 튜플로 디코딩합니다.
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def apply_keyset_page(query, created_at_column, id_column, cursor: str | None, offset: int, limit: int):
+    """
+    (created_at, id) 내림차순 정렬 쿼리에 페이지 조건을 적용합니다.
+
+    - cursor가 주어지면 커서 위치 이후의 행만 조회합니다 (keyset 방식, offset 무시).
+    - cursor가 없으면 기존 offset 방식으로 조회합니다.
+    - 다음 페이지 존재 여부를 판단하기 위해 limit + 1개를 조회합니다.
+    """
+    query = query.order_by(created_at_column.desc(), id_column.desc())
+
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        # (created_at, id) < (cursor_created_at, cursor_id) 를 인덱스를 탈 수 있는 형태로 풀어서 작성
+        query = query.filter(
+            or_(
+                created_at_column < cursor_created_at,
+                and_(created_at_column == cursor_created_at, id_column < cursor_id)
+            )
+        )
+    else:
+        query = query.offset(offset)
+
+    return query.limit(limit + 1)
@@ -0,0 +1,121 @@
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# BlurHash 컴포넌트 수 (가로 x 세로) - 피드 타일에는 4x3이면 충분
+BLURHASH_X_COMPONENTS = 4
+BLURHASH_Y_COMPONENTS = 3
+
+# 플레이스홀더 계산용 축소 크기 (긴 변 기준)
+PLACEHOLDER_SAMPLE_SIZE = 32
+
+BASE83_CHARACTERS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def _encode_base83(value: int, length: int) -> str:
+    result = ""
+    for index in range(1, length + 1):
+        digit = (value // (83 ** (length - index))) % 83
+        result += BASE83_CHARACTERS[digit]
+    return result
+
+
+def _srgb_to_linear(values: np.ndarray) -> np.ndarray:
+    values = values / 255.0
+    return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(value: float) -> int:
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def encode_blurhash(pixels: np.ndarray, x_components: int = BLURHASH_X_COMPONENTS, y_components: int = BLURHASH_Y_COMPONENTS) -> str:
+    """
+    (height, width, 3) RGB uint8 배열을 BlurHash 문자열로 인코딩합니다.
+    각 컴포넌트의 코사인 기저와의 내적을 NumPy 행렬 연산으로 한 번에 계산합니다.
+    """
+    height, width, _ = pixels.shape
+    linear = _srgb_to_linear(pixels.astype(np.float64))
+
+    # basis_y: (y_components, height), basis_x: (x_components, width)
+    basis_y = np.cos(np.pi * np.arange(y_components)[:, None] * np.arange(height)[None, :] / height)
+    basis_x = np.cos(np.pi * np.arange(x_components)[:, None] * np.arange(width)[None, :] / width)
+
+    # factors[j, i, c] = sum_y sum_x basis_y[j, y] * basis_x[i, x] * linear[y, x, c]
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    normalisation = np.full((y_components, x_components), 2.0)
+    normalisation[0, 0] = 1.0
+    factors = (factors * normalisation[:, :, None]).reshape(-1, 3)
+
+    dc, ac = factors[0], factors[1:]
+
+    result = _encode_base83((x_components - 1) + (y_components - 1) * 9, 1)
+
+    if len(ac):
+        actual_max = float(np.abs(ac).max())
+        quantised_max = int(max(0, min(82, int(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += _encode_base83(quantised_max, 1)
+    else:
+        max_value = 1.0
+        result += _encode_base83(0, 1)
+
+    r, g, b = (_linear_to_srgb(value) for value in dc)
+    result += _encode_base83((r << 16) + (g << 8) + b, 4)
+
+    quantised = np.floor(np.sign(ac / max_value) * np.abs(ac / max_value) ** 0.5 * 9 + 9.5)
+    quantised = np.clip(quantised, 0, 18).astype(int)
+    for quant_r, quant_g, quant_b in quantised:
+        result += _encode_base83(quant_r * 19 * 19 + quant_g * 19 + quant_b, 2)
+
+    return result
+
+
+def dominant_color(pixels: np.ndarray) -> str:
+    """
+    색상을 채널당 4비트로 묶어 가장 많은 픽셀이 속한 구간의 평균색을 #rrggbb로 반환합니다.
+    """
+    flat = pixels.reshape(-1, 3).astype(np.int64)
+    buckets = (flat[:, 0] >> 4) << 8 | (flat[:, 1] >> 4) << 4 | (flat[:, 2] >> 4)
+    top_bucket = np.bincount(buckets).argmax()
+    r, g, b = flat[buckets == top_bucket].mean(axis=0).round().astype(int)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def compute_placeholder(image: Image.Image) -> Tuple[str, str]:
+    """
+    이미지를 PLACEHOLDER_SAMPLE_SIZE 이하로 축소한 뒤 (BlurHash, 대표 색상)을 계산합니다.
+    EXIF 회전을 적용하므로 결과는 화면에 보이는 방향 기준입니다.
+    """
+    # JPEG는 디코딩 단계에서 1/8까지 축소해서 읽음
+    image.draft("RGB", (PLACEHOLDER_SAMPLE_SIZE * 4, PLACEHOLDER_SAMPLE_SIZE * 4))
+    image = ImageOps.exif_transpose(image)
+    if image.mode != "RGB":
+        # 투명 영역은 흰색 배경 위에 합성
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        image = background
+    image.thumbnail((PLACEHOLDER_SAMPLE_SIZE, PLACEHOLDER_SAMPLE_SIZE), Image.BILINEAR)
+
+    pixels = np.asarray(image, dtype=np.uint8)
+    return encode_blurhash(pixels), dominant_color(pixels)
+
+
+def compute_placeholder_from_file(fp) -> Tuple[Optional[str], Optional[str]]:
+    """
+    이미지 파일(경로 또는 파일 객체)의 플레이스홀더를 계산합니다. 실패하면 (None, None)을 반환합니다.
+    """
+    try:
+        with Image.open(fp) as image:
+            return compute_placeholder(image)
+    except Exception as e:
+        logger.warning(f"플레이스홀더 계산 실패: {str(e)}")
+        return None, None
@@ -1,9 +1,18 @@
+import asyncio
+import functools
+import uuid
 import boto3
 import os
+import tempfile
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from fastapi import UploadFile
 import logging
-from typing import List
-from datetime import datetime
+from typing import Awaitable, BinaryIO, Callable, List, Optional, Tuple, TypeVar, Union
+from datetime import datetime, timezone
+from app.core.config import settings
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -14,11 +23,43 @@ s3_client = boto3.client(
     's3',
     aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
     aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-    region_name=os.getenv('AWS_REGION')
+    region_name=os.getenv('AWS_REGION'),
+    # multipart 파트 병렬 업로드 수만큼 커넥션 풀 확보
+    config=Config(max_pool_connections=max(10, settings.S3_MULTIPART_MAX_CONCURRENCY * 2))
 )
 
 BUCKET_NAME = os.getenv('AWS_BUCKET_NAME')
 
+MB = 1024 * 1024
+
+# Content-Type 없이 올라온 파일에 사용할 콘텐츠 타입 (files.content_type은 NOT NULL)
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# delete_objects 한 번에 삭제할 수 있는 최대 키 수 (S3 제한)
+S3_DELETE_BATCH_SIZE = 1000
+
+## 공유 전송 매니저 설정 (큰 파일은 multipart로 나눠 파트를 병렬 업로드)
+transfer_config = TransferConfig(
+    multipart_threshold=settings.S3_MULTIPART_THRESHOLD_MB * MB,
+    multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE_MB * MB,
+    max_concurrency=settings.S3_MULTIPART_MAX_CONCURRENCY,
+    use_threads=True
+)
+transfer_manager = create_transfer_manager(s3_client, transfer_config)
+
+## 블로킹 S3 호출 전용 스레드 풀 (이벤트 루프를 막지 않도록 여기서 실행)
+s3_executor = ThreadPoolExecutor(max_workers=settings.S3_UPLOAD_CONCURRENCY, thread_name_prefix="s3")
+
+T = TypeVar("T")
+
+class S3UploadError(Exception):
+    """여러 파일 업로드 중 실패한 파일들의 오류를 모아서 전달하는 예외"""
+
+    def __init__(self, errors: List[Tuple[str, BaseException]]):
+        self.errors = errors
+        details = ", ".join(f"{filename}: {error}" for filename, error in errors)
+        super().__init__(f"{len(errors)}개 파일 업로드 실패 ({details})")
+
 def get_s3_prefix(content_type: str) -> str:
     """
     콘텐츠 타입에 따라 S3 프리픽스를 반환합니다.
@@ -37,57 +78,224 @@ def get_s3_prefix(content_type: str) -> str:
         # 기본값 (알 수 없는 타입)
         return "poestagram/files"
 
+def build_s3_key(filename: str, content_type: str) -> str:
+    """
+    콘텐츠 타입별 프리픽스와 타임스탬프를 붙여 S3 키를 생성합니다.
+    (예: "poestagram/videos/20231201_120000_video.mp4")
+    """
+    prefix = get_s3_prefix(content_type)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # 같은 초에 같은 이름으로 동시에 올라오는 파일이 서로 덮어쓰지 않도록 짧은 랜덤 값 추가
+    return f"{prefix}/{timestamp}_{uuid.uuid4().hex[:8]}_{filename}"
+
+def build_s3_url(s3_key: str) -> str:
+    """S3 키로 업로드된 파일의 URL을 생성합니다."""
+    return f"https://{BUCKET_NAME}.s3.{os.getenv('AWS_REGION')}.amazonaws.com/{s3_key}"
+
+def extract_s3_key_from_url(url: str) -> str:
+    """S3 URL에서 s3_key를 추출합니다."""
+    # URL 형식: https://bucket-name.s3.region.amazonaws.com/uploads/file.jpg
+    # s3_key 형식: uploads/file.jpg
+    if ".amazonaws.com/" in url:
+        return url.split(".amazonaws.com/", 1)[1]
+    return url
+
+def abort_incomplete_multipart_uploads(s3_key: str) -> int:
+    """
+    해당 키로 시작된 뒤 완료되지 않은 multipart 업로드를 모두 중단(abort)합니다.
+    중단하지 않으면 업로드된 파트가 보이지 않는 상태로 남아 스토리지 비용이 계속 발생합니다.
+
+    Returns:
+        int: 중단한 업로드 수
+    """
+    aborted = 0
+    try:
+        response = s3_client.list_multipart_uploads(Bucket=BUCKET_NAME, Prefix=s3_key)
+        for upload in response.get('Uploads', []):
+            if upload['Key'] != s3_key:
+                continue
+            s3_client.abort_multipart_upload(
+                Bucket=BUCKET_NAME,
+                Key=s3_key,
+                UploadId=upload['UploadId']
+            )
+            aborted += 1
+        if aborted:
+            logger.info(f"미완료 multipart 업로드 중단: {s3_key} ({aborted}건)")
+    except Exception as e:
+        logger.error(f"미완료 multipart 업로드 중단 실패 ({s3_key}): {str(e)}")
+    return aborted
+
+def transfer_to_s3(source: Union[str, BinaryIO], s3_key: str, content_type: str) -> None:
+    """
+    공유 전송 매니저로 파일 경로 또는 파일 객체를 S3에 업로드합니다.
+
+    - multipart_threshold 이상이면 multipart 업로드로 파트를 병렬 전송합니다.
+    - 실패하면 남아 있을 수 있는 multipart 업로드를 중단한 뒤 예외를 다시 발생시킵니다.
+    """
+    future = transfer_manager.upload(
+        source,
+        BUCKET_NAME,
+        s3_key,
+        extra_args={"ContentType": content_type}
+    )
+    try:
+        future.result()
+    except Exception:
+        abort_incomplete_multipart_uploads(s3_key)
+        raise
+
+def shutdown_transfer_manager() -> None:
+    """서버 종료 시 전송 매니저와 S3 전용 스레드 풀을 정리합니다."""
+    transfer_manager.shutdown()
+    s3_executor.shutdown(wait=True)
+
+async def run_s3_call(func: Callable[..., T], *args) -> T:
+    """
+    블로킹 boto3 호출을 S3 전용 스레드 풀에서 실행합니다.
+    이벤트 루프를 막지 않으며, anyio 기본 스레드 풀(동기 엔드포인트용)과도 분리됩니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(s3_executor, functools.partial(func, *args))
+
 async def upload_file_to_s3(file: UploadFile) -> str:
     """
     단일 파일을 S3에 업로드하고 URL을 반환합니다.
     콘텐츠 타입에 따라 자동으로 프리픽스를 설정합니다.
+    파일 내용을 한 번에 읽지 않고 파일 객체에서 청크 단위로 스트리밍 업로드합니다.
     """
     try:
-        # 콘텐츠 타입에 따른 프리픽스 결정
-        prefix = get_s3_prefix(file.content_type)
-        
-        # 파일명에 타임스탬프 추가
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_extension = os.path.splitext(file.filename)[1]
-        s3_key = f"{prefix}/{timestamp}_{file.filename}"
+        s3_key = build_s3_key(file.filename, file.content_type)
         
-        # 파일 내용 읽기
-        file_content = await file.read()
-        
-        # S3에 업로드
-        s3_client.put_object(
-            Bucket=BUCKET_NAME,
-            Key=s3_key,
-            Body=file_content,
-            ContentType=file.content_type
-        )
-        
-        # 업로드된 파일의 URL 생성
-        file_url = f"https://{BUCKET_NAME}.s3.{os.getenv('AWS_REGION')}.amazonaws.com/{s3_key}"
+        # 파일 객체를 처음부터 스트리밍 업로드 (S3 전용 스레드 풀에서 실행)
+        file.file.seek(0)
+        await run_s3_call(transfer_to_s3, file.file, s3_key, file.content_type or DEFAULT_CONTENT_TYPE)
         
         logger.info(f"파일 업로드 성공: {s3_key}")
-        return file_url
+        return build_s3_url(s3_key)
         
     except Exception as e:
         logger.error(f"파일 업로드 실패: {str(e)}")
         raise Exception(f"파일 업로드 중 오류가 발생했습니다: {str(e)}")
 
-async def upload_files_to_s3(files: List[UploadFile]) -> List[str]:
+async def gather_bounded(coroutines: List[Awaitable[T]], limit: int = None) -> List[Union[T, BaseException]]:
     """
-    여러 파일을 S3에 업로드하고 URL 목록을 반환합니다.
-    각 파일의 콘텐츠 타입에 따라 자동으로 프리픽스를 설정합니다.
+    코루틴들을 최대 limit개씩 동시에 실행하고, 입력 순서대로 결과(또는 발생한 예외)를 반환합니다.
     """
-    file_urls = []
-    
-    for file in files:
-        try:
-            file_url = await upload_file_to_s3(file)
-            file_urls.append(file_url)
-        except Exception as e:
-            logger.error(f"파일 업로드 실패 ({file.filename}): {str(e)}")
-            raise e
-    
-    return file_urls
+    semaphore = asyncio.Semaphore(limit or settings.S3_UPLOAD_CONCURRENCY)
+
+    async def _run(coroutine: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*[_run(coroutine) for coroutine in coroutines], return_exceptions=True)
+
+def create_presigned_put_url(s3_key: str, content_type: str, content_length: int) -> str:
+    """
+    클라이언트가 S3에 직접 업로드할 수 있는 단일 PUT presigned URL을 생성합니다.
+    업로드 시 Content-Type, Content-Length 헤더는 서명에 포함된 값과 같아야 합니다.
+    (선언한 크기와 다른 파일은 S3가 거부)
+    """
+    return s3_client.generate_presigned_url(
+        'put_object',
+        Params={'Bucket': BUCKET_NAME, 'Key': s3_key, 'ContentType': content_type, 'ContentLength': content_length},
+        ExpiresIn=settings.S3_PRESIGN_EXPIRE_SECONDS
+    )
+
+def create_presigned_multipart_upload(s3_key: str, content_type: str, part_count: int) -> Tuple[str, List[str]]:
+    """
+    multipart 업로드를 시작하고 파트별 PUT presigned URL 목록을 생성합니다.
+
+    Returns:
+        Tuple[str, List[str]]: (upload_id, 파트 번호 1부터 순서대로 정렬된 URL 목록)
+    """
+    response = s3_client.create_multipart_upload(
+        Bucket=BUCKET_NAME,
+        Key=s3_key,
+        ContentType=content_type
+    )
+    upload_id = response['UploadId']
+    part_urls = [
+        s3_client.generate_presigned_url(
+            'upload_part',
+            Params={
+                'Bucket': BUCKET_NAME,
+                'Key': s3_key,
+                'UploadId': upload_id,
+                'PartNumber': part_number
+            },
+            ExpiresIn=settings.S3_PRESIGN_EXPIRE_SECONDS
+        )
+        for part_number in range(1, part_count + 1)
+    ]
+    return upload_id, part_urls
+
+def complete_multipart_upload(s3_key: str, upload_id: str, parts: List[dict]) -> None:
+    """
+    클라이언트가 업로드한 파트들로 multipart 업로드를 완료합니다.
+
+    Args:
+        parts: [{"PartNumber": 1, "ETag": "..."}, ...] 형식의 파트 목록
+    """
+    s3_client.complete_multipart_upload(
+        Bucket=BUCKET_NAME,
+        Key=s3_key,
+        UploadId=upload_id,
+        MultipartUpload={'Parts': sorted(parts, key=lambda part: part['PartNumber'])}
+    )
+
+def abort_stale_multipart_uploads(older_than: datetime, prefix: str = "poestagram/", dry_run: bool = False) -> int:
+    """
+    older_than 이전에 시작되어 아직 완료되지 않은 multipart 업로드를 모두 중단(abort)합니다.
+    presign 후 finalize되지 않은 직접 업로드의 파트가 계속 과금되지 않도록 정리합니다.
+
+    Args:
+        older_than: 이 시각 이전에 시작된 업로드만 중단 (timezone-aware)
+        dry_run: True면 중단하지 않고 대상 수만 반환
+
+    Returns:
+        int: 중단한(dry_run이면 중단할) 업로드 수
+    """
+    aborted = 0
+    paginator = s3_client.get_paginator('list_multipart_uploads')
+    for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=prefix):
+        for upload in page.get('Uploads', []):
+            if upload['Initiated'] >= older_than:
+                continue
+            if not dry_run:
+                try:
+                    s3_client.abort_multipart_upload(Bucket=BUCKET_NAME, Key=upload['Key'], UploadId=upload['UploadId'])
+                except Exception as e:
+                    logger.error(f"미완료 multipart 업로드 중단 실패 ({upload['Key']}): {str(e)}")
+                    continue
+            aborted += 1
+    if aborted:
+        logger.info(f"오래된 미완료 multipart 업로드 {'확인' if dry_run else '중단'}: {aborted}건")
+    return aborted
+
+def head_s3_object(s3_key: str) -> dict | None:
+    """S3 객체의 메타데이터(크기, 콘텐츠 타입 등)를 조회합니다. 객체가 없으면 None을 반환합니다."""
+    try:
+        return s3_client.head_object(Bucket=BUCKET_NAME, Key=s3_key)
+    except s3_client.exceptions.ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+
+@contextmanager
+def download_s3_object_to_temp_file(s3_key: str):
+    """
+    S3 객체를 공유 전송 매니저로 임시 파일에 내려받고 그 경로를 반환합니다.
+    컨텍스트를 벗어나면 임시 파일은 삭제됩니다.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(s3_key)[1]) as temp_file:
+        temp_filename = temp_file.name
+    try:
+        transfer_manager.download(BUCKET_NAME, s3_key, temp_filename).result()
+        yield temp_filename
+    finally:
+        if os.path.exists(temp_filename):
+            os.unlink(temp_filename)
 
 def delete_file_from_s3(s3_key: str) -> bool:
     """
@@ -108,4 +316,50 @@ def delete_file_from_s3(s3_key: str) -> bool:
         return True
     except Exception as e:
         logger.error(f"S3 파일 삭제 실패 ({s3_key}): {str(e)}")
-        return False 
\ No newline at end of file
+        return False
+
+def delete_s3_objects(s3_keys: List[str]) -> List[Tuple[str, str]]:
+    """
+    여러 S3 객체를 delete_objects로 한 번에 최대 1000개씩 삭제합니다.
+    (이미 없는 키는 S3가 성공으로 처리)
+
+    Returns:
+        List[Tuple[str, str]]: 삭제에 실패한 (키, 오류 메시지) 목록
+    """
+    failed = []
+    for start in range(0, len(s3_keys), S3_DELETE_BATCH_SIZE):
+        batch = s3_keys[start:start + S3_DELETE_BATCH_SIZE]
+        try:
+            response = s3_client.delete_objects(
+                Bucket=BUCKET_NAME,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+            )
+        except Exception as e:
+            logger.error(f"S3 일괄 삭제 요청 실패 ({len(batch)}개): {str(e)}")
+            failed.extend((key, str(e)) for key in batch)
+            continue
+        for error in response.get('Errors', []):
+            logger.error(f"S3 파일 삭제 실패 ({error.get('Key')}): {error.get('Message')}")
+            failed.append((error.get('Key'), error.get('Message') or error.get('Code') or ''))
+    return failed
+
+def list_s3_keys(prefix: str) -> List[str]:
+    """프리픽스 아래의 모든 S3 키를 반환합니다."""
+    keys = []
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=prefix):
+        keys.extend(item['Key'] for item in page.get('Contents', []))
+    return keys
+
+def delete_s3_prefix(prefix: str) -> int:
+    """
+    프리픽스 아래의 모든 S3 객체를 삭제합니다. (HLS 세그먼트처럼 여러 객체로 저장된 경우)
+    한 번에 최대 1000개씩 delete_objects로 삭제합니다.
+
+    Returns:
+        int: 삭제한 객체 수
+    """
+    keys = list_s3_keys(prefix)
+    deleted = len(keys) - len(delete_s3_objects(keys))
+    logger.info(f"S3 프리픽스 삭제 완료: {prefix} ({deleted}개)")
+    return deleted
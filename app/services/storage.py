@@ -0,0 +1,161 @@
+import logging
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Tuple, Union
+
+from app.core.config import settings
+from app.services.s3 import (
+    delete_file_from_s3,
+    delete_s3_objects,
+    delete_s3_prefix,
+    download_s3_object_to_temp_file,
+    list_s3_keys,
+    transfer_to_s3,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MediaStorage(ABC):
+    """
+    미디어 처리 파이프라인(원본 다운로드, 썸네일/미리보기/변환본/HLS 업로드, 삭제 대기열)이 사용하는 저장소 인터페이스.
+
+    키는 S3 키와 같은 형식(예: "poestagram/videos/hls/.../master.m3u8")을 사용하며,
+    운영에서는 S3, 로컬 개발/테스트에서는 파일 시스템 구현을 사용합니다.
+    """
+
+    @abstractmethod
+    def put_file(self, source: Union[str, BinaryIO], key: str, content_type: str) -> None:
+        """파일 경로 또는 파일 객체의 내용을 key로 저장합니다."""
+
+    @abstractmethod
+    def download_to_temp_file(self, key: str) -> Iterator[str]:
+        """key의 내용을 임시 파일로 가져와 그 경로를 반환하는 컨텍스트 매니저 (벗어나면 임시 파일 삭제)"""
+
+    @abstractmethod
+    def delete_file(self, key: str) -> bool:
+        """key 하나를 삭제하고 성공 여부를 반환합니다."""
+
+    @abstractmethod
+    def delete_keys(self, keys: List[str]) -> List[Tuple[str, str]]:
+        """여러 키를 삭제하고 실패한 (키, 오류 메시지) 목록을 반환합니다. (이미 없는 키는 성공으로 처리)"""
+
+    @abstractmethod
+    def list_keys(self, prefix: str) -> List[str]:
+        """프리픽스 아래의 모든 키를 반환합니다."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """프리픽스 아래의 모든 키를 삭제하고 삭제한 수를 반환합니다."""
+
+
+class S3MediaStorage(MediaStorage):
+    """S3 버킷에 저장 (공유 전송 매니저 사용)"""
+
+    def put_file(self, source: Union[str, BinaryIO], key: str, content_type: str) -> None:
+        transfer_to_s3(source, key, content_type)
+
+    def download_to_temp_file(self, key: str):
+        return download_s3_object_to_temp_file(key)
+
+    def delete_file(self, key: str) -> bool:
+        return delete_file_from_s3(key)
+
+    def delete_keys(self, keys: List[str]) -> List[Tuple[str, str]]:
+        return delete_s3_objects(keys)
+
+    def list_keys(self, prefix: str) -> List[str]:
+        return list_s3_keys(prefix)
+
+    def delete_prefix(self, prefix: str) -> int:
+        return delete_s3_prefix(prefix)
+
+
+class LocalMediaStorage(MediaStorage):
+    """
+    로컬 디렉터리에 저장 (S3 없이 ffmpeg 처리 결과를 로컬에서 확인할 때 사용)
+    STORAGE_BASE_URL을 이 디렉터리를 서빙하는 주소로 설정하면 url_hls로 바로 재생할 수 있습니다.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(os.path.abspath(self.root) + os.sep):
+            raise ValueError(f"저장소 경로를 벗어난 키입니다: {key}")
+        return path
+
+    def put_file(self, source: Union[str, BinaryIO], key: str, content_type: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if isinstance(source, str):
+            shutil.copyfile(source, path)
+            return
+        with open(path, "wb") as fp:
+            shutil.copyfileobj(source, fp)
+
+    @contextmanager
+    def download_to_temp_file(self, key: str):
+        # 처리 중 원본이 삭제되어도 영향이 없도록 S3 구현과 같이 임시 파일로 복사
+        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(key)[1]) as temp_file:
+            temp_filename = temp_file.name
+        try:
+            shutil.copyfile(self._path(key), temp_filename)
+            yield temp_filename
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+
+    def delete_file(self, key: str) -> bool:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"로컬 파일 삭제 실패 ({key}): {str(e)}")
+            return False
+        return True
+
+    def delete_keys(self, keys: List[str]) -> List[Tuple[str, str]]:
+        failed = []
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                failed.append((key, str(e)))
+        return failed
+
+    def list_keys(self, prefix: str) -> List[str]:
+        # 프리픽스가 디렉터리 경계에서 끝나지 않을 수도 있으므로 상위 디렉터리부터 훑어서 문자열로 비교
+        root = os.path.abspath(self.root)
+        directory = os.path.dirname(self._path(prefix + "_"))
+        keys = []
+        for current, _, filenames in os.walk(directory):
+            for filename in filenames:
+                key = os.path.relpath(os.path.join(current, filename), root).replace(os.sep, "/")
+                if key.startswith(prefix):
+                    keys.append(key)
+        return sorted(keys)
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = self.list_keys(prefix)
+        deleted = len(keys) - len(self.delete_keys(keys))
+        if prefix.endswith("/"):
+            shutil.rmtree(self._path(prefix.rstrip("/")), ignore_errors=True)
+        return deleted
+
+
+def create_media_storage() -> MediaStorage:
+    """설정값(MEDIA_STORAGE_BACKEND)에 따라 미디어 저장소를 생성합니다."""
+    if settings.MEDIA_STORAGE_BACKEND == "local":
+        return LocalMediaStorage(settings.LOCAL_STORAGE_ROOT)
+    return S3MediaStorage()
+
+
+media_storage = create_media_storage()
@@ -0,0 +1,185 @@
+import logging
+import signal
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.storage_deletion import StorageDeletion
+from app.services.storage import MediaStorage, media_storage
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_storage_deletions(db: Session, s3_keys: Iterable[str], s3_prefixes: Iterable[str] = ()) -> int:
+    """
+    삭제할 S3 키와 프리픽스를 삭제 대기열에 추가합니다. (호출한 쪽 트랜잭션에서 커밋)
+    DB 행 삭제와 같은 트랜잭션에 기록되므로, 커밋되면 S3 삭제가 실패해도 재시도되어 객체가 남지 않습니다.
+
+    Returns:
+        int: 추가한 항목 수
+    """
+    now = datetime.now()
+    entries = [StorageDeletion(s3_key=key, is_prefix=False, next_attempt_at=now) for key in s3_keys if key]
+    entries += [StorageDeletion(s3_key=prefix, is_prefix=True, next_attempt_at=now) for prefix in s3_prefixes if prefix]
+    db.add_all(entries)
+    return len(entries)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """attempts번 실패한 항목의 다음 재시도까지 대기 시간 (지수 백오프, 상한 있음)"""
+    seconds = settings.STORAGE_DELETION_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, settings.STORAGE_DELETION_RETRY_MAX_SECONDS))
+
+
+def _claim_storage_deletions(db: Session, limit: int) -> List[StorageDeletion]:
+    """
+    재시도 시각이 된 항목을 최대 limit개 가져오고, 다른 프로세스가 중복 처리하지 않도록
+    다음 시도 시각을 STORAGE_DELETION_LEASE_SECONDS 뒤로 미룬 뒤 커밋합니다.
+    """
+    now = datetime.now()
+    entries = (
+        db.query(StorageDeletion)
+        .filter(StorageDeletion.next_attempt_at <= now)
+        .order_by(StorageDeletion.next_attempt_at, StorageDeletion.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    lease_until = now + timedelta(seconds=settings.STORAGE_DELETION_LEASE_SECONDS)
+    for entry in entries:
+        entry.next_attempt_at = lease_until
+    db.commit()
+    return entries
+
+
+def drain_storage_deletions(db: Session, limit: Optional[int] = None, storage: Optional[MediaStorage] = None) -> int:
+    """
+    삭제 대기열에서 항목을 가져와 저장소(기본값: media_storage)에서 일괄 삭제합니다. (S3는 delete_objects)
+
+    - 프리픽스 항목은 아래의 키 목록으로 펼쳐 개별 키와 함께 최대 1000개씩 묶어 삭제합니다.
+    - 삭제된 항목은 대기열에서 지우고, 실패한 항목은 지수 백오프로 다음 시도 시각을 정합니다.
+
+    Returns:
+        int: 이번에 가져온 항목 수 (limit과 같으면 남은 항목이 더 있을 수 있음)
+    """
+    limit = limit or settings.STORAGE_DELETION_BATCH_SIZE
+    storage = storage or media_storage
+    entries = _claim_storage_deletions(db, limit)
+    if not entries:
+        return 0
+
+    errors: Dict[int, str] = {}
+    keys_by_entry: Dict[int, List[str]] = {}
+    for entry in entries:
+        if not entry.is_prefix:
+            keys_by_entry[entry.id] = [entry.s3_key]
+            continue
+        try:
+            keys_by_entry[entry.id] = storage.list_keys(entry.s3_key)
+        except Exception as e:
+            errors[entry.id] = f"프리픽스 목록 조회 실패: {str(e)}"
+
+    entries_by_key = defaultdict(list)
+    for entry_id, keys in keys_by_entry.items():
+        for key in keys:
+            entries_by_key[key].append(entry_id)
+
+    for key, message in storage.delete_keys(list(entries_by_key)):
+        for entry_id in entries_by_key.get(key, []):
+            errors[entry_id] = f"{key}: {message}"
+
+    now = datetime.now()
+    for entry in entries:
+        if entry.id in errors:
+            entry.attempts += 1
+            entry.last_error = errors[entry.id]
+            entry.next_attempt_at = now + _retry_delay(entry.attempts)
+        else:
+            db.delete(entry)
+    db.commit()
+
+    if errors:
+        logger.warning(f"S3 삭제 실패 {len(errors)}건은 나중에 다시 시도합니다.")
+    logger.info(f"S3 삭제 대기열 처리: {len(entries) - len(errors)}/{len(entries)}건 완료")
+    return len(entries)
+
+
+class StorageDeletionDrainer:
+    """
+    storage_deletions 테이블을 폴링하여 S3 객체를 일괄 삭제하는 백그라운드 스레드
+    대기열이 비어 있지 않은 동안은 쉬지 않고 처리하고, 비면 폴링 주기만큼 기다립니다.
+    """
+
+    def __init__(self, poll_interval: Optional[float] = None):
+        self.poll_interval = poll_interval or settings.STORAGE_DELETION_POLL_SECONDS
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="storage-deletion", daemon=True)
+        self._thread.start()
+        logger.info("S3 삭제 대기열 처리 시작")
+
+    def wake(self) -> None:
+        """삭제 항목이 추가되었음을 알려 폴링 주기를 기다리지 않고 바로 처리하게 합니다."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """진행 중인 일괄 삭제가 끝나면 스레드를 종료합니다. (남은 항목은 다음 실행 때 처리)"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("S3 삭제 대기열 처리 종료")
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            drained = self._drain()
+            if drained >= settings.STORAGE_DELETION_BATCH_SIZE:
+                continue
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _drain(self) -> int:
+        db = SessionLocal()
+        try:
+            return drain_storage_deletions(db)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"S3 삭제 대기열 처리 실패: {str(e)}")
+            return 0
+        finally:
+            db.close()
+
+
+# API 서버 프로세스에 내장되는 삭제 스레드 (STORAGE_DELETION_ENABLED=True인 경우 lifespan에서 시작)
+storage_deletion_drainer = StorageDeletionDrainer()
+
+
+def wake_storage_deletion_drainer() -> None:
+    """삭제 항목을 넣고 커밋한 뒤 호출합니다. (내장 스레드가 없으면 아무 일도 하지 않음)"""
+    storage_deletion_drainer.wake()
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.services.storage_deletions
+    # API 서버와 분리된 프로세스에서 삭제 대기열만 처리할 때 사용합니다. (STORAGE_DELETION_ENABLED=False로 두고 실행)
+    logging.basicConfig(level=logging.INFO)
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    storage_deletion_drainer.start()
+    stop_event.wait()
+    storage_deletion_drainer.stop()
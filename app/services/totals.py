@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Literal, Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.counter import Counter
+from app.models.feed import Feed
+from app.models.user import User
+from app.services.counters import FEEDS_TOTAL_COUNTER
+
+logger = logging.getLogger(__name__)
+
+# exact: COUNT(*)로 정확한 값 계산 (캐시하지 않음) / approximate: 유지 중인 카운터(또는 테이블 통계) 값 사용
+CountMode = Literal["exact", "approximate"]
+
+
+class TTLCache:
+    """키마다 만료 시간을 가지는 간단한 스레드 안전 인메모리 캐시"""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._items: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._items.pop(key, None)
+
+
+_count_cache = TTLCache(settings.TOTAL_COUNT_CACHE_TTL_SECONDS)
+
+# approximate 모드의 전체 피드 수 캐시 키
+FEEDS_TOTAL_CACHE_KEY = "feeds:total"
+
+
+# MySQL 테이블 통계에서 대략적인 행 수를 조회하는 쿼리
+ESTIMATE_TABLE_ROWS_SQL = text(
+    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+)
+
+
+async def _estimate_table_rows_async(db: AsyncSession, table_name: str) -> Optional[int]:
+    """MySQL 테이블 통계(information_schema.TABLES.TABLE_ROWS)에서 대략적인 행 수를 조회합니다."""
+    if db.get_bind().dialect.name != "mysql":
+        return None
+    row = (await db.execute(ESTIMATE_TABLE_ROWS_SQL, {"table_name": table_name})).first()
+    return int(row[0]) if row and row[0] is not None else None
+
+
+async def get_total_feeds_async(db: AsyncSession, mode: CountMode = "approximate") -> int:
+    """
+    전체 피드 수를 반환합니다.
+
+    - exact: feeds 테이블 COUNT(*) 결과 (매번 계산하며 캐시하지 않음)
+    - approximate: counters 테이블의 feeds_total 행 값 (없으면 테이블 통계 추정치, 그것도 없으면 COUNT(*))
+      TOTAL_COUNT_CACHE_TTL_SECONDS 동안 캐시됩니다.
+    """
+    if mode == "exact":
+        return await db.scalar(select(func.count()).select_from(Feed))
+
+    cached = _count_cache.get(FEEDS_TOTAL_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    total = await db.scalar(select(Counter.value).where(Counter.name == FEEDS_TOTAL_COUNTER))
+    if total is None:
+        logger.warning(f"{FEEDS_TOTAL_COUNTER} 카운터 행이 없어 테이블 통계로 추정합니다.")
+        total = await _estimate_table_rows_async(db, Feed.__tablename__)
+    if total is None:
+        total = await db.scalar(select(func.count()).select_from(Feed))
+
+    total = int(total)
+    _count_cache.set(FEEDS_TOTAL_CACHE_KEY, total)
+    return total
+
+
+def get_user_feeds_count(db: Session, user: User, mode: CountMode = "approximate") -> int:
+    """
+    사용자가 작성한 피드 수를 반환합니다.
+
+    - exact: 해당 사용자의 feeds COUNT(*) 결과 (매번 계산하며 캐시하지 않음)
+    - approximate: 이미 조회된 users.feeds_count 컬럼 값 (추가 쿼리 없음)
+    """
+    if mode == "approximate":
+        return user.feeds_count
+    return db.query(Feed).filter(Feed.user_id == user.id).count()
+
+
+async def get_user_feeds_count_async(db: AsyncSession, user: User, mode: CountMode = "approximate") -> int:
+    """get_user_feeds_count의 AsyncSession 버전"""
+    if mode == "approximate":
+        return user.feeds_count
+    return await db.scalar(select(func.count()).select_from(Feed).where(Feed.user_id == user.id))
+
+
+def invalidate_feed_counts() -> None:
+    """피드 생성/삭제 후 이 프로세스의 전체 피드 수 캐시를 비웁니다. (사용자별 피드 수는 캐시하지 않음)"""
+    _count_cache.invalidate(FEEDS_TOTAL_CACHE_KEY)
@@ -1,6 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import auth, test, file, feed, users, comment
+from app.core.config import settings
+from app.services.media_worker import media_worker
+from app.services.s3 import shutdown_transfer_manager
+from app.services.storage_deletions import storage_deletion_drainer
+from app.services.orphan_files import orphan_file_collector
+from app.services.mailer import mail_sender
+from app.db.base import async_engine
 import logging
 from contextlib import asynccontextmanager
 
@@ -42,8 +49,20 @@ def print_database_info():
 async def lifespan(app: FastAPI):
     # 서버 시작 시 실행
     print_database_info()
+    if settings.MEDIA_WORKER_ENABLED:
+        media_worker.start()
+    if settings.STORAGE_DELETION_ENABLED:
+        storage_deletion_drainer.start()
+    if settings.ORPHAN_FILE_GC_ENABLED:
+        orphan_file_collector.start()
     yield
-    # 서버 종료 시 실행 (필요한 경우)
+    # 서버 종료 시 실행
+    orphan_file_collector.stop()
+    media_worker.stop()
+    storage_deletion_drainer.stop()
+    mail_sender.stop()
+    await async_engine.dispose()
+    shutdown_transfer_manager()
 
 app = FastAPI(
     title="Poestagram API",
@@ -0,0 +1,26 @@
+import os
+import sys
+
+# 저장소 루트에서 python -m scripts.<이름> 으로 실행하지 않은 경우에도 app을 import할 수 있도록 경로 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# 벤치마크/부하 테스트에서 사용하지 않는 필수 설정값은 임의의 값으로 채움 (.env나 환경 변수가 있으면 그 값을 사용)
+BENCHMARK_DEFAULT_ENV = {
+    "DB_USERNAME": "bench",
+    "DB_PASSWORD": "bench",
+    "DB_DATABASE": "bench",
+    "DB_HOST": "localhost",
+    "AWS_ACCESS_KEY_ID": "bench",
+    "AWS_SECRET_ACCESS_KEY": "bench",
+    "AWS_REGION": "us-east-1",
+    "AWS_BUCKET_NAME": "bench-bucket",
+    "IMAGE_BASE_URL": "https://images.example.com",
+    "STORAGE_BASE_URL": "https://storage.example.com",
+}
+
+
+def use_benchmark_env() -> None:
+    for key, value in BENCHMARK_DEFAULT_ENV.items():
+        os.environ.setdefault(key, value)
@@ -0,0 +1,140 @@
+"""
+이미지 크기 확인 방식별 읽은 바이트 수와 지연 시간 벤치마크
+
+- full_read: 업로드 파일 전체를 메모리로 읽은 뒤 PIL로 열어 크기와 EXIF Orientation 확인 (이전 방식)
+- header_probe: 파일 객체에서 헤더만 읽어 크기와 Orientation 확인 (_get_image_fileobj_dimensions)
+
+형식마다 4000x3000 이미지를 메모리에서 만들어 측정합니다.
+HEIC는 pillow_heif가 설치되어 있으면 실제 인코딩 결과를, 없으면 meta 박스만 채운 합성 파일을 사용합니다.
+(합성 파일은 PIL로 열 수 없으므로 full_read 결과는 '-'로 표시)
+
+사용법 (저장소 루트에서):
+    python -m scripts.bench_image_probe --iterations 200
+"""
+import argparse
+import io
+import struct
+import time
+
+from scripts._env import use_benchmark_env
+
+IMAGE_SIZE = (4000, 3000)
+
+
+class CountingReader(io.BytesIO):
+    """read()로 실제로 읽은 바이트 수를 세는 BytesIO"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _encode(image_format: str, orientation: int | None = None, **options) -> bytes:
+    from PIL import Image
+
+    image = Image.new("RGB", IMAGE_SIZE, (10, 20, 30))
+    if orientation:
+        exif = Image.Exif()
+        exif[274] = orientation
+        options["exif"] = exif
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def _full_box(box_type: bytes, payload: bytes, version: int = 0, flags: int = 0) -> bytes:
+    return _box(box_type, bytes([version]) + flags.to_bytes(3, "big") + payload)
+
+
+def _synthetic_heic(rotation: int = 3, payload_size: int = 2 * 1024 * 1024) -> bytes:
+    """ftyp, meta(pitm, iprp(ipco(ispe, irot), ipma)), mdat으로 이루어진 최소 HEIF 파일"""
+    width, height = IMAGE_SIZE
+    ftyp = _box(b"ftyp", b"heic" + b"\x00\x00\x00\x00" + b"mif1heic")
+    pitm = _full_box(b"pitm", struct.pack(">H", 1))
+    ispe = _full_box(b"ispe", struct.pack(">II", width, height))
+    irot = _box(b"irot", bytes([rotation]))
+    ipco = _box(b"ipco", ispe + irot)
+    # 항목 1에 속성 1(ispe), 2(irot) 연결
+    ipma = _full_box(b"ipma", struct.pack(">IHB", 1, 1, 2) + bytes([0x01, 0x82]))
+    meta = _full_box(b"meta", pitm + _box(b"iprp", ipco + ipma))
+    return ftyp + meta + _box(b"mdat", bytes(payload_size))
+
+
+def _heic_case() -> tuple[bytes, bool]:
+    """(HEIC 데이터, PIL로 열 수 있는지)"""
+    try:
+        import pillow_heif
+    except ImportError:
+        return _synthetic_heic(), False
+    pillow_heif.register_heif_opener()
+    return _encode("HEIF", 6), True
+
+
+def build_cases() -> dict[str, tuple[bytes, bool]]:
+    return {
+        "jpeg (exif 6)": (_encode("JPEG", 6), True),
+        "png": (_encode("PNG"), True),
+        "gif": (_encode("GIF"), True),
+        "webp": (_encode("WEBP"), True),
+        "webp lossless": (_encode("WEBP", lossless=True), True),
+        "webp (exif 6)": (_encode("WEBP", 6), True),
+        "heic": _heic_case(),
+    }
+
+
+def _measure(func, iterations: int) -> float:
+    """func를 iterations번 실행한 평균 시간(µs)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="이미지 크기 확인 방식별 읽은 바이트/지연 시간 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="형식별 반복 횟수")
+    args = parser.parse_args()
+
+    use_benchmark_env()
+    from PIL import Image
+
+    from app.services.media import _get_image_fileobj_dimensions, _get_oriented_image_size
+
+    def header_probe(data: bytes):
+        reader = CountingReader(data)
+        return _get_image_fileobj_dimensions(reader), reader.bytes_read
+
+    def full_read(data: bytes):
+        reader = CountingReader(data)
+        with Image.open(io.BytesIO(reader.read())) as image:
+            return _get_oriented_image_size(image), reader.bytes_read
+
+    print(f"이미지 크기: {IMAGE_SIZE[0]}x{IMAGE_SIZE[1]}, 반복: {args.iterations}")
+    print(
+        f"{'format':<16}{'file size':>11}{'probe bytes':>13}{'probe µs':>10}"
+        f"{'full bytes':>12}{'full µs':>10}{'result':>14}"
+    )
+    for name, (data, pil_readable) in build_cases().items():
+        size, probe_bytes = header_probe(data)
+        probe_us = _measure(lambda: header_probe(data), args.iterations)
+        if pil_readable:
+            full_size, full_bytes = full_read(data)
+            assert full_size == size, f"{name}: 두 방식의 결과가 다릅니다. ({full_size} != {size})"
+            full_us = _measure(lambda: full_read(data), args.iterations)
+            full_columns = f"{full_bytes:>12}{full_us:>10.1f}"
+        else:
+            full_columns = f"{'-':>12}{'-':>10}"
+        print(f"{name:<16}{len(data):>11}{probe_bytes:>13}{probe_us:>10.1f}{full_columns}{str(size):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+S3 업로드 방식별 처리량과 최대 메모리 사용량 벤치마크
+
+- put_object: 파일 전체를 메모리로 읽어 put_object 한 번으로 업로드 (이전 방식)
+- transfer: 공유 전송 매니저(transfer_to_s3)로 파일 객체를 스트리밍, 큰 파일은 multipart 병렬 업로드
+
+방식마다 새 프로세스에서 실행하므로 최대 RSS(ru_maxrss)를 서로 비교할 수 있습니다.
+
+사용법 (저장소 루트에서):
+    # 로컬 S3 대역(MinIO, LocalStack, moto_server 등)에 대해 측정
+    python -m scripts.bench_s3_upload --endpoint-url http://127.0.0.1:9000 --size-mb 200
+
+    # 엔드포인트를 생략하면 프로세스 내 moto(mock_aws)를 사용
+    # (moto가 업로드된 객체를 같은 프로세스 메모리에 보관하므로 두 방식 모두 객체 크기만큼 RSS가 더해짐)
+    python -m scripts.bench_s3_upload --size-mb 100
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from scripts._env import use_benchmark_env
+
+MODES = ("put_object", "transfer")
+
+
+def _make_source_file(size_mb: int) -> str:
+    """size_mb 크기의 임의 데이터 파일을 만듭니다. (압축/중복 제거 영향이 없도록 랜덤 바이트)"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".bin") as temp_file:
+        chunk = os.urandom(1024 * 1024)
+        for _ in range(size_mb):
+            temp_file.write(chunk)
+        return temp_file.name
+
+
+def _max_rss_mb() -> float:
+    # 리눅스에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_once(mode: str, path: str, endpoint_url: str | None) -> dict:
+    """한 가지 방식으로 업로드하고 결과를 반환합니다. (--mode로 실행된 자식 프로세스에서 호출)"""
+    use_benchmark_env()
+
+    mock = None
+    if not endpoint_url:
+        import moto
+        mock = moto.mock_aws()
+        mock.start()
+
+    import boto3
+    from botocore.config import Config
+    from boto3.s3.transfer import create_transfer_manager
+
+    from app.core.config import settings
+    import app.services.s3 as s3
+
+    # 벤치마크용 클라이언트와 전송 매니저로 교체 (연결 풀 크기 등 설정은 앱과 동일)
+    s3.s3_client = boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        region_name=os.environ["AWS_REGION"],
+        config=Config(max_pool_connections=max(10, settings.S3_MULTIPART_MAX_CONCURRENCY * 2))
+    )
+    s3.transfer_manager = create_transfer_manager(s3.s3_client, s3.transfer_config)
+    try:
+        s3.s3_client.create_bucket(Bucket=s3.BUCKET_NAME)
+    except s3.s3_client.exceptions.BucketAlreadyOwnedByYou:
+        pass
+
+    size = os.path.getsize(path)
+    s3_key = f"bench/{mode}/{os.path.basename(path)}"
+    rss_before = _max_rss_mb()
+    started = time.perf_counter()
+    if mode == "put_object":
+        with open(path, "rb") as fp:
+            data = fp.read()
+        s3.s3_client.put_object(Bucket=s3.BUCKET_NAME, Key=s3_key, Body=data, ContentType="video/mp4")
+        del data
+    else:
+        with open(path, "rb") as fp:
+            s3.transfer_to_s3(fp, s3_key, "video/mp4")
+    elapsed = time.perf_counter() - started
+
+    head = s3.s3_client.head_object(Bucket=s3.BUCKET_NAME, Key=s3_key)
+    assert head["ContentLength"] == size, "업로드된 객체 크기가 원본과 다릅니다."
+    # PartNumber를 지정해야 multipart 객체의 PartsCount가 응답에 포함됨
+    parts = s3.s3_client.head_object(Bucket=s3.BUCKET_NAME, Key=s3_key, PartNumber=1).get("PartsCount")
+    s3.s3_client.delete_object(Bucket=s3.BUCKET_NAME, Key=s3_key)
+    s3.transfer_manager.shutdown()
+    if mock is not None:
+        mock.stop()
+
+    return {
+        "mode": mode,
+        "seconds": round(elapsed, 3),
+        "mb_per_second": round(size / (1024 * 1024) / elapsed, 1),
+        "rss_before_mb": round(rss_before, 1),
+        "max_rss_mb": round(_max_rss_mb(), 1),
+        "multipart_parts": parts,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="S3 업로드 방식별 처리량/최대 메모리 벤치마크")
+    parser.add_argument("--size-mb", type=int, default=100, help="업로드할 파일 크기 (MB)")
+    parser.add_argument("--endpoint-url", default=None, help="로컬 S3 대역 주소 (생략 시 프로세스 내 moto 사용)")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_once(args.mode, args.path, args.endpoint_url)))
+        return
+
+    path = _make_source_file(args.size_mb)
+    try:
+        print(f"파일 크기: {args.size_mb}MB, 대상: {args.endpoint_url or 'moto (in-process)'}")
+        print(f"{'mode':<12}{'seconds':>10}{'MB/s':>10}{'RSS before':>12}{'max RSS':>10}{'parts':>7}")
+        for mode in MODES:
+            cmd = [sys.executable, "-m", "scripts.bench_s3_upload", "--mode", mode, "--path", path]
+            if args.endpoint_url:
+                cmd += ["--endpoint-url", args.endpoint_url]
+            output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{result['mode']:<12}{result['seconds']:>10}{result['mb_per_second']:>10}"
+                f"{result['rss_before_mb']:>12}{result['max_rss_mb']:>10}{str(result['multipart_parts'] or '-'):>7}"
+            )
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
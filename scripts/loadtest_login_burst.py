@@ -0,0 +1,233 @@
+"""
+로그인 폭주(bcrypt 검증) 중 피드 조회 지연 시간 부하 테스트
+
+피드 조회만 보내는 구간과, 같은 양의 피드 조회에 로그인 요청을 동시에 섞어 보내는 구간의
+피드 응답 시간(p50/p95/p99/max)을 비교합니다. bcrypt가 이벤트 루프를 막지 않으면 두 구간의 p99가 비슷해야 합니다.
+(코어가 하나뿐인 환경에서는 bcrypt 스레드와 서버, 부하 클라이언트가 CPU를 나눠 쓰므로 어느 정도 늘어나는 것은 정상이며,
+ 이벤트 루프가 막히면 로그인 구간의 피드 응답이 bcrypt 검증 여러 번만큼 몇 초 단위로 늘어납니다)
+
+서버를 지정하지 않으면 SQLite 임시 DB를 쓰는 API 서버를 별도 프로세스(uvicorn)로 띄우고
+로그인 계정과 피드를 만들어 측정합니다. (--blocking-login을 주면 이전 방식처럼 이벤트 루프에서 bcrypt를 검증)
+
+사용법 (저장소 루트에서):
+    python -m scripts.loadtest_login_burst --duration 10
+    python -m scripts.loadtest_login_burst --duration 10 --blocking-login
+
+    # 실행 중인 서버에 대해 측정 (로그인 가능한 계정 필요)
+    python -m scripts.loadtest_login_burst --base-url http://127.0.0.1:8000 --identifier alice --password secret
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+from scripts._env import use_benchmark_env
+
+LOCAL_IDENTIFIER = "loadtest"
+LOCAL_PASSWORD = "loadtest-password"
+LOCAL_FEED_COUNT = 100
+
+
+def serve(port: int, blocking_login: bool) -> None:
+    """SQLite 임시 DB로 API 서버를 실행합니다. (--serve로 실행된 자식 프로세스에서 호출)"""
+    use_benchmark_env()
+    import uvicorn
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import app.models  # noqa: F401 (모든 모델을 Base.metadata에 등록)
+    import main
+    from app.db.base import Base, get_async_db, get_db
+    from app.models import Feed, User
+    from app.services.auth import hash_password, verify_password
+
+    path = os.path.join(tempfile.mkdtemp(prefix="loadtest-"), "loadtest.db")
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    AsyncSession = async_sessionmaker(bind=create_async_engine(f"sqlite+aiosqlite:///{path}"), autoflush=False, expire_on_commit=False)
+
+    with Session() as db:
+        user = User(email=f"{LOCAL_IDENTIFIER}@example.com", username=LOCAL_IDENTIFIER, password=hash_password(LOCAL_PASSWORD))
+        db.add(user)
+        db.flush()
+        db.add_all([Feed(user_id=user.id, description=f"feed {index}") for index in range(LOCAL_FEED_COUNT)])
+        db.commit()
+
+    def _get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def _get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    main.app.dependency_overrides[get_db] = _get_db
+    main.app.dependency_overrides[get_async_db] = _get_async_db
+
+    if blocking_login:
+        import app.api.auth as auth_api
+
+        async def verify_on_event_loop(plain_password: str, hashed_password: str) -> bool:
+            return verify_password(plain_password, hashed_password)
+
+        auth_api.verify_password_async = verify_on_event_loop
+
+    # lifespan은 MySQL 연결 확인과 백그라운드 스레드를 시작하므로 끔
+    uvicorn.run(main.app, host="127.0.0.1", port=port, log_level="warning", lifespan="off")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def _feed_client(client, headers: dict, deadline: float, latencies: List[float], errors: List[int]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get("/api/feeds/", params={"limit": 20}, headers=headers)
+        if response.status_code == 200:
+            latencies.append(time.perf_counter() - started)
+        else:
+            errors.append(response.status_code)
+
+
+async def _login_client(client, identifier: str, password: str, deadline: float, logins: List[float]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.post("/api/auth/login", json={"identifier": identifier, "password": password})
+        response.raise_for_status()
+        logins.append(time.perf_counter() - started)
+
+
+async def run_phase(base_url: str, headers: dict, args, with_logins: bool) -> dict:
+    import httpx
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    logins: List[float] = []
+    limits = httpx.Limits(max_connections=args.feed_concurrency + args.login_concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + args.duration
+        tasks = [_feed_client(client, headers, deadline, latencies, errors) for _ in range(args.feed_concurrency)]
+        if with_logins:
+            tasks += [
+                _login_client(client, args.identifier, args.password, deadline, logins)
+                for _ in range(args.login_concurrency)
+            ]
+        await asyncio.gather(*tasks)
+
+    latencies.sort()
+    return {
+        "phase": "login burst" if with_logins else "feed only",
+        "requests": len(latencies),
+        "errors": len(errors),
+        "p50": _percentile(latencies, 50) * 1000,
+        "p95": _percentile(latencies, 95) * 1000,
+        "p99": _percentile(latencies, 99) * 1000,
+        "max": (latencies[-1] if latencies else float("nan")) * 1000,
+        "logins_per_second": len(logins) / args.duration,
+    }
+
+
+async def _login(base_url: str, identifier: str, password: str) -> str:
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        response = await client.post("/api/auth/login", json={"identifier": identifier, "password": password})
+        response.raise_for_status()
+        return response.json()["access_token"]
+
+
+async def _wait_until_ready(base_url: str, server: subprocess.Popen, timeout: float = 30) -> None:
+    import httpx
+
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.perf_counter() < deadline:
+            if server.poll() is not None:
+                raise RuntimeError("부하 테스트용 서버가 시작되지 않았습니다.")
+            try:
+                if (await client.get("/api/feeds/")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("부하 테스트용 서버 응답을 기다리다 시간이 초과되었습니다.")
+
+
+async def run(args) -> None:
+    server: Optional[subprocess.Popen] = None
+    base_url = args.base_url
+    if not base_url:
+        port = _free_port()
+        cmd = [sys.executable, "-m", "scripts.loadtest_login_burst", "--serve", "--port", str(port)]
+        if args.blocking_login:
+            cmd.append("--blocking-login")
+        # 서버의 요청 로그는 측정 결과와 섞이지 않도록 버림
+        server = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        base_url = f"http://127.0.0.1:{port}"
+        args.identifier, args.password = LOCAL_IDENTIFIER, LOCAL_PASSWORD
+
+    try:
+        if server is not None:
+            await _wait_until_ready(base_url, server)
+        headers = {"Authorization": f"Bearer {await _login(base_url, args.identifier, args.password)}"}
+
+        print(
+            f"대상: {base_url}{' (bcrypt on event loop)' if args.blocking_login else ''}, 구간별 {args.duration}s, "
+            f"피드 동시 요청 {args.feed_concurrency}, 로그인 동시 요청 {args.login_concurrency}"
+        )
+        print(f"{'phase':<13}{'requests':>9}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'logins/s':>10}")
+        for with_logins in (False, True):
+            result = await run_phase(base_url, headers, args, with_logins)
+            print(
+                f"{result['phase']:<13}{result['requests']:>9}{result['errors']:>8}{result['p50']:>9.1f}"
+                f"{result['p95']:>9.1f}{result['p99']:>9.1f}{result['max']:>9.1f}{result['logins_per_second']:>10.1f}"
+            )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 피드 조회 지연 시간 부하 테스트")
+    parser.add_argument("--base-url", default=None, help="측정할 서버 주소 (생략 시 SQLite 임시 DB로 서버를 띄움)")
+    parser.add_argument("--identifier", default=None, help="--base-url 사용 시 로그인할 이메일 또는 사용자명")
+    parser.add_argument("--password", default=None, help="--base-url 사용 시 로그인할 비밀번호")
+    parser.add_argument("--duration", type=float, default=10, help="구간별 측정 시간 (초)")
+    parser.add_argument("--feed-concurrency", type=int, default=4, help="동시에 피드를 조회하는 클라이언트 수")
+    parser.add_argument("--login-concurrency", type=int, default=8, help="로그인 구간에서 동시에 로그인하는 클라이언트 수")
+    parser.add_argument("--blocking-login", action="store_true", help="로컬 서버에서 bcrypt 검증을 이벤트 루프에서 실행 (이전 방식과 비교)")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.blocking_login)
+        return
+    if args.base_url and not (args.identifier and args.password):
+        parser.error("--base-url을 사용할 때는 --identifier와 --password가 필요합니다.")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
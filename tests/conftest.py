@@ -0,0 +1,144 @@
+import os
+
+# app을 import하기 전에 필수 설정값을 채워 둠 (실제 값은 사용하지 않음)
+for key, value in {
+    "DB_USERNAME": "test",
+    "DB_PASSWORD": "test",
+    "DB_DATABASE": "test",
+    "DB_HOST": "localhost",
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "AWS_REGION": "ap-northeast-2",
+    "AWS_BUCKET_NAME": "test-bucket",
+    "IMAGE_BASE_URL": "https://images.example.com",
+    "STORAGE_BASE_URL": "https://storage.example.com",
+}.items():
+    os.environ.setdefault(key, value)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 (모든 모델을 Base.metadata에 등록)
+from app.db.base import Base, get_async_db, get_db
+from app.services.auth import create_access_token
+from app.services.cache import response_cache
+from app.services.totals import FEEDS_TOTAL_CACHE_KEY, _count_cache
+
+
+class StatementCounter:
+    """before_cursor_execute 이벤트로 실행된 SQL 문 수를 셉니다."""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture
+def database(tmp_path):
+    """
+    MySQL 대신 SQLite 파일 하나를 동기/비동기 엔진이 함께 사용합니다.
+
+    Returns:
+        dict: {"session": 동기 세션 팩토리, "engine": 동기 엔진, "async_engine": 비동기 엔진}
+    """
+    path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    Base.metadata.create_all(engine)
+    yield {
+        "session": sessionmaker(bind=engine, autoflush=False),
+        "engine": engine,
+        "async_engine": async_engine,
+    }
+    engine.dispose()
+
+
+@pytest.fixture
+def db(database):
+    session = database["session"]()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(database):
+    """테스트용 DB를 사용하는 TestClient (lifespan의 백그라운드 스레드는 시작하지 않음)"""
+    import main
+
+    AsyncSession = async_sessionmaker(bind=database["async_engine"], autoflush=False, expire_on_commit=False)
+
+    def _get_db():
+        session = database["session"]()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    async def _get_async_db():
+        async with AsyncSession() as session:
+            yield session
+
+    main.app.dependency_overrides[get_db] = _get_db
+    main.app.dependency_overrides[get_async_db] = _get_async_db
+    try:
+        yield TestClient(main.app)
+    finally:
+        main.app.dependency_overrides.clear()
+        # 프로세스 내 캐시가 다음 테스트로 이어지지 않도록 비움
+        response_cache.clear()
+        _count_cache.invalidate(FEEDS_TOTAL_CACHE_KEY)
+
+
+@pytest.fixture
+def count_statements(database):
+    """동기/비동기 엔진에서 실행되는 SQL 문을 함께 세는 카운터"""
+    counter = StatementCounter()
+    engines = (database["engine"], database["async_engine"].sync_engine)
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    """
+    moto로 만든 가짜 S3 버킷을 app.services.s3의 클라이언트/전송 매니저로 사용합니다.
+
+    Returns:
+        S3 클라이언트 (버킷 이름은 app.services.s3.BUCKET_NAME)
+    """
+    import boto3
+    import moto
+    from boto3.s3.transfer import create_transfer_manager
+
+    import app.services.s3 as s3
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=s3.BUCKET_NAME)
+        transfer_manager = create_transfer_manager(client, s3.transfer_config)
+        monkeypatch.setattr(s3, "s3_client", client)
+        monkeypatch.setattr(s3, "transfer_manager", transfer_manager)
+        yield client
+        transfer_manager.shutdown()
+
+
+def auth_headers(user) -> dict:
+    token = create_access_token({"sub": user.email, "user_id": user.id})
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,47 @@
+import app.api.auth as auth_api
+from app.models import User
+from app.models.verify import Verify
+from app.services.auth import verify_password
+
+
+def _setup(db, monkeypatch) -> list:
+    db.add(User(email="a@example.com", username="alice", password="old"))
+    db.add(Verify(email="a@example.com", code="123456", is_verified=True))
+    db.commit()
+
+    hashed = []
+    original = auth_api.hash_password_async
+
+    async def counting_hash(password: str) -> str:
+        hashed.append(password)
+        return await original(password)
+
+    monkeypatch.setattr(auth_api, "hash_password_async", counting_hash)
+    return hashed
+
+
+def test_reset_password_rejects_wrong_code_before_hashing(client, db, monkeypatch):
+    hashed = _setup(db, monkeypatch)
+
+    response = client.post(
+        "/api/auth/reset-password",
+        json={"email": "a@example.com", "code": "000000", "new_password": "new-password"}
+    )
+
+    assert response.status_code == 400
+    assert hashed == []
+    assert db.query(User).one().password == "old"
+
+
+def test_reset_password_updates_password_with_valid_code(client, db, monkeypatch):
+    hashed = _setup(db, monkeypatch)
+
+    response = client.post(
+        "/api/auth/reset-password",
+        json={"email": "a@example.com", "code": "123456", "new_password": "new-password"}
+    )
+
+    assert response.status_code == 200, response.text
+    assert hashed == ["new-password"]
+    db.expire_all()
+    assert verify_password("new-password", db.query(User).one().password)
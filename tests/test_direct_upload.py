@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime, timezone
+
+import app.services.s3 as s3
+from app.core.config import settings
+from app.models import File, MediaObject, StorageDeletion, User
+from app.services.media_jobs import claim_media_jobs, complete_media_job
+from app.services.media_processing import process_media_file
+from app.services.orphan_files import collect_orphan_files
+
+from tests.conftest import auth_headers
+
+
+def _presign(client, headers, file_size: int) -> dict:
+    response = client.post(
+        "/api/files/presign",
+        json={"filename": "clip.mp4", "content_type": "video/mp4", "file_size": file_size},
+        headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _create_user(db) -> dict:
+    user = User(email="a@example.com", username="alice", password="x")
+    db.add(user)
+    db.commit()
+    return auth_headers(user)
+
+
+def test_finalize_registers_uploaded_object(client, db, s3_bucket):
+    headers = _create_user(db)
+    presigned = _presign(client, headers, 10)
+    s3_bucket.put_object(Bucket=s3.BUCKET_NAME, Key=presigned["s3_key"], Body=b"0" * 10)
+
+    response = client.post("/api/files/finalize", json={"upload_token": presigned["upload_token"]}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["file_size"] == 10
+
+    # 같은 토큰으로 재시도하면 같은 파일을 반환
+    retry = client.post("/api/files/finalize", json={"upload_token": presigned["upload_token"]}, headers=headers)
+    assert retry.json()["id"] == response.json()["id"]
+
+
+def test_finalize_rejects_object_larger_than_declared(client, db, s3_bucket):
+    headers = _create_user(db)
+    presigned = _presign(client, headers, 10)
+    s3_bucket.put_object(Bucket=s3.BUCKET_NAME, Key=presigned["s3_key"], Body=b"0" * 11)
+
+    response = client.post("/api/files/finalize", json={"upload_token": presigned["upload_token"]}, headers=headers)
+
+    assert response.status_code == 400
+    assert db.query(File).count() == 0
+    assert [entry.s3_key for entry in db.query(StorageDeletion).all()] == [presigned["s3_key"]]
+
+
+def test_orphan_gc_aborts_stale_multipart_uploads(db, s3_bucket, monkeypatch):
+    upload_id = s3_bucket.create_multipart_upload(Bucket=s3.BUCKET_NAME, Key="poestagram/videos/stale.mp4")["UploadId"]
+    initiated = s3_bucket.list_multipart_uploads(Bucket=s3.BUCKET_NAME)["Uploads"][0]["Initiated"]
+    age = (datetime.now(timezone.utc) - initiated).total_seconds()
+
+    # 업로드 토큰이 아직 유효한 업로드는 finalize될 수 있으므로 남김
+    monkeypatch.setattr(settings, "S3_PRESIGN_EXPIRE_SECONDS", int(age) + 3600)
+    assert collect_orphan_files(db)["aborted_uploads"] == 0
+
+    monkeypatch.setattr(settings, "S3_PRESIGN_EXPIRE_SECONDS", 60)
+    assert collect_orphan_files(db, dry_run=True)["aborted_uploads"] == 1
+    assert collect_orphan_files(db)["aborted_uploads"] == 1
+    uploads = s3_bucket.list_multipart_uploads(Bucket=s3.BUCKET_NAME).get("Uploads", [])
+    assert upload_id not in [upload["UploadId"] for upload in uploads]
+
+
+def test_worker_deduplicates_finalized_uploads(client, db, s3_bucket):
+    headers = _create_user(db)
+    keys = []
+    for _ in range(2):
+        presigned = _presign(client, headers, 10)
+        s3_bucket.put_object(Bucket=s3.BUCKET_NAME, Key=presigned["s3_key"], Body=b"0" * 10)
+        response = client.post("/api/files/finalize", json={"upload_token": presigned["upload_token"]}, headers=headers)
+        assert response.status_code == 200, response.text
+        keys.append(presigned["s3_key"])
+
+    # 직접 업로드는 원본 등록 없이 저장되고, 워커가 처리하면서 해시를 계산
+    jobs = claim_media_jobs(db, 10)
+    assert [job.compute_hash for job in jobs] == [True, True]
+    for job in jobs:
+        # 미디어 분석(ffprobe)은 건너뛰고 해시만 계산
+        result = process_media_file(job.s3_key, "application/octet-stream", job.file_name, compute_hash=job.compute_hash)
+        assert result["content_hash"] == hashlib.sha256(b"0" * 10).hexdigest()
+        complete_media_job(db, job.job_id, result)
+
+    # 먼저 처리된 업로드가 원본으로 등록되고, 같은 내용의 두 번째 업로드는 그 원본을 공유
+    db.expire_all()
+    media_object = db.query(MediaObject).one()
+    assert (media_object.s3_key, media_object.ref_count) == (keys[0], 2)
+    assert [file.s3_key for file in db.query(File).order_by(File.id)] == [keys[0], keys[0]]
+    assert all(file.media_object_id == media_object.id for file in db.query(File))
+    assert [entry.s3_key for entry in db.query(StorageDeletion)] == [keys[1]]
@@ -0,0 +1,53 @@
+from app.models import Comment, CommentLike, Feed, User
+
+from tests.conftest import auth_headers
+
+
+def _create_comments(db, count: int):
+    author = User(email="author@example.com", username="author", password="x")
+    viewer = User(email="viewer@example.com", username="viewer", password="x")
+    db.add_all([author, viewer])
+    db.flush()
+    feed = Feed(user_id=author.id, description="feed")
+    db.add(feed)
+    db.flush()
+    comments = [Comment(feed_id=feed.id, user_id=author.id, content=f"comment {index}") for index in range(count)]
+    db.add_all(comments)
+    db.flush()
+    # 절반의 댓글에 viewer가 좋아요
+    for comment in comments[::2]:
+        db.add(CommentLike(user_id=viewer.id, comment_id=comment.id))
+        comment.likes_count = 1
+    db.commit()
+    return feed, viewer, comments
+
+
+def test_comment_page_query_count_does_not_depend_on_page_size(client, db, count_statements):
+    """댓글 수와 관계없이 한 페이지는 피드 확인 + 댓글 조회 + 좋아요 IN 조회 3개의 SQL 문만 실행합니다."""
+    feed, viewer, comments = _create_comments(db, 50)
+    url, headers = f"/api/feeds/{feed.id}/comments?limit=50", auth_headers(viewer)
+    liked_ids = {comment.id for comment in comments[::2]}
+
+    count_statements.reset()
+    response = client.get(url, headers=headers)
+
+    assert response.status_code == 200
+    page = response.json()["comments"]
+    assert len(page) == 50
+    assert count_statements.count == 3, count_statements.statements
+
+    for item in page:
+        assert item["is_liked"] == (item["id"] in liked_ids)
+        assert item["likes_count"] == (1 if item["id"] in liked_ids else 0)
+
+
+def test_anonymous_comment_page_skips_like_lookup(client, db, count_statements):
+    feed, _, _ = _create_comments(db, 10)
+    url = f"/api/feeds/{feed.id}/comments"
+
+    count_statements.reset()
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert all(not item["is_liked"] for item in response.json()["comments"])
+    assert count_statements.count == 2, count_statements.statements
@@ -0,0 +1,142 @@
+import socket
+import socketserver
+import threading
+import time
+from email.message import EmailMessage
+
+import pytest
+
+from app.core.config import settings
+from app.services.mailer import MAIL_POLL_SECONDS, MailSender
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """받은 메일의 수신자만 기록하는 최소한의 SMTP 서버 (수신자에 reject가 있으면 550으로 거부)"""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.server.connections.append(self.connection)
+        self._reply("220 stub")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 stub")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                if "reject" in command:
+                    self._reply("550 mailbox unavailable")
+                else:
+                    recipients.append(command.split(":", 1)[1].strip(" <>"))
+                    self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 end with .")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.delivered.extend(recipients)
+                self._reply("250 OK")
+            elif verb in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("502 not implemented")
+
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.connections = []
+        self.delivered = []
+
+    def drop_connections(self) -> None:
+        """열려 있는 연결을 서버 쪽에서 끊습니다. (클라이언트는 다음 명령에서 연결 끊김 오류를 받음)"""
+        for connection in self.connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    server = _SMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(settings, "SMTP_PORT", server.server_address[1])
+    monkeypatch.setattr(settings, "SMTP_USE_TLS", False)
+    monkeypatch.setattr(settings, "EMAIL_USER", "")
+    monkeypatch.setattr(settings, "MAIL_RETRY_BASE_SECONDS", 0.05)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sender():
+    sender = MailSender()
+    yield sender
+    sender.stop(timeout=5)
+
+
+def _message(to: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "noreply@example.com"
+    message["To"] = to
+    message["Subject"] = "test"
+    message.set_content("body")
+    return message
+
+
+def _wait_for(condition, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 안에 조건을 만족하지 못했습니다."
+        time.sleep(0.02)
+
+
+def test_queued_mails_share_one_connection(smtp_server, sender):
+    for index in range(5):
+        sender.enqueue(_message(f"user{index}@example.com"))
+
+    _wait_for(lambda: len(smtp_server.delivered) == 5)
+    assert smtp_server.delivered == [f"user{index}@example.com" for index in range(5)]
+    assert len(smtp_server.connections) == 1
+
+
+def test_dropped_connection_is_reopened_and_mail_retried(smtp_server, sender):
+    sender.enqueue(_message("first@example.com"))
+    _wait_for(lambda: len(smtp_server.delivered) == 1)
+
+    smtp_server.drop_connections()
+    sender.enqueue(_message("second@example.com"))
+
+    _wait_for(lambda: len(smtp_server.delivered) == 2)
+    assert smtp_server.delivered == ["first@example.com", "second@example.com"]
+    assert len(smtp_server.connections) == 2
+
+
+def test_permanent_rejection_is_not_retried(smtp_server, sender):
+    sender.enqueue(_message("reject@example.com"))
+    # 거부된 뒤 큐가 빈 상태로 한 번 이상 폴링하게 함 (그 사이 연결을 유휴 상태로 보고 닫으면 안 됨)
+    time.sleep(MAIL_POLL_SECONDS * 2)
+    sender.enqueue(_message("ok@example.com"))
+
+    _wait_for(lambda: smtp_server.delivered == ["ok@example.com"])
+    time.sleep(0.3)
+    # 5xx 응답은 재시도하지 않고, 같은 연결로 다음 메일을 계속 보냄
+    assert smtp_server.delivered == ["ok@example.com"]
+    assert len(smtp_server.connections) == 1
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+import app.services.media_jobs as media_jobs
+from app.core.config import settings
+from app.models import Feed, File, MediaJob, User
+from app.services.media_jobs import claim_media_jobs, enqueue_media_job, fail_media_job
+
+
+def _enqueue(db, feed_id: int = None) -> int:
+    file = File(
+        file_name="clip.mp4", s3_key="poestagram/videos/clip.mp4", content_type="video/mp4", file_size=1, feed_id=feed_id
+    )
+    db.add(file)
+    db.flush()
+    job = enqueue_media_job(db, file)
+    db.commit()
+    return job.id
+
+
+def test_failed_job_waits_for_backoff_before_retry(db):
+    job_id = _enqueue(db)
+    assert [job.job_id for job in claim_media_jobs(db, 10)] == [job_id]
+
+    fail_media_job(db, job_id, "killed")
+    job = db.get(MediaJob, job_id)
+    assert job.status == 'pending'
+    assert job.next_attempt_at > datetime.now() + timedelta(seconds=settings.MEDIA_JOB_RETRY_BASE_SECONDS - 5)
+
+    # 재시도 시각 전에는 가져가지 않음
+    assert claim_media_jobs(db, 10) == []
+
+    job.next_attempt_at = datetime.now() - timedelta(seconds=1)
+    db.commit()
+    assert [job.job_id for job in claim_media_jobs(db, 10)] == [job_id]
+
+    # 두 번째 실패는 대기 시간이 두 배
+    fail_media_job(db, job_id, "killed")
+    job = db.get(MediaJob, job_id)
+    assert job.next_attempt_at > datetime.now() + timedelta(seconds=settings.MEDIA_JOB_RETRY_BASE_SECONDS * 2 - 5)
+
+
+def test_job_fails_after_max_attempts(db, monkeypatch):
+    # 처리 전에 피드에 첨부된 파일이면 실패 상태도 캐시된 페이지에 반영
+    user = User(email="a@example.com", username="alice", password="x")
+    db.add(user)
+    db.flush()
+    feed = Feed(user_id=user.id, description="clip")
+    db.add(feed)
+    db.flush()
+    invalidated = []
+    monkeypatch.setattr(media_jobs, "invalidate_feed", invalidated.append)
+
+    job_id = _enqueue(db, feed.id)
+    for _ in range(settings.MEDIA_JOB_MAX_ATTEMPTS):
+        job = db.get(MediaJob, job_id)
+        job.next_attempt_at = None
+        db.commit()
+        assert len(claim_media_jobs(db, 10)) == 1
+        fail_media_job(db, job_id, "killed")
+
+    job = db.get(MediaJob, job_id)
+    assert job.status == 'failed'
+    assert job.file.processing_status == 'failed'
+    assert invalidated == [feed.id]
@@ -0,0 +1,84 @@
+import io
+import shutil
+import subprocess
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.models import StorageDeletion
+from app.services.media_processing import process_media_file
+from app.services.storage import LocalMediaStorage, MediaStorage
+from app.services.storage_deletions import drain_storage_deletions, enqueue_storage_deletions
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalMediaStorage(str(tmp_path / "media"))
+
+
+def test_media_storage_requires_every_operation():
+    class PartialStorage(MediaStorage):
+        def put_file(self, source, key, content_type):
+            pass
+
+    with pytest.raises(TypeError):
+        PartialStorage()
+
+
+def test_image_pipeline_runs_against_local_storage(storage, monkeypatch):
+    monkeypatch.setattr(settings, "IMAGE_VARIANT_FORMATS", ["webp"])
+    monkeypatch.setattr(settings, "IMAGE_VARIANT_WIDTHS", [320])
+    buffer = io.BytesIO()
+    Image.new("RGB", (800, 600), (200, 30, 30)).save(buffer, "JPEG")
+    buffer.seek(0)
+    storage.put_file(buffer, "poestagram/images/photo.jpg", "image/jpeg")
+
+    result = process_media_file("poestagram/images/photo.jpg", "image/jpeg", "photo.jpg", storage)
+
+    assert (result["width"], result["height"]) == (800, 600)
+    assert [(variant["format"], variant["width"], variant["height"]) for variant in result["variants"]] == [("webp", 320, 240)]
+    with storage.download_to_temp_file(result["variants"][0]["s3_key"]) as path:
+        with Image.open(path) as variant:
+            assert variant.format == "WEBP"
+
+
+@pytest.mark.skipif(
+    not (shutil.which("ffmpeg") and shutil.which("ffprobe")),
+    reason="ffmpeg/ffprobe가 설치되어 있지 않음"
+)
+def test_video_pipeline_runs_against_local_storage(storage, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "HLS_ENABLED", True)
+    monkeypatch.setattr(settings, "HLS_LADDER", [(240, 300)])
+    source = tmp_path / "clip.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "lavfi", "-i", "testsrc=size=320x240:rate=15:duration=2",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=2",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-c:a", "aac", "-shortest", str(source)
+        ],
+        check=True
+    )
+    storage.put_file(str(source), "poestagram/videos/clip.mp4", "video/mp4")
+
+    result = process_media_file("poestagram/videos/clip.mp4", "video/mp4", "clip.mp4", storage)
+
+    assert (result["width"], result["height"]) == (320, 240)
+    keys = storage.list_keys("poestagram/")
+    assert result["s3_key_thumbnail"] in keys
+    assert result["s3_key_preview"] in keys
+    assert result["s3_key_hls"] in keys
+    assert any(key.endswith(".ts") or key.endswith(".m4s") for key in keys)
+
+
+def test_deletion_outbox_drains_local_storage(db, storage):
+    for key in ("poestagram/images/a.jpg", "poestagram/videos/hls/clip/master.m3u8", "poestagram/videos/hls/clip/360p/0.ts"):
+        storage.put_file(io.BytesIO(b"data"), key, "application/octet-stream")
+
+    enqueue_storage_deletions(db, ["poestagram/images/a.jpg", "poestagram/images/missing.jpg"], ["poestagram/videos/hls/clip/"])
+    db.commit()
+
+    assert drain_storage_deletions(db, storage=storage) == 3
+    assert storage.list_keys("poestagram/") == []
+    assert db.query(StorageDeletion).count() == 0
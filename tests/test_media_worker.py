@@ -0,0 +1,93 @@
+import os
+import time
+
+import pytest
+
+import app.services.media_worker as media_worker_module
+from app.models import File, MediaJob
+from app.services.media_jobs import enqueue_media_job
+from app.services.media_worker import MediaWorker
+
+
+def fake_process_media_file(s3_key: str, content_type: str, file_name: str, compute_hash: bool = False) -> dict:
+    """프로세스 풀에서 실행되는 가짜 처리 함수 (crash.mp4는 OOM으로 죽은 것처럼 프로세스를 종료)"""
+    if file_name == "crash.mp4":
+        os._exit(1)
+    time.sleep(1)
+    return {}
+
+
+def _wait_until(condition, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.1)
+    pytest.fail("시간 안에 조건을 만족하지 못했습니다.")
+
+
+def test_worker_survives_broken_process_pool(database, db, monkeypatch):
+    monkeypatch.setattr(media_worker_module, "SessionLocal", database["session"])
+    monkeypatch.setattr(media_worker_module, "process_media_file", fake_process_media_file)
+
+    job_ids = {}
+    for name in ("ok.mp4", "crash.mp4"):
+        file = File(file_name=name, s3_key=f"poestagram/videos/{name}", content_type="video/mp4", file_size=1)
+        db.add(file)
+        db.flush()
+        job = enqueue_media_job(db, file)
+        db.flush()
+        job_ids[name] = job.id
+    db.commit()
+
+    worker = MediaWorker(processes=2, poll_interval=0.1)
+    worker.start()
+    try:
+        def _jobs():
+            db.expire_all()
+            return {name: db.get(MediaJob, job_id) for name, job_id in job_ids.items()}
+
+        # 함께 실행되던 작업은 시도 횟수를 되돌린 뒤 하나씩 다시 실행되어 정상 작업은 완료됨
+        _wait_until(lambda: _jobs()["ok.mp4"].status == 'done')
+        # 혼자 실행되어도 풀을 깨뜨린 작업만 시도 횟수가 차감되고 백오프 후 재시도 대기
+        _wait_until(lambda: _jobs()["crash.mp4"].next_attempt_at is not None)
+
+        jobs = _jobs()
+        assert jobs["ok.mp4"].attempts == 1
+        assert jobs["crash.mp4"].status == 'pending'
+        assert jobs["crash.mp4"].attempts == 1
+        assert worker._thread.is_alive()
+        assert worker._generation >= 3
+    finally:
+        worker.stop()
+
+
+class _BrokenPool:
+    def submit(self, *args, **kwargs):
+        raise media_worker_module.BrokenProcessPool("pool is broken")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def test_submit_failure_releases_claimed_jobs(database, db, monkeypatch):
+    monkeypatch.setattr(media_worker_module, "SessionLocal", database["session"])
+    file = File(file_name="ok.mp4", s3_key="poestagram/videos/ok.mp4", content_type="video/mp4", file_size=1)
+    db.add(file)
+    db.flush()
+    job = enqueue_media_job(db, file)
+    db.commit()
+    job_id = job.id
+
+    worker = MediaWorker(processes=1)
+    worker._pool = _BrokenPool()
+    assert worker._claim() == 0
+
+    job = db.get(MediaJob, job_id)
+    db.refresh(job)
+    assert job.status == 'pending'
+    assert job.attempts == 0
+    assert job.next_attempt_at is None
+    # 새 프로세스 풀로 교체됨
+    assert not isinstance(worker._pool, _BrokenPool)
+    worker._pool.shutdown()
@@ -0,0 +1,52 @@
+from app.models import Counter, Feed, User
+from app.services.counters import FEEDS_TOTAL_COUNTER
+
+
+def _create_feeds(db, user, count: int) -> None:
+    db.add_all([Feed(user_id=user.id, description=f"feed {index}") for index in range(count)])
+    db.commit()
+
+
+def test_exact_total_is_not_cached(client, db):
+    """exact 모드는 캐시 무효화 없이 추가된 행도 바로 반영하고, approximate 모드는 카운터 값을 캐시합니다."""
+    user = User(email="a@example.com", username="alice", password="x")
+    db.add(user)
+    db.add(Counter(name=FEEDS_TOTAL_COUNTER, value=100))
+    db.commit()
+    _create_feeds(db, user, 2)
+
+    assert client.get("/api/feeds/?count_mode=exact").json()["total"] == 2
+    assert client.get("/api/feeds/").json()["total"] == 100
+
+    # API를 거치지 않고 추가되어 캐시가 무효화되지 않은 경우
+    _create_feeds(db, user, 3)
+    db.query(Counter).filter(Counter.name == FEEDS_TOTAL_COUNTER).update({Counter.value: 105})
+    db.commit()
+
+    assert client.get("/api/feeds/?count_mode=exact").json()["total"] == 5
+    assert client.get("/api/feeds/").json()["total"] == 100
+
+
+def test_exact_user_feeds_count(client, db):
+    user = User(email="a@example.com", username="alice", password="x", feeds_count=0)
+    db.add(user)
+    db.commit()
+    user_id = user.id
+
+    _create_feeds(db, user, 1)
+    assert client.get(f"/api/users/{user_id}/feeds?count_mode=exact").json()["total"] == 1
+    _create_feeds(db, user, 1)
+    assert client.get(f"/api/users/{user_id}/feeds?count_mode=exact").json()["total"] == 2
+    assert client.get(f"/api/users/{user_id}/feeds").json()["total"] == 0
+
+
+def test_feed_page_limit_is_validated(client, db):
+    user = User(email="a@example.com", username="alice", password="x")
+    db.add(user)
+    db.commit()
+    _create_feeds(db, user, 3)
+
+    assert len(client.get("/api/feeds/?limit=2").json()["feeds"]) == 2
+    for query in ("limit=0", "limit=-1", "limit=101", "offset=-1"):
+        assert client.get(f"/api/feeds/?{query}").status_code == 422
+        assert client.get(f"/api/users/{user.id}/feeds?{query}").status_code == 422
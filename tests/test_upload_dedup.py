@@ -0,0 +1,148 @@
+import threading
+
+from sqlalchemy import event
+
+import app.services.media_objects as media_objects
+import app.services.s3 as s3
+from app.models import File, MediaJob, MediaObject, StorageDeletion, User
+
+from tests.conftest import auth_headers
+
+
+def _upload(client, *files):
+    return client.post(
+        "/api/files/upload",
+        files=[("files", (name, content, "application/octet-stream")) for name, content in files]
+    )
+
+
+def test_upload_skips_transfer_for_known_content(client, db, database, s3_bucket):
+    threads = set()
+
+    def record_thread(conn, cursor, statement, *args):
+        if "media_objects" in statement:
+            threads.add(threading.current_thread().name)
+
+    event.listen(database["engine"], "before_cursor_execute", record_thread)
+    try:
+        response = _upload(client, ("a.txt", b"same"), ("b.txt", b"other"), ("c.txt", b"same"))
+    finally:
+        event.remove(database["engine"], "before_cursor_execute", record_thread)
+    assert response.status_code == 200, response.text
+    # 원본 조회와 참조 수 갱신(행 잠금)은 이벤트 루프가 아닌 스레드 풀에서 실행
+    assert threads and all(name.startswith("AnyIO worker thread") for name in threads)
+    keys = [item["s3_key"] for item in response.json()["uploaded_files"]]
+
+    # 요청 순서는 유지하고, 내용이 같은 파일은 한 번만 올려 같은 원본을 공유
+    assert [item["file_name"] for item in response.json()["uploaded_files"]] == ["a.txt", "b.txt", "c.txt"]
+    assert keys[0] == keys[2] != keys[1]
+    assert sorted((media_object.s3_key, media_object.ref_count) for media_object in db.query(MediaObject)) == sorted(
+        [(keys[0], 2), (keys[1], 1)]
+    )
+    assert db.query(StorageDeletion).count() == 0
+    stored = {item["Key"] for item in s3_bucket.list_objects_v2(Bucket=s3.BUCKET_NAME)["Contents"]}
+    assert stored == {keys[0], keys[1]}
+
+    # 다음 요청에서는 전송 없이 같은 원본을 재사용
+    again = _upload(client, ("d.txt", b"same"))
+    assert again.json()["uploaded_files"][0]["s3_key"] == keys[0]
+    assert db.query(MediaObject).filter(MediaObject.s3_key == keys[0]).one().ref_count == 3
+    assert db.query(StorageDeletion).count() == 0
+    assert s3_bucket.list_objects_v2(Bucket=s3.BUCKET_NAME)["KeyCount"] == 2
+
+
+def test_upload_falls_back_when_known_original_is_released(client, db, s3_bucket, monkeypatch):
+    _upload(client, ("a.txt", b"same"))
+    db.delete(db.query(File).one())
+    media_object = db.query(MediaObject).one()
+    media_object.ref_count = 0
+    db.commit()
+
+    # 읽기 전용 조회 뒤, 참조 수를 늘리기 전에 원본이 해제된 경우
+    old_key = media_object.s3_key
+    monkeypatch.setattr(media_objects, "find_media_object_keys", lambda db, hashes: {h: old_key for h in hashes})
+    response = _upload(client, ("b.txt", b"same"))
+
+    assert response.status_code == 200, response.text
+    new_key = response.json()["uploaded_files"][0]["s3_key"]
+    db.refresh(media_object)
+    assert new_key != old_key
+    assert (media_object.s3_key, media_object.ref_count) == (new_key, 1)
+    stored = {item["Key"] for item in s3_bucket.list_objects_v2(Bucket=s3.BUCKET_NAME)["Contents"]}
+    assert new_key in stored
+
+
+def test_profile_image_reuses_uploaded_original(client, db, s3_bucket):
+    user = User(email="a@example.com", username="alice", password="x")
+    db.add(user)
+    db.commit()
+    feed_upload = _upload(client, ("photo.txt", b"avatar"))
+    feed_key = feed_upload.json()["uploaded_files"][0]["s3_key"]
+
+    response = client.put(
+        "/api/users/profile-image",
+        files={"file": ("avatar.png", b"avatar", "image/png")},
+        headers=auth_headers(user)
+    )
+
+    assert response.status_code == 200, response.text
+    db.refresh(user)
+    assert db.get(File, user.profile_file_id).s3_key == feed_key
+    assert db.query(MediaObject).one().ref_count == 2
+    assert db.query(StorageDeletion).count() == 0
+    assert s3_bucket.list_objects_v2(Bucket=s3.BUCKET_NAME)["KeyCount"] == 1
+
+
+def test_upload_without_content_type_is_saved(client, db, s3_bucket):
+    # 파트에 Content-Type이 없으면 기본 콘텐츠 타입으로 저장 (미디어 처리 대상 아님)
+    body = b'--b\r\nContent-Disposition: form-data; name="files"; filename="raw"\r\n\r\nraw\r\n--b--\r\n'
+    response = client.post(
+        "/api/files/upload",
+        content=body,
+        headers={"Content-Type": "multipart/form-data; boundary=b"}
+    )
+
+    assert response.status_code == 200, response.text
+    file_info = db.query(File).one()
+    assert file_info.content_type == "application/octet-stream"
+    assert db.query(MediaJob).count() == 0
+    assert db.query(MediaObject).one().s3_key == file_info.s3_key
+
+
+def test_profile_image_replacement_releases_old_file_off_event_loop(client, db, database, s3_bucket):
+    user = User(email="a@example.com", username="alice", password="x")
+    db.add(user)
+    db.commit()
+    first = client.put(
+        "/api/users/profile-image",
+        files={"file": ("old.png", b"old avatar", "image/png")},
+        headers=auth_headers(user)
+    )
+    assert first.status_code == 200, first.text
+    db.refresh(user)
+    old_file_id = user.profile_file_id
+    old_key = db.get(File, old_file_id).s3_key
+
+    threads = set()
+
+    def record_thread(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("DELETE FROM FILES") or "storage_deletions" in statement:
+            threads.add(threading.current_thread().name)
+
+    event.listen(database["engine"], "before_cursor_execute", record_thread)
+    try:
+        response = client.put(
+            "/api/users/profile-image",
+            files={"file": ("new.png", b"new avatar", "image/png")},
+            headers=auth_headers(user)
+        )
+    finally:
+        event.remove(database["engine"], "before_cursor_execute", record_thread)
+
+    assert response.status_code == 200, response.text
+    # 기존 파일 정리(원본 참조 해제, 삭제 대기열 등록, 레코드 삭제)도 스레드 풀에서 실행
+    assert threads and all(name.startswith("AnyIO worker thread") for name in threads)
+    db.expire_all()
+    assert db.get(File, old_file_id) is None
+    assert db.query(MediaObject).filter(MediaObject.s3_key == old_key).one().ref_count == 0
+    assert old_key in [entry.s3_key for entry in db.query(StorageDeletion)]